@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai de l'extraction par l'API MediaWiki contre la page HTML
+
+Génère une liste de set sous ses deux formes (wikitext {{Set list}} avec les
+noms français en propriétés sémantiques, et page HTML rendue), les sert avec
+serveur_pages.py puis compare les deux sources : cartes identiques, octets
+transférés et durée, cache vide à chaque répétition. Vérifie aussi le
+fichier d'exemple benchmarks/fixtures/mediawiki_exemple.json :
+    python benchmarks/benchmark_api_mediawiki.py --cartes 300 --latence 0.1
+"""
+
+import io
+import sys
+import json
+import random
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "convertisseur"))
+
+import Convertisseur
+from benchmark_base import MOTS_NOMS, RARETES_PONDEREES, chronometrer
+from benchmark_parseur import ENTETES, CATEGORIES, lien
+from serveur_pages import ServeurPages
+
+sys.path.insert(0, str(project_root / "shared"))
+from config import RARETES_CONFIG
+
+FIXTURE_EXEMPLE = Path(__file__).parent / "fixtures" / "mediawiki_exemple.json"
+TITRE_LISTE = "Set Card Lists:Banc d'essai (TCG-FR)"
+
+def generer_liste(nb_cartes: int, graine: int, code: str = "BNCH") -> tuple:
+    """
+    Une même liste de set sous forme de wikitext et de page HTML
+    
+    Returns:
+        tuple: (wikitext, {page: {"French name": [nom]}}, html)
+    """
+    rng = random.Random(graine)
+    noms_raretes = [nom for nom, _ in RARETES_PONDEREES]
+    poids_raretes = [poids for _, poids in RARETES_PONDEREES]
+    
+    lignes_wiki = ["{{Set list|region=FR|rarities=C|print=|qty=|columns="]
+    lignes_html = ["<tr>\n" + "".join(f"<th>{entete}</th>\n" for entete in ENTETES) + "</tr>"]
+    proprietes = {}
+    for numero in range(1, nb_cartes + 1):
+        numero_carte = f"{code}-FR{numero:03d}"
+        nom_anglais = " ".join(rng.sample(MOTS_NOMS, rng.randint(2, 4))) + f" {numero}"
+        nom_francais = " ".join(rng.sample(MOTS_NOMS, rng.randint(2, 4))) + rng.choice(["", " l'Ancien"])
+        raretes = list(dict.fromkeys(rng.choices(noms_raretes, weights=poids_raretes, k=rng.randint(1, 4))))
+        
+        proprietes[nom_anglais] = {Convertisseur.PROPRIETE_NOM_FRANCAIS: [nom_francais]}
+        abreviations = ", ".join(RARETES_CONFIG[rarete]['abbrev'] for rarete in raretes)
+        lignes_wiki.append(f"{numero_carte}; {nom_anglais}; {abreviations}")
+        lignes_html.append(
+            "<tr>\n"
+            f"<td>{lien(numero_carte)}</td>\n"
+            f'<td>"{lien(nom_anglais)}"</td>\n'
+            f'<td><span lang="fr">"{nom_francais}"</span></td>\n'
+            f"<td>{'<br />'.join(lien(rarete) for rarete in raretes)}</td>\n"
+            f"<td>{lien(rng.choice(CATEGORIES))}</td>\n"
+            "</tr>"
+        )
+    lignes_wiki.append("}}")
+    
+    html = ("<html><body><div id=\"mw-content-text\"><table class=\"wikitable sortable card-list\"><tbody>"
+            + "\n".join(lignes_html) + "</tbody></table></div></body></html>")
+    return "\n".join(lignes_wiki), proprietes, html
+
+def extraire(url: str, api: bool, dossier_cache: Path) -> list:
+    """Extraction à cache vide (disque et noms français), par l'API ou par la page HTML"""
+    Convertisseur._noms_francais.clear()
+    Convertisseur.configurer_cache_pages(tempfile.mkdtemp(dir=dossier_cache))
+    with redirect_stdout(io.StringIO()):
+        if api:
+            return Convertisseur.extraire_cartes_api(url)
+        return Convertisseur.analyser_cartes(Convertisseur.recuperer_contenu_web(url) or "")
+
+def verifier_exemple() -> dict:
+    """Extraction du fichier d'exemple : cartes lues et noms français trouvés"""
+    with tempfile.TemporaryDirectory(prefix="banc_api_") as dossier, \
+            ServeurPages.depuis_fixtures(FIXTURE_EXEMPLE) as serveur:
+        titre = next(iter(serveur.wikitextes))
+        cartes = extraire(serveur.url("/wiki/" + titre.replace(" ", "_")), True, Path(dossier))
+        return {
+            "cartes": len(cartes),
+            "noms_francais": sum(1 for carte in cartes if carte.nom not in serveur.wikitextes[titre]),
+            "exemplaires": sum(len(carte.raretes) for carte in cartes)
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'extraction par l'API MediaWiki")
+    parser.add_argument("--cartes", type=int, default=300)
+    parser.add_argument("--graine", type=int, default=42)
+    parser.add_argument("--latence", type=float, default=0.1, help="Latence du serveur (secondes)")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--sortie", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+    
+    # Pas de navigateur, pas d'attente de politesse : seules les sources sont comparées
+    Convertisseur.SELENIUM_AVAILABLE = False
+    Convertisseur.configurer_limites_sites(debit=1000.0, rafale=1000)
+    
+    exemple = verifier_exemple()
+    print(f"🧩 Exemple : {exemple['cartes']} cartes, {exemple['noms_francais']} noms français, "
+          f"{exemple['exemplaires']} exemplaires")
+    
+    wikitext, proprietes, html = generer_liste(args.cartes, args.graine)
+    chemin_page = "/wiki/" + TITRE_LISTE.replace(" ", "_")
+    rapport = {"meta": {"nb_cartes": args.cartes, "latence_s": args.latence,
+                        "repetitions": args.repetitions},
+               "exemple": exemple, "resultats": {}}
+    
+    with tempfile.TemporaryDirectory(prefix="banc_api_") as dossier, \
+            ServeurPages({chemin_page: html}, latence=args.latence,
+                         wikitextes={TITRE_LISTE: wikitext}, proprietes=proprietes) as serveur:
+        dossier = Path(dossier)
+        url = serveur.url(chemin_page)
+        cartes = {}
+        for mode, api in (("page_html", False), ("api_mediawiki", True)):
+            serveur.octets.clear()
+            cartes[mode] = extraire(url, api, dossier)
+            requetes = len(serveur.octets)
+            octets = sum(serveur.octets.values())
+            with redirect_stdout(io.StringIO()):
+                mesure = chronometrer(lambda: extraire(url, api, dossier), args.repetitions)
+            rapport["resultats"][mode] = dict(mesure, requetes=requetes, octets=octets,
+                                              cartes=len(cartes[mode]))
+            print(f"⏱️ {mode:13s} : {mesure['mediane_ms']:.1f} ms (médiane), "
+                  f"{requetes} requêtes, {octets / 1024:.1f} Kio, {len(cartes[mode])} cartes")
+    
+    rapport["meta"]["extractions_identiques"] = cartes["page_html"] == cartes["api_mediawiki"]
+    if not rapport["meta"]["extractions_identiques"]:
+        differences = sum(1 for a, b in zip(cartes["page_html"], cartes["api_mediawiki"]) if a != b)
+        print(f"⚠️ Extractions différentes : {differences} cartes divergentes")
+    
+    resultats = rapport["resultats"]
+    print(f"📊 API : x{resultats['page_html']['mediane_ms'] / resultats['api_mediawiki']['mediane_ms']:.1f} "
+          f"en durée, x{resultats['page_html']['octets'] / resultats['api_mediawiki']['octets']:.1f} en octets")
+    
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(rapport, ensure_ascii=False, indent=2))
+        print(f"💾 Résultats écrits : {args.sortie}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai de la couche base de données sur un catalogue synthétique complet
+
+Génère un catalogue réaliste (~900 séries, ~13k cartes, ~40k exemplaires
+carte/rareté) au format CSV du convertisseur, puis chronomètre :
+    - CSVImporter.importer_dossier
+    - DatabaseManager.get_stats_collection
+    - DatabaseManager.get_cartes_manquantes
+    - la requête de filtrage de la vue d'une série (construire_requete_cartes_serie)
+
+Les résultats sont écrits en JSON pour comparer les commits entre eux :
+    python benchmarks/benchmark_base.py --sortie resultats.json
+    python benchmarks/benchmark_base.py --comparer resultats.json
+"""
+
+import os
+import io
+import sys
+import csv
+import json
+import time
+import random
+import sqlite3
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Tuple, Callable
+
+# Ajouter le dossier database au path pour les imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "database"))
+
+from db_manager import DatabaseManager
+from csv_importer import CSVImporter
+import instrumentation
+
+# Paramètres du catalogue par défaut
+CATALOGUE_DEFAUT = {
+    "nb_series": 900,
+    "nb_cartes": 13000,
+    "nb_exemplaires": 40000,
+    "graine": 42
+}
+
+# Raretés et poids d'apparition (les raretés communes dominent)
+RARETES_PONDEREES = [
+    ("Common", 40),
+    ("Rare", 18),
+    ("Super Rare", 14),
+    ("Ultra Rare", 12),
+    ("Secret Rare", 8),
+    ("Ultimate Rare", 3),
+    ("Ghost Rare", 1),
+    ("Starlight Rare", 1),
+    ("Collector's Rare", 1),
+    ("Platinum Secret Rare", 1),
+    ("Quarter Century Secret Rare", 1)
+]
+
+MOTS_NOMS = [
+    "Dragon", "Magicien", "Blanc", "Noir", "Chevalier", "Sombre", "Yeux", "Bleus",
+    "Guerrier", "Ombre", "Lumière", "Cyber", "Élémentaire", "Héros", "Destin",
+    "Chaos", "Soldat", "Chat", "Sauveteur", "Pot", "Cupidité", "Trappe", "Miroir",
+    "Force", "Gardien", "Céleste", "Abysse", "Flamme", "Tonnerre", "Cristal"
+]
+
+def repartir(total: int, nb: int, rng: random.Random, minimum: int = 1,
+             maximum: int = None) -> List[int]:
+    """Répartit `total` en `nb` parts entre `minimum` et `maximum`, de tailles inégales"""
+    poids = [rng.paretovariate(1.5) for _ in range(nb)]
+    somme = sum(poids)
+    reste = total - minimum * nb
+    parts = [minimum + int(reste * p / somme) for p in poids]
+    
+    # Écrêter les parts trop grandes
+    surplus = 0
+    if maximum is not None:
+        for i, part in enumerate(parts):
+            if part > maximum:
+                surplus += part - maximum
+                parts[i] = maximum
+    
+    # Distribuer l'arrondi et le surplus sur les parts qui ont encore de la place
+    manque = total - sum(parts)
+    while manque > 0:
+        i = rng.randrange(nb)
+        if maximum is None or parts[i] < maximum:
+            parts[i] += 1
+            manque -= 1
+    return parts
+
+def generer_catalogue(dossier: Path, nb_series: int, nb_cartes: int,
+                      nb_exemplaires: int, graine: int) -> Dict:
+    """
+    Écrit un fichier CSV par série au format Code_Serie,Nom_Carte,Rareté,Numéro_Carte
+    
+    Returns:
+        Dict: Nombre de séries, cartes et exemplaires réellement générés
+    """
+    rng = random.Random(graine)
+    dossier.mkdir(parents=True, exist_ok=True)
+    
+    # Codes de série uniques de 4 caractères (ex. BLMM, RA02)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    codes = set()
+    while len(codes) < nb_series:
+        codes.add("".join(rng.choice(alphabet) for _ in range(2)) +
+                  "".join(rng.choice(alphabet + "0123456789") for _ in range(2)))
+    codes = sorted(codes)
+    
+    tailles = repartir(nb_cartes, nb_series, rng)
+    # Exemplaires supplémentaires au-delà d'une rareté par carte
+    supplements = repartir(nb_exemplaires - nb_cartes, nb_cartes, rng, minimum=0,
+                           maximum=len(RARETES_PONDEREES) - 1)
+    
+    noms_raretes = [nom for nom, _ in RARETES_PONDEREES]
+    poids_raretes = [poids for _, poids in RARETES_PONDEREES]
+    
+    total_cartes = 0
+    total_exemplaires = 0
+    
+    for code, taille in zip(codes, tailles):
+        with open(dossier / f"{code}.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Code_Serie', 'Nom_Carte', 'Rareté', 'Numéro_Carte'])
+            
+            for numero in range(1, taille + 1):
+                nom = " ".join(rng.sample(MOTS_NOMS, rng.randint(2, 4)))
+                nb_raretes = 1 + supplements[total_cartes]
+                
+                raretes = set()
+                while len(raretes) < nb_raretes:
+                    raretes.add(rng.choices(noms_raretes, weights=poids_raretes)[0])
+                
+                for rarete in sorted(raretes, key=noms_raretes.index):
+                    writer.writerow([code, nom, rarete, f"{code}-FR{numero:03d}"])
+                    total_exemplaires += 1
+                
+                total_cartes += 1
+    
+    return {
+        "nb_series": len(codes),
+        "nb_cartes": total_cartes,
+        "nb_exemplaires": total_exemplaires
+    }
+
+def chronometrer(fonction: Callable, repetitions: int) -> Dict:
+    """Exécute `fonction` plusieurs fois et retourne les durées en millisecondes"""
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append((time.perf_counter() - debut) * 1000)
+    
+    return {
+        "repetitions": repetitions,
+        "min_ms": round(min(durees), 3),
+        "mediane_ms": round(statistics.median(durees), 3),
+        "moyenne_ms": round(statistics.fmean(durees), 3),
+        "max_ms": round(max(durees), 3)
+    }
+
+def version_git() -> str:
+    """Commit courant du dépôt (vide si indisponible)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def requetes_cartes_serie(db: DatabaseManager, codes: List[str]) -> List[Tuple[str, List]]:
+    """Combinaisons de filtres représentatives de la vue d'une série"""
+    requetes = []
+    for code in codes:
+        requetes.append(db.construire_requete_cartes_serie(code))
+        requetes.append(db.construire_requete_cartes_serie(code, filtre="missing"))
+        requetes.append(db.construire_requete_cartes_serie(code, filtre="owned", rarete="Secret Rare"))
+        requetes.append(db.construire_requete_cartes_serie(code, recherche="dragon"))
+        requetes.append(db.construire_requete_cartes_serie(code, recherche="01"))
+    return requetes
+
+def executer_banc(dossier_travail: Path, catalogue: Dict, repetitions: int,
+                  verbeux: bool = False, parallele: bool = False, staging: bool = False) -> Dict:
+    """Génère le catalogue, l'importe et chronomètre les opérations de lecture"""
+    dossier_csv = dossier_travail / "csv"
+    db_path = dossier_travail / "collection_banc.db"
+    sortie = sys.stdout if verbeux else io.StringIO()
+    resultats = {}
+    
+    # Toujours partir d'une base vide
+    for suffixe in ("", "-wal", "-shm"):
+        if os.path.exists(f"{db_path}{suffixe}"):
+            os.remove(f"{db_path}{suffixe}")
+    
+    print("🏗️ Génération du catalogue synthétique...")
+    debut = time.perf_counter()
+    genere = generer_catalogue(dossier_csv, **catalogue)
+    print(f"✅ {genere['nb_series']} séries, {genere['nb_cartes']} cartes, "
+          f"{genere['nb_exemplaires']} exemplaires en {time.perf_counter() - debut:.1f} s")
+    
+    with redirect_stdout(sortie):
+        db = DatabaseManager(str(db_path))
+        importer = CSVImporter(db)
+    
+    try:
+        print("📥 Import du dossier...")
+        with redirect_stdout(sortie):
+            import_mesure = chronometrer(lambda: importer.importer_dossier(
+                str(dossier_csv), parallele=parallele, staging=staging), 1)
+        resultats["importer_dossier"] = import_mesure
+        
+        with db.connexion() as conn:
+            nb_liens = conn.execute("SELECT COUNT(*) FROM carte_raretes").fetchone()[0]
+            codes = [row[0] for row in conn.execute("SELECT code_serie FROM series ORDER BY code_serie")]
+            
+            # Une partie de la collection est possédée, comme dans une vraie base
+            conn.execute("UPDATE carte_raretes SET possedee = 1 WHERE id % 3 = 0")
+        
+        if nb_liens != genere['nb_exemplaires']:
+            print(f"⚠️ {nb_liens} exemplaires importés pour {genere['nb_exemplaires']} générés")
+        
+        print("⏱️ Mesure des requêtes...")
+        rng = random.Random(catalogue['graine'])
+        echantillon = rng.sample(codes, min(20, len(codes)))
+        
+        resultats["get_stats_collection"] = chronometrer(db.get_stats_collection, repetitions)
+        resultats["get_cartes_manquantes"] = chronometrer(db.get_cartes_manquantes, repetitions)
+        resultats["get_cartes_manquantes_serie"] = chronometrer(
+            lambda: [db.get_cartes_manquantes(code) for code in echantillon], repetitions
+        )
+        
+        requetes = requetes_cartes_serie(db, echantillon)
+        
+        def filtrer_series():
+            with db.connexion() as conn:
+                for requete, parametres in requetes:
+                    conn.execute(requete, parametres).fetchall()
+        
+        resultats["requete_cartes_serie"] = chronometrer(filtrer_series, repetitions)
+        resultats["requete_cartes_serie"]["requetes_par_repetition"] = len(requetes)
+    finally:
+        with redirect_stdout(sortie):
+            db.fermer()
+    
+    return {
+        "meta": {
+            "date": datetime.now().isoformat(timespec='seconds'),
+            "commit": version_git(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "plateforme": platform.platform(),
+            "catalogue": dict(catalogue, **genere),
+            "import_parallele": parallele,
+            "import_staging": staging,
+            "exemplaires_importes": nb_liens
+        },
+        "resultats": resultats
+    }
+
+def comparer(reference: Dict, actuel: Dict):
+    """Affiche le rapport des médianes entre deux exécutions"""
+    print(f"\n📊 Comparaison {reference['meta'].get('commit') or 'référence'} → "
+          f"{actuel['meta'].get('commit') or 'actuel'} (médianes) :")
+    for nom, mesure in actuel["resultats"].items():
+        ancienne = reference["resultats"].get(nom)
+        if not ancienne:
+            print(f"  🆕 {nom:30s} {mesure['mediane_ms']:10.1f} ms")
+            continue
+        ratio = mesure['mediane_ms'] / ancienne['mediane_ms'] if ancienne['mediane_ms'] else float('inf')
+        symbole = "🔺" if ratio > 1.10 else "🔻" if ratio < 0.90 else "➖"
+        print(f"  {symbole} {nom:30s} {ancienne['mediane_ms']:10.1f} ms → "
+              f"{mesure['mediane_ms']:10.1f} ms (x{ratio:.2f})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de la base de collection")
+    parser.add_argument("--series", type=int, default=CATALOGUE_DEFAUT["nb_series"])
+    parser.add_argument("--cartes", type=int, default=CATALOGUE_DEFAUT["nb_cartes"])
+    parser.add_argument("--exemplaires", type=int, default=CATALOGUE_DEFAUT["nb_exemplaires"])
+    parser.add_argument("--graine", type=int, default=CATALOGUE_DEFAUT["graine"])
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--sortie", help="Fichier JSON des résultats")
+    parser.add_argument("--comparer", help="Fichier JSON d'une exécution de référence")
+    parser.add_argument("--dossier", help="Dossier de travail conservé (temporaire par défaut)")
+    parser.add_argument("--instrumentation", action="store_true",
+                        help="Activer l'instrumentation SQL pendant les mesures")
+    parser.add_argument("--parallele", action="store_true", help="Importer le dossier en mode parallèle")
+    parser.add_argument("--staging", action="store_true", help="Importer le dossier par table de transit")
+    parser.add_argument("--verbeux", action="store_true", help="Afficher la sortie de l'import")
+    args = parser.parse_args()
+    
+    if not args.series <= args.cartes <= args.exemplaires <= args.cartes * len(RARETES_PONDEREES):
+        parser.error("il faut au moins une carte par série et entre 1 et "
+                     f"{len(RARETES_PONDEREES)} exemplaires par carte")
+    
+    # L'instrumentation fausserait les mesures
+    instrumentation.configurer(actif=args.instrumentation)
+    
+    catalogue = {
+        "nb_series": args.series,
+        "nb_cartes": args.cartes,
+        "nb_exemplaires": args.exemplaires,
+        "graine": args.graine
+    }
+    
+    if args.dossier:
+        dossier = Path(args.dossier)
+        dossier.mkdir(parents=True, exist_ok=True)
+        rapport = executer_banc(dossier, catalogue, args.repetitions, args.verbeux, args.parallele,
+                                args.staging)
+    else:
+        with tempfile.TemporaryDirectory(prefix="banc_collection_") as dossier:
+            rapport = executer_banc(Path(dossier), catalogue, args.repetitions, args.verbeux,
+                                    args.parallele, args.staging)
+    
+    texte = json.dumps(rapport, ensure_ascii=False, indent=2)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            f.write(texte)
+        print(f"💾 Résultats écrits : {args.sortie}")
+    else:
+        print(texte)
+    
+    if args.comparer:
+        with open(args.comparer, 'r', encoding='utf-8') as f:
+            comparer(json.load(f), rapport)
+
+if __name__ == "__main__":
+    main()
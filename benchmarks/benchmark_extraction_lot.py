@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai de l'extraction en lot contre un serveur local (serveur_pages.py)
+
+Génère des pages de listes de sets, les sert avec de la latence et quelques
+pannes temporaires, puis chronomètre extraire_series_en_lot en séquentiel et
+en parallèle. Vérifie au passage les CSV écrits, les réessais, le respect du
+débit par site, la revalidation 304 et l'ouverture du disjoncteur sur un
+site en panne permanente :
+    python benchmarks/benchmark_extraction_lot.py --series 20 --latence 0.3
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "convertisseur"))
+
+import Convertisseur
+from benchmark_parseur import generer_section
+from serveur_pages import ServeurPages
+
+def generer_pages(nb_series: int, nb_cartes: int) -> dict:
+    """{chemin: html} de pages complètes au format Yugipedia"""
+    pages = {}
+    for i in range(nb_series):
+        code = f"S{i:03d}"
+        section = generer_section(nb_cartes, graine=i, code=code)
+        pages[f"/wiki/Set_Card_Lists:Serie_{code}_(TCG-FR)"] = (
+            "<html><body><div id=\"mw-content-text\">"
+            "<table class=\"wikitable sortable card-list\">" + section + "</table>"
+            "</div></body></html>"
+        )
+    return pages
+
+def extraire(serveur: ServeurPages, nb_paralleles: int, dossier: Path) -> tuple:
+    """Extrait toutes les pages du serveur ; retourne (durée, résultats)"""
+    series = {chemin.split("Serie_")[1][:4]: serveur.url(chemin) for chemin in serveur.pages}
+    debut = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        resultats = Convertisseur.extraire_series_en_lot(series, nb_paralleles, str(dossier))
+    return time.perf_counter() - debut, resultats
+
+def debit_observe(serveur: ServeurPages) -> float:
+    """Requêtes par seconde reçues par le serveur (sur toute la durée)"""
+    instants = sorted(instant for requetes in serveur.requetes.values() for instant, _ in requetes)
+    if len(instants) < 2:
+        return 0.0
+    return (len(instants) - 1) / (instants[-1] - instants[0])
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'extraction en lot")
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--cartes", type=int, default=100)
+    parser.add_argument("--latence", type=float, default=0.3, help="Latence du serveur (secondes)")
+    parser.add_argument("--debit", type=float, default=10.0, help="Requêtes par seconde et par site")
+    parser.add_argument("--paralleles", type=int, default=Convertisseur.NB_EXTRACTIONS_PARALLELES)
+    parser.add_argument("--sortie", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+    
+    # Pas de navigateur : le banc mesure la couche HTTP
+    Convertisseur.SELENIUM_AVAILABLE = False
+    Convertisseur.DELAI_BASE_REESSAI = 0.05
+    pages = generer_pages(args.series, args.cartes)
+    rapport = {"meta": {"series": args.series, "cartes": args.cartes, "latence_s": args.latence,
+                        "debit_par_site": args.debit, "paralleles": args.paralleles}}
+    
+    with tempfile.TemporaryDirectory(prefix="banc_lot_") as dossier:
+        dossier = Path(dossier)
+        for mode, nb_paralleles in (("sequentiel", 1), ("parallele", args.paralleles)):
+            Convertisseur.configurer_cache_pages(dossier / f"cache_{mode}")
+            Convertisseur.configurer_limites_sites(debit=args.debit, rafale=nb_paralleles)
+            # Une panne temporaire sur la première page : réessayée sans échec final
+            premiere = sorted(pages)[0]
+            with ServeurPages(pages, latence=args.latence, pannes={premiere: 2}) as serveur:
+                duree, resultats = extraire(serveur, nb_paralleles, dossier / mode)
+                echecs = {nom: r["erreur"] for nom, r in resultats.items() if r["erreur"]}
+                fichiers = len(list((dossier / mode).glob("*.csv")))
+                rapport[mode] = {
+                    "duree_s": round(duree, 3),
+                    "series_extraites": len(resultats) - len(echecs),
+                    "fichiers_csv": fichiers,
+                    "echecs": echecs,
+                    "requetes": sum(len(r) for r in serveur.requetes.values()),
+                    "debit_observe": round(debit_observe(serveur), 2)
+                }
+                print(f"⏱️ {mode:11s} ({nb_paralleles} en parallèle) : {duree:.2f} s, "
+                      f"{fichiers} CSV, {len(echecs)} échecs, {rapport[mode]['requetes']} requêtes")
+                
+                # Deuxième passage : tout revalidé par 304
+                duree, _ = extraire(serveur, nb_paralleles, dossier / f"{mode}_bis")
+                statuts = [statut for r in serveur.requetes.values() for _, statut in r[-1:]]
+                rapport[mode]["revalidation_s"] = round(duree, 3)
+                rapport[mode]["reponses_304"] = statuts.count(304)
+                print(f"   ♻️ revalidation : {duree:.2f} s, {statuts.count(304)}/{len(statuts)} réponses 304")
+        
+        # Site en panne permanente : le disjoncteur coupe après SEUIL_DISJONCTEUR échecs
+        Convertisseur.configurer_cache_pages(dossier / "cache_panne")
+        Convertisseur.configurer_limites_sites(debit=args.debit, rafale=1, seuil=3, duree=60)
+        with ServeurPages(pages, pannes={"*": -1}) as serveur:
+            _, resultats = extraire(serveur, 1, dossier / "panne")
+            rapport["panne"] = {
+                "requetes": sum(len(r) for r in serveur.requetes.values()),
+                "series_tentees": len(resultats),
+                "series_extraites": sum(1 for r in resultats.values() if not r["erreur"])
+            }
+            print(f"🔌 site en panne : {rapport['panne']['requetes']} requêtes pour "
+                  f"{len(resultats)} séries (disjoncteur ouvert après 3 échecs)")
+    
+    gain = rapport["sequentiel"]["duree_s"] / rapport["parallele"]["duree_s"]
+    print(f"📊 parallèle : x{gain:.1f} par rapport au séquentiel")
+    
+    texte = json.dumps(rapport, ensure_ascii=False, indent=2)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            f.write(texte)
+        print(f"💾 Résultats écrits : {args.sortie}")
+
+if __name__ == "__main__":
+    main()
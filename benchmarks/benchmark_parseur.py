@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai de l'analyse d'une liste de set : expressions régulières contre lxml
+
+Génère une section de cartes au format des pages Yugipedia (Set Card Lists,
+une ligne d'en-tête puis une ligne par carte), vérifie que les deux analyses
+extraient les mêmes cartes, puis les chronomètre sur ce même HTML :
+    python benchmarks/benchmark_parseur.py --cartes 300 --repetitions 20
+"""
+
+import io
+import sys
+import json
+import random
+import argparse
+import platform
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le dossier du convertisseur au path pour les imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "convertisseur"))
+
+import Convertisseur
+from benchmark_base import MOTS_NOMS, RARETES_PONDEREES, chronometrer, version_git
+
+ENTETES = ("Card number", "English name", "French name", "Rarity", "Category")
+CATEGORIES = ("Effect Monster", "Normal Spell Card", "Counter Trap Card", "Link Monster")
+
+def lien(titre: str, texte: str = None) -> str:
+    return f'<a href="/wiki/{titre.replace(" ", "_")}" title="{titre}">{texte or titre}</a>'
+
+def generer_section(nb_cartes: int, graine: int, code: str = "BLMM") -> str:
+    """
+    Section <tbody> d'une liste de set telle que la renvoient les récupérateurs
+    
+    Returns:
+        str: HTML de la section (en-tête dans le tbody, comme le rendu MediaWiki)
+    """
+    rng = random.Random(graine)
+    noms_raretes = [nom for nom, _ in RARETES_PONDEREES]
+    poids_raretes = [poids for _, poids in RARETES_PONDEREES]
+    
+    lignes = ["<tr>\n" + "".join(f"<th>{entete}</th>\n" for entete in ENTETES) + "</tr>"]
+    for numero in range(1, nb_cartes + 1):
+        numero_carte = f"{code}-FR{numero:03d}"
+        nom_anglais = " ".join(rng.sample(MOTS_NOMS, rng.randint(2, 4)))
+        nom_francais = " ".join(rng.sample(MOTS_NOMS, rng.randint(2, 4))) + rng.choice(["", " &amp; Cie", " l'Ancien"])
+        
+        # Les cartes souvent rééditées ont jusqu'à une dizaine de raretés
+        nb_raretes = 10 if numero % 25 == 0 else rng.randint(1, 4)
+        raretes = []
+        while len(raretes) < nb_raretes:
+            rarete = rng.choices(noms_raretes, weights=poids_raretes)[0]
+            if rarete not in raretes:
+                raretes.append(rarete)
+        
+        lignes.append(
+            "<tr>\n"
+            f"<td>{lien(numero_carte)}</td>\n"
+            f'<td>"{lien(nom_anglais)}"</td>\n'
+            f'<td><span lang="fr">"{nom_francais}"</span></td>\n'
+            f"<td>{'<br />'.join(lien(rarete) for rarete in raretes)}</td>\n"
+            f"<td>{lien(rng.choice(CATEGORIES))}</td>\n"
+            "</tr>"
+        )
+    
+    return "<tbody>" + "\n".join(lignes) + "</tbody>"
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'analyse des listes de set")
+    parser.add_argument("--cartes", type=int, default=300)
+    parser.add_argument("--graine", type=int, default=42)
+    parser.add_argument("--repetitions", type=int, default=20)
+    parser.add_argument("--sortie", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+    
+    if not Convertisseur.LXML_AVAILABLE:
+        parser.error("lxml n'est pas installé (pip install lxml)")
+    
+    section = generer_section(args.cartes, args.graine)
+    print(f"🏗️ Section générée : {args.cartes} cartes, {len(section)} caractères")
+    
+    cartes_regex = Convertisseur.extraire_cartes_regex(section)
+    cartes_lxml = Convertisseur.extraire_cartes_lxml(section)
+    if cartes_regex != cartes_lxml:
+        differences = sum(1 for a, b in zip(cartes_regex, cartes_lxml) if a != b)
+        print(f"⚠️ Extractions différentes : {len(cartes_regex)} cartes (regex), "
+              f"{len(cartes_lxml)} cartes (lxml), {differences} cartes divergentes")
+    
+    resultats = {}
+    with redirect_stdout(io.StringIO()):
+        resultats["extraire_cartes_regex"] = chronometrer(
+            lambda: Convertisseur.extraire_cartes_regex(section), args.repetitions)
+        resultats["extraire_cartes_lxml"] = chronometrer(
+            lambda: Convertisseur.extraire_cartes_lxml(section), args.repetitions)
+    
+    rapport = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec='seconds'),
+            "commit": version_git(),
+            "python": platform.python_version(),
+            "lxml": ".".join(str(v) for v in Convertisseur.etree.LXML_VERSION),
+            "plateforme": platform.platform(),
+            "nb_cartes": args.cartes,
+            "taille_section": len(section),
+            "extractions_identiques": cartes_regex == cartes_lxml,
+            "exemplaires": sum(len(carte.raretes) for carte in cartes_lxml)
+        },
+        "resultats": resultats
+    }
+    
+    texte = json.dumps(rapport, ensure_ascii=False, indent=2)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            f.write(texte)
+        print(f"💾 Résultats écrits : {args.sortie}")
+    else:
+        print(texte)
+    
+    acceleration = resultats["extraire_cartes_regex"]["mediane_ms"] / resultats["extraire_cartes_lxml"]["mediane_ms"]
+    print(f"📊 lxml : x{acceleration:.1f} par rapport aux expressions régulières (médianes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur HTTP local qui rejoue des pages de listes de sets sauvegardées
+
+Remplace Yugipedia pour tester le convertisseur hors ligne : les pages
+viennent d'un dictionnaire {chemin: html}, d'un dossier de fichiers .html
+ou du cache disque du convertisseur. Le serveur gère ETag / If-None-Match
+et peut simuler de la latence et des pannes (503 avec Retry-After).
+
+Il imite aussi l'API MediaWiki (/api.php) : action=parse (wikitext des pages
+de listes) et action=ask (propriétés sémantiques des cartes), à partir d'un
+fichier de données comme benchmarks/fixtures/mediawiki_exemple.json.
+
+    python benchmarks/serveur_pages.py --cache convertisseur/cache_pages --port 8765
+    python benchmarks/serveur_pages.py --fixtures benchmarks/fixtures/mediawiki_exemple.json
+"""
+
+import sys
+import time
+import json
+import hashlib
+import argparse
+import threading
+from collections import defaultdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, unquote, parse_qs
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "shared"))
+
+from cache_pages import CachePages
+
+class ServeurPages:
+    """Serveur de pages sauvegardées, lancé dans un thread (utilisable avec `with`)"""
+    
+    def __init__(self, pages: Dict[str, str], port: int = 0, latence: float = 0.0,
+                 pannes: Dict[str, int] = None, retry_after: Optional[int] = None,
+                 wikitextes: Dict[str, str] = None, proprietes: Dict[str, Dict[str, List]] = None):
+        """
+        Args:
+            pages (Dict[str, str]): {chemin de l'URL: html} (ex. "/wiki/Set_Card_Lists:...")
+            port (int): Port d'écoute (0 : port libre choisi par le système)
+            latence (float): Délai ajouté à chaque réponse (secondes)
+            pannes (Dict[str, int], optional): {chemin: nombre de 503 avant de répondre} ;
+                le chemin "*" s'applique à toutes les pages, -1 pour une panne permanente
+            retry_after (int, optional): Valeur de l'en-tête Retry-After des 503
+            wikitextes (Dict[str, str], optional): {titre: wikitext} servis par action=parse
+            proprietes (Dict[str, Dict[str, List]], optional): {page: {propriété: valeurs}}
+                servies par action=ask
+        """
+        self.pages = dict(pages)
+        self.wikitextes = dict(wikitextes or {})
+        self.proprietes = dict(proprietes or {})
+        self.latence = latence
+        self.pannes = dict(pannes or {})
+        self._pannes_restantes = {}
+        self.retry_after = retry_after
+        self.requetes = defaultdict(list)  # {chemin: [(instant, statut)]}
+        self.octets = defaultdict(int)  # {chemin: octets envoyés (corps)}
+        self._verrou = threading.Lock()
+        self._serveur = ThreadingHTTPServer(("127.0.0.1", port), self._gestionnaire())
+        self._serveur.daemon_threads = True
+        self._thread = None
+    
+    @classmethod
+    def depuis_dossier(cls, dossier: Path, prefixe: str = "/wiki/", **options) -> "ServeurPages":
+        """Pages d'un dossier : NOM.html est servi sous {prefixe}NOM"""
+        pages = {prefixe + chemin.stem: chemin.read_text(encoding='utf-8')
+                 for chemin in Path(dossier).glob("*.html")}
+        return cls(pages, **options)
+    
+    @classmethod
+    def depuis_cache(cls, dossier: Path, **options) -> "ServeurPages":
+        """Pages du cache disque du convertisseur, servies sous le chemin de leur URL d'origine"""
+        cache = CachePages(dossier)
+        pages = {}
+        for url in cache.urls():
+            morceaux = urlsplit(url)
+            pages[unquote(morceaux.path) + (f"?{unquote(morceaux.query)}" if morceaux.query else "")] = cache.lire(url)
+        return cls(pages, **options)
+    
+    @classmethod
+    def depuis_fixtures(cls, fichier: Path, **options) -> "ServeurPages":
+        """
+        Données d'un fichier JSON : {"pages": {titre: wikitext},
+        "proprietes": {page: {propriété: valeurs}}, "html": {chemin: html}}
+        """
+        with open(fichier, 'r', encoding='utf-8') as f:
+            donnees = json.load(f)
+        return cls(donnees.get('html', {}), wikitextes=donnees.get('pages', {}),
+                   proprietes=donnees.get('proprietes', {}), **options)
+    
+    @property
+    def base_url(self) -> str:
+        hote, port = self._serveur.server_address[:2]
+        return f"http://{hote}:{port}"
+    
+    def url(self, chemin: str) -> str:
+        return self.base_url + chemin
+    
+    def _reponse_api(self, parametres: Dict[str, List[str]]) -> dict:
+        """Réponse JSON de l'API MediaWiki (action=parse ou action=ask)"""
+        action = parametres.get('action', [''])[0]
+        
+        if action == 'parse':
+            titre = parametres.get('page', [''])[0].replace('_', ' ')
+            if titre not in self.wikitextes:
+                return {"error": {"code": "missingtitle", "info": "The page you specified doesn't exist."}}
+            wikitext = self.wikitextes[titre]
+            if parametres.get('formatversion', ['1'])[0] != '2':
+                wikitext = {"*": wikitext}
+            return {"parse": {"title": titre, "pageid": sorted(self.wikitextes).index(titre) + 1,
+                              "wikitext": wikitext}}
+        
+        if action == 'ask':
+            # "[[:Page A||Page B]]|?Propriété|limit=50" : sélection par titres seulement
+            requete = parametres.get('query', [''])[0]
+            conditions, _, reste = requete.partition(']]')
+            titres = [titre.strip().lstrip(':') for titre in conditions.lstrip('[').split('||')]
+            demandees = [morceau[1:].strip() for morceau in reste.split('|') if morceau.startswith('?')]
+            resultats = {
+                titre: {"printouts": {propriete: self.proprietes[titre].get(propriete, [])
+                                      for propriete in demandees},
+                        "fulltext": titre, "namespace": 0, "exists": "1"}
+                for titre in titres if titre in self.proprietes
+            }
+            # Comme SMW : une liste vide (et non un objet) quand rien ne correspond
+            return {"query": {"printrequests": [{"label": p} for p in demandees],
+                              "results": resultats or [],
+                              "meta": {"count": len(resultats), "offset": 0}}}
+        
+        return {"error": {"code": "badvalue", "info": f"Unrecognized value for parameter \"action\": {action}."}}
+    
+    def _reponse(self, chemin: str, if_none_match: Optional[str], brut: str = None):
+        """(statut, en-têtes, corps) pour un chemin (brut : chemin non décodé, pour l'API)"""
+        with self._verrou:
+            if chemin not in self._pannes_restantes:
+                self._pannes_restantes[chemin] = self.pannes.get(chemin, self.pannes.get("*", 0))
+            restantes = self._pannes_restantes[chemin]
+            if restantes:
+                if restantes > 0:
+                    self._pannes_restantes[chemin] = restantes - 1
+                entetes = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+                return 503, entetes, b"Service indisponible"
+        
+        html = self.pages.get(chemin)
+        morceaux = urlsplit(brut or chemin)
+        if html is not None:
+            corps, type_contenu = html.encode('utf-8'), "text/html; charset=utf-8"
+        elif morceaux.path == "/api.php" and (self.wikitextes or self.proprietes):
+            reponse = self._reponse_api(parse_qs(morceaux.query))
+            corps, type_contenu = json.dumps(reponse, ensure_ascii=False).encode('utf-8'), "application/json; charset=utf-8"
+        else:
+            return 404, {}, b"Page introuvable"
+        
+        etag = '"' + hashlib.sha256(corps).hexdigest()[:32] + '"'
+        if if_none_match == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag, "Content-Type": type_contenu}, corps
+    
+    def _gestionnaire(self):
+        serveur = self
+        
+        class Gestionnaire(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                if serveur.latence:
+                    time.sleep(serveur.latence)
+                chemin = unquote(self.path)
+                statut, entetes, corps = serveur._reponse(chemin, self.headers.get("If-None-Match"), self.path)
+                with serveur._verrou:
+                    serveur.requetes[chemin].append((time.monotonic(), statut))
+                    serveur.octets[chemin] += len(corps)
+                
+                self.send_response(statut)
+                for nom, valeur in entetes.items():
+                    self.send_header(nom, valeur)
+                self.send_header("Content-Length", str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Gestionnaire
+    
+    def demarrer(self) -> "ServeurPages":
+        self._thread = threading.Thread(target=self._serveur.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def arreter(self):
+        self._serveur.shutdown()
+        self._serveur.server_close()
+    
+    def __enter__(self):
+        return self.demarrer()
+    
+    def __exit__(self, *exc):
+        self.arreter()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur local de pages de listes de sets")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--dossier", help="Dossier de fichiers .html (servis sous /wiki/NOM)")
+    source.add_argument("--cache", help="Dossier du cache de pages du convertisseur")
+    source.add_argument("--fixtures", help="Fichier JSON de l'API MediaWiki simulée (pages, propriétés)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latence", type=float, default=0.0, help="Délai par réponse (secondes)")
+    parser.add_argument("--pannes", type=int, default=0, help="Nombre de 503 avant chaque page")
+    args = parser.parse_args()
+    
+    options = {"port": args.port, "latence": args.latence, "pannes": {"*": args.pannes}}
+    if args.dossier:
+        serveur = ServeurPages.depuis_dossier(Path(args.dossier), **options)
+    elif args.fixtures:
+        serveur = ServeurPages.depuis_fixtures(Path(args.fixtures), **options)
+    else:
+        serveur = ServeurPages.depuis_cache(Path(args.cache), **options)
+    
+    print(f"🌐 {len(serveur.pages)} pages servies sur {serveur.base_url}")
+    for chemin in sorted(serveur.pages):
+        print(f"  {serveur.url(chemin)}")
+    for titre in sorted(serveur.wikitextes):
+        print(f"  {serveur.url('/wiki/' + titre.replace(' ', '_'))} (API MediaWiki)")
+    try:
+        serveur._serveur.serve_forever()
+    except KeyboardInterrupt:
+        serveur._serveur.server_close()
+
+if __name__ == "__main__":
+    main()
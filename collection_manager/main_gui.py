@@ -10,7 +10,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
 import os
-import sqlite3
+import threading
 from pathlib import Path
 import matplotlib
 matplotlib.use('Agg')  # Backend non-interactif pour éviter les conflits
@@ -31,16 +31,16 @@ sys.path.insert(0, str(project_root))
 try:
     # Imports préférés (packages)
     from database.db_manager import DatabaseManager
-    from database.csv_importer import CSVImporter  
-    from shared.config import GUI_CONFIG, TEMP_CSV_DIR, COLORS, SYMBOLS, formater_nombre_cartes, formater_pourcentage
+    from database.csv_importer import CSVImporter, SuiviImport, ImportAnnule
+    from shared.config import GUI_CONFIG, TEMP_CSV_DIR, COLORS, SYMBOLS, formater_nombre_cartes, formater_pourcentage, formater_duree
 except ImportError:
     # Fallback : imports directs
     sys.path.insert(0, str(project_root / "database"))
     sys.path.insert(0, str(project_root / "shared"))
     try:
         from db_manager import DatabaseManager
-        from csv_importer import CSVImporter
-        from config import GUI_CONFIG, TEMP_CSV_DIR, COLORS, SYMBOLS, formater_nombre_cartes, formater_pourcentage
+        from csv_importer import CSVImporter, SuiviImport, ImportAnnule
+        from config import GUI_CONFIG, TEMP_CSV_DIR, COLORS, SYMBOLS, formater_nombre_cartes, formater_pourcentage, formater_duree
     except ImportError as e:
         print(f"❌ Erreur d'import critique : {e}")
         print("💡 Vérifiez que tous les fichiers sont présents")
@@ -1269,26 +1269,23 @@ class CollectionManagerGUI:
         
         # Récupérer toutes les séries
         try:
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.code_serie, s.nom_serie, COUNT(DISTINCT c.id) as nb_cartes,
-                       COUNT(DISTINCT cr.id) as nb_raretes
-                FROM series s
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                GROUP BY s.id, s.code_serie, s.nom_serie
-                ORDER BY s.code_serie
-            """)
-            
-            # Filtrer et ajouter les séries correspondantes
-            for code_serie, nom_serie, nb_cartes, nb_raretes in cursor.fetchall():
-                if search_text == "" or search_text in code_serie.lower() or search_text in nom_serie.lower():
-                    display_text = f"{code_serie} ({nb_raretes} raretes)"
-                    self.series_listbox.insert(tk.END, display_text)
-            
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.code_serie, s.nom_serie, s.nb_cartes_total as nb_cartes,
+                           COALESCE(SUM(st.total), 0) as nb_raretes
+                    FROM series s
+                    LEFT JOIN stats_series_raretes st ON st.serie_id = s.id
+                    GROUP BY s.id, s.code_serie, s.nom_serie
+                    ORDER BY s.code_serie
+                """)
+                
+                # Filtrer et ajouter les séries correspondantes
+                for code_serie, nom_serie, nb_cartes, nb_raretes in cursor.fetchall():
+                    if search_text == "" or search_text in code_serie.lower() or search_text in nom_serie.lower():
+                        display_text = f"{code_serie} ({nb_raretes} raretes)"
+                        self.series_listbox.insert(tk.END, display_text)
             
         except Exception as e:
             self.log(f"Erreur lors du filtrage des séries : {e}")
@@ -1337,21 +1334,20 @@ class CollectionManagerGUI:
     def charger_raretes_serie(self, code_serie):
         """Charge les raretés disponibles pour une série donnée"""
         try:
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT DISTINCT r.nom_rarete
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                WHERE s.code_serie = ?
-                ORDER BY r.nom_rarete
-            """, (code_serie,))
-            
-            raretes = [row[0] for row in cursor.fetchall()]
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT DISTINCT r.nom_rarete
+                    FROM series s
+                    JOIN cartes c ON s.id = c.serie_id
+                    JOIN carte_raretes cr ON c.id = cr.carte_id
+                    JOIN raretes r ON cr.rarete_id = r.id
+                    WHERE s.code_serie = ?
+                    ORDER BY r.nom_rarete
+                """, (code_serie,))
+                
+                raretes = [row[0] for row in cursor.fetchall()]
             
             # Mettre à jour le menu déroulant
             raretes_list = ["Toutes les raretés"] + raretes
@@ -1400,21 +1396,20 @@ class CollectionManagerGUI:
                 return
             
             # Récupérer toutes les cartes possédées
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete, cr.possedee
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                WHERE cr.possedee = 1
-                ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
-            """)
-            
-            cartes_possedees = cursor.fetchall()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete, cr.possedee
+                    FROM series s
+                    JOIN cartes c ON s.id = c.serie_id
+                    JOIN carte_raretes cr ON c.id = cr.carte_id
+                    JOIN raretes r ON cr.rarete_id = r.id
+                    WHERE cr.possedee = 1
+                    ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
+                """)
+                
+                cartes_possedees = cursor.fetchall()
             
             # Écrire le fichier CSV
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
@@ -1445,68 +1440,196 @@ class CollectionManagerGUI:
         except Exception as e:
             messagebox.showerror("Erreur", f"Impossible de lancer le convertisseur :\n{e}")
     
+    def lancer_import_arriere_plan(self, titre: str, travail, terminer):
+        """
+        Exécute un import dans un thread, avec une fenêtre de progression
+        
+        Args:
+            titre (str): Titre de la fenêtre de progression
+            travail: Fonction travail(suivi) exécutée dans le thread d'import
+            terminer: Fonction terminer(resultat, erreur) appelée dans le thread Tk
+        """
+        if getattr(self, 'import_en_cours', False):
+            messagebox.showwarning("Import en cours", "Un import est déjà en cours")
+            return
+        self.import_en_cours = True
+        
+        suivi = SuiviImport()
+        resultat = {}
+        
+        # Fenêtre de progression
+        fenetre = ctk.CTkToplevel(self.root)
+        fenetre.title(titre)
+        fenetre.geometry("460x210")
+        fenetre.resizable(False, False)
+        fenetre.transient(self.root)
+        fenetre.grab_set()
+        
+        label_fichier = ctk.CTkLabel(fenetre, text="⏳ Préparation de l'import...",
+                                     font=ctk.CTkFont(size=14, weight="bold"))
+        label_fichier.pack(pady=(20, 10), padx=20)
+        
+        barre = ctk.CTkProgressBar(fenetre, width=400, height=14, progress_color=COLORS["success"])
+        barre.pack(pady=5, padx=20)
+        barre.set(0)
+        
+        label_details = ctk.CTkLabel(fenetre, text="", font=ctk.CTkFont(size=12), text_color=COLORS["muted"])
+        label_details.pack(pady=5, padx=20)
+        
+        def annuler():
+            suivi.annuler()
+            bouton_annuler.configure(state="disabled", text="⏳ Annulation...")
+        
+        bouton_annuler = ctk.CTkButton(fenetre, text="✕ Annuler", command=annuler, width=140,
+                                       fg_color=COLORS["danger"], hover_color="#B91C1C")
+        bouton_annuler.pack(pady=(10, 20))
+        fenetre.protocol("WM_DELETE_WINDOW", annuler)
+        
+        def executer():
+            try:
+                resultat['valeur'] = travail(suivi)
+            except Exception as e:
+                resultat['erreur'] = e
+        
+        thread = threading.Thread(target=executer, daemon=True)
+        thread.start()
+        
+        def surveiller():
+            etat = suivi.etat()
+            if etat['fichier']:
+                label_fichier.configure(text=f"📥 {etat['etape']} : {etat['fichier']} "
+                                             f"({etat['fichiers_traites']}/{etat['fichiers_total']})")
+            if etat['fraction'] is not None:
+                barre.set(etat['fraction'])
+            lignes = f"{etat['lignes_traitees']:,}"
+            if etat['lignes_totales']:
+                lignes += f" / {etat['lignes_totales']:,}"
+            label_details.configure(
+                text=(f"{lignes} lignes • {etat['debit_lignes_s']:,.0f} lignes/s • "
+                      f"reste {formater_duree(etat['eta_s'])}").replace(',', ' ')
+            )
+            
+            if thread.is_alive():
+                self.root.after(100, surveiller)
+                return
+            
+            fenetre.grab_release()
+            fenetre.destroy()
+            self.import_en_cours = False
+            terminer(resultat.get('valeur'), resultat.get('erreur'))
+        
+        surveiller()
+    
     def importer_csv_fichier(self):
-        """Importe un fichier CSV sélectionné par l'utilisateur"""
+        """Importe un fichier sélectionné par l'utilisateur, en arrière-plan"""
         fichier = filedialog.askopenfilename(
             title="Sélectionner un fichier CSV",
-            filetypes=[("Fichiers CSV", "*.csv"), ("Tous les fichiers", "*.*")]
+            filetypes=[("Fichiers CSV", "*.csv"),
+                       ("JSON Lines", "*.jsonl *.ndjson"),
+                       ("Parquet / Arrow", "*.parquet *.arrow *.feather *.ipc"),
+                       ("Tous les fichiers", "*.*")]
         )
         
-        if fichier:
-            try:
-                self.log(f"📥 Import de {Path(fichier).name}...")
-                stats = self.importer.importer_csv(fichier)
-                
-                self.log(f"✅ Import terminé :")
-                self.log(f"  ➕ Cartes ajoutées : {stats['cartes_ajoutees']}")
-                self.log(f"  🔗 Liens créés : {stats['liens_crees']}")
-                self.log(f"  ↻  Cartes existantes : {stats['cartes_existantes']}")
-                
-                if stats['erreurs'] > 0:
-                    self.log(f"  ❌ Erreurs : {stats['erreurs']}")
-                
+        if not fichier:
+            return
+        
+        self.log(f"📥 Import de {Path(fichier).name}...")
+        
+        def terminer(stats, erreur):
+            if isinstance(erreur, ImportAnnule):
+                self.log("⏹️ Import annulé : les lots déjà chargés sont conservés, "
+                         "le prochain import de ce fichier reprendra après eux")
                 self.rafraichir_donnees()
-                messagebox.showinfo("Import terminé", "Fichier CSV importé avec succès !")
-                
-            except Exception as e:
-                self.log(f"❌ Erreur lors de l'import : {e}")
-                messagebox.showerror("Erreur d'import", str(e))
+                return
+            if erreur:
+                self.log(f"❌ Erreur lors de l'import : {erreur}")
+                messagebox.showerror("Erreur d'import", str(erreur))
+                return
+            
+            self.log(f"✅ Import terminé :")
+            if stats.get('fichier_inchange'):
+                self.log("  ⏭️ Fichier inchangé depuis le dernier import")
+            self.log(f"  ➕ Cartes ajoutées : {stats['cartes_ajoutees']}")
+            self.log(f"  🔗 Liens créés : {stats['liens_crees']}")
+            self.log(f"  ↻  Cartes existantes : {stats['cartes_existantes']}")
+            
+            if stats['erreurs'] > 0:
+                self.log(f"  ❌ Erreurs : {stats['erreurs']}")
+            
+            self.rafraichir_donnees()
+            messagebox.showinfo("Import terminé", "Fichier CSV importé avec succès !")
+        
+        self.lancer_import_arriere_plan(
+            f"📥 Import de {Path(fichier).name}",
+            lambda suivi: self.importer.importer_csv(fichier, suivi=suivi, reprendre=True),
+            terminer
+        )
     
     def importer_dossier_csv(self):
-        """Importe tous les CSV du dossier temp"""
-        try:
-            self.log("📁 Import du dossier temp/...")
-            resultats = self.importer.importer_dossier(str(TEMP_CSV_DIR))
+        """Importe tous les fichiers du dossier temp, en arrière-plan"""
+        self.log("📁 Import du dossier temp/...")
+        
+        def terminer(resultats, erreur):
+            if erreur:
+                self.log(f"❌ Erreur lors de l'import : {erreur}")
+                messagebox.showerror("Erreur d'import", str(erreur))
+                return
+            
+            if not resultats:
+                self.log("❌ Aucun fichier CSV trouvé dans le dossier temp/")
+                messagebox.showwarning("Aucun fichier", "Aucun fichier CSV trouvé dans le dossier temp/")
+                return
             
-            if resultats:
+            fichiers_annules = sum(1 for stats in resultats.values() if stats.get('annule'))
+            if fichiers_annules:
+                self.log(f"⏹️ Import annulé : {fichiers_annules} fichier(s) non terminé(s), laissés dans temp/ "
+                         f"(l'import reprendra après leurs lots déjà chargés)")
+            else:
                 self.log(f"✅ Import de {len(resultats)} fichiers terminé")
-                
-                fichiers_supprimes = 0
-                for fichier, stats in resultats.items():
-                    if 'erreur' in stats:
-                        self.log(f"❌ {fichier} : {stats['erreur']}")
-                    else:
-                        message_stats = f"✅ {fichier} : {stats['cartes_ajoutees']} cartes, {stats['liens_crees']} liens"
-                        if stats.get('fichier_supprime', False):
-                            message_stats += " 🗑️ (supprimé)"
-                            fichiers_supprimes += 1
-                        self.log(message_stats)
-                
-                self.rafraichir_donnees()
-                if fichiers_supprimes > 0:
-                    messagebox.showinfo(
-                        "Import terminé", 
-                        f"{len(resultats)} fichiers importés !\n🗑️ {fichiers_supprimes} fichiers supprimés du dossier temp/"
-                    )
+            
+            fichiers_supprimes = 0
+            for fichier, stats in resultats.items():
+                if stats.get('annule'):
+                    continue
+                if 'erreur' in stats:
+                    self.log(f"❌ {fichier} : {stats['erreur']}")
+                    for anomalie in stats.get('simulation', {}).get('anomalies', [])[:5]:
+                        self.log(f"    Ligne {anomalie['ligne']} : {anomalie['message']}")
+                elif stats.get('fichier_inchange'):
+                    message_stats = f"⏭️ {fichier} : inchangé depuis le dernier import"
+                    if stats.get('fichier_supprime', False):
+                        message_stats += " 🗑️ (supprimé)"
+                        fichiers_supprimes += 1
+                    self.log(message_stats)
                 else:
-                    messagebox.showinfo("Import terminé", f"{len(resultats)} fichiers importés !")
+                    message_stats = f"✅ {fichier} : {stats['cartes_ajoutees']} cartes, {stats['liens_crees']} liens"
+                    if stats.get('fichier_supprime', False):
+                        message_stats += " 🗑️ (supprimé)"
+                        fichiers_supprimes += 1
+                    self.log(message_stats)
+            
+            self.rafraichir_donnees()
+            if fichiers_annules:
+                messagebox.showinfo(
+                    "Import annulé",
+                    f"{len(resultats) - fichiers_annules} fichiers traités avant l'annulation.\n"
+                    f"{fichiers_annules} fichiers laissés dans temp/"
+                )
+            elif fichiers_supprimes > 0:
+                messagebox.showinfo(
+                    "Import terminé", 
+                    f"{len(resultats)} fichiers importés !\n🗑️ {fichiers_supprimes} fichiers supprimés du dossier temp/"
+                )
             else:
-                self.log("❌ Aucun fichier CSV trouvé dans le dossier temp/")
-                messagebox.showwarning("Aucun fichier", "Aucun fichier CSV trouvé dans le dossier temp/")
-                
-        except Exception as e:
-            self.log(f"❌ Erreur lors de l'import : {e}")
-            messagebox.showerror("Erreur d'import", str(e))
+                messagebox.showinfo("Import terminé", f"{len(resultats)} fichiers importés !")
+        
+        # Les fichiers avec des anomalies bloquantes sont écartés avant toute écriture
+        self.lancer_import_arriere_plan(
+            "📁 Import du dossier temp/",
+            lambda suivi: self.importer.importer_dossier(str(TEMP_CSV_DIR), simulation_prealable=True,
+                                                         suivi=suivi, reprendre=True),
+            terminer
+        )
     
     def afficher_stats_detaillees(self):
         """Affiche une fenêtre avec des graphiques de statistiques détaillées"""
@@ -1535,57 +1658,55 @@ class CollectionManagerGUI:
             main_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             
             # Récupérer les données pour les graphiques
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # 1. Graphique d'activité d'ajout de cartes par mois
-            cursor.execute("""
-                SELECT DATE(date_ajout) as date, COUNT(*) as nb_cartes
-                FROM cartes 
-                WHERE date_ajout IS NOT NULL
-                GROUP BY DATE(date_ajout)
-                ORDER BY date_ajout
-            """)
-            ajout_data = cursor.fetchall()
-            
-            # 2. Graphique d'acquisition de cartes possédées par mois  
-            cursor.execute("""
-                SELECT DATE(cr.date_acquisition) as date, COUNT(*) as nb_cartes
-                FROM carte_raretes cr
-                WHERE cr.possedee = 1 AND cr.date_acquisition IS NOT NULL
-                GROUP BY DATE(cr.date_acquisition)
-                ORDER BY cr.date_acquisition
-            """)
-            acquisition_data = cursor.fetchall()
-            
-            # 3. Statistiques par série
-            cursor.execute("""
-                SELECT s.nom_serie, s.code_serie,
-                       COUNT(DISTINCT c.id) as total_cartes,
-                       COUNT(DISTINCT cr.id) as total_exemplaires,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes
-                FROM series s
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                GROUP BY s.id, s.nom_serie, s.code_serie
-                ORDER BY possedes DESC
-                LIMIT 10
-            """)
-            series_stats = cursor.fetchall()
-            
-            # 4. Statistiques par rareté
-            cursor.execute("""
-                SELECT r.nom_rarete,
-                       COUNT(*) as total,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes
-                FROM carte_raretes cr
-                JOIN raretes r ON cr.rarete_id = r.id
-                GROUP BY r.nom_rarete
-                ORDER BY possedes DESC
-            """)
-            rarity_stats = cursor.fetchall()
-            
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                # 1. Graphique d'activité d'ajout de cartes par mois
+                cursor.execute("""
+                    SELECT DATE(date_ajout) as date, COUNT(*) as nb_cartes
+                    FROM cartes 
+                    WHERE date_ajout IS NOT NULL
+                    GROUP BY DATE(date_ajout)
+                    ORDER BY date_ajout
+                """)
+                ajout_data = cursor.fetchall()
+                
+                # 2. Graphique d'acquisition de cartes possédées par mois  
+                cursor.execute("""
+                    SELECT DATE(cr.date_acquisition) as date, COUNT(*) as nb_cartes
+                    FROM carte_raretes cr
+                    WHERE cr.possedee = 1 AND cr.date_acquisition IS NOT NULL
+                    GROUP BY DATE(cr.date_acquisition)
+                    ORDER BY cr.date_acquisition
+                """)
+                acquisition_data = cursor.fetchall()
+                
+                # 3. Statistiques par série
+                cursor.execute("""
+                    SELECT s.nom_serie, s.code_serie,
+                           s.nb_cartes_total as total_cartes,
+                           COALESCE(SUM(st.total), 0) as total_exemplaires,
+                           COALESCE(SUM(st.possedes), 0) as possedes
+                    FROM series s
+                    LEFT JOIN stats_series_raretes st ON st.serie_id = s.id
+                    GROUP BY s.id, s.nom_serie, s.code_serie
+                    ORDER BY possedes DESC
+                    LIMIT 10
+                """)
+                series_stats = cursor.fetchall()
+                
+                # 4. Statistiques par rareté
+                cursor.execute("""
+                    SELECT r.nom_rarete,
+                           SUM(st.total) as total,
+                           SUM(st.possedes) as possedes
+                    FROM stats_series_raretes st
+                    JOIN raretes r ON st.rarete_id = r.id
+                    GROUP BY r.nom_rarete
+                    HAVING total > 0
+                    ORDER BY possedes DESC
+                """)
+                rarity_stats = cursor.fetchall()
             
             # Créer les graphiques
             self.creer_graphique_activite(main_frame, ajout_data, acquisition_data)
@@ -1637,21 +1758,20 @@ class CollectionManagerGUI:
             content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             
             # Récupérer les cartes manquantes de la base de données
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                WHERE cr.possedee = 0
-                ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
-            """)
-            
-            cartes_manquantes = cursor.fetchall()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete
+                    FROM series s
+                    JOIN cartes c ON s.id = c.serie_id
+                    JOIN carte_raretes cr ON c.id = cr.carte_id
+                    JOIN raretes r ON cr.rarete_id = r.id
+                    WHERE cr.possedee = 0
+                    ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
+                """)
+                
+                cartes_manquantes = cursor.fetchall()
             
             if not cartes_manquantes:
                 # Aucune carte manquante - félicitations !
@@ -1760,21 +1880,20 @@ class CollectionManagerGUI:
             content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             
             # Récupérer les cartes possédées de la base de données
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                WHERE cr.possedee = 1
-                ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
-            """)
-            
-            cartes_possedees = cursor.fetchall()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete
+                    FROM series s
+                    JOIN cartes c ON s.id = c.serie_id
+                    JOIN carte_raretes cr ON c.id = cr.carte_id
+                    JOIN raretes r ON cr.rarete_id = r.id
+                    WHERE cr.possedee = 1
+                    ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
+                """)
+                
+                cartes_possedees = cursor.fetchall()
             
             if not cartes_possedees:
                 # Aucune carte possédée
@@ -1883,20 +2002,19 @@ class CollectionManagerGUI:
             content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             
             # Récupérer tous les exemplaires de la base de données
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete, cr.possedee
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
-            """)
-            
-            tous_exemplaires = cursor.fetchall()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.nom_serie, c.numero_carte, c.nom_carte, r.nom_rarete, cr.possedee
+                    FROM series s
+                    JOIN cartes c ON s.id = c.serie_id
+                    JOIN carte_raretes cr ON c.id = cr.carte_id
+                    JOIN raretes r ON cr.rarete_id = r.id
+                    ORDER BY s.nom_serie, c.numero_carte, r.nom_rarete
+                """)
+                
+                tous_exemplaires = cursor.fetchall()
             
             if not tous_exemplaires:
                 # Aucun exemplaire
@@ -2043,11 +2161,10 @@ class CollectionManagerGUI:
             cartes_manquantes = total_exemplaires - exemplaires_possedes
             
             # Compter les cartes uniques
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM cartes')
-            total_cartes = cursor.fetchone()[0]
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COALESCE(SUM(nb_cartes_total), 0) FROM series')
+                total_cartes = cursor.fetchone()[0]
             
             # Mettre à jour les labels de statistiques
             self.stats_labels['total_series'].configure(text=str(total_series))
@@ -2098,11 +2215,10 @@ class CollectionManagerGUI:
             cartes_manquantes = total_exemplaires - exemplaires_possedes
             
             # Compter les cartes uniques
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM cartes')
-            total_cartes = cursor.fetchone()[0]
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COALESCE(SUM(nb_cartes_total), 0) FROM series')
+                total_cartes = cursor.fetchone()[0]
             
             # Mettre à jour les labels de statistiques
             self.stats_labels['total_series'].configure(text=str(total_series))
@@ -2158,24 +2274,21 @@ class CollectionManagerGUI:
         try:
             self.series_listbox.delete(0, tk.END)
             
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.code_serie, s.nom_serie, COUNT(DISTINCT c.id) as nb_cartes,
-                       COUNT(DISTINCT cr.id) as nb_raretes
-                FROM series s
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                GROUP BY s.id, s.code_serie, s.nom_serie
-                ORDER BY s.code_serie
-            """)
-            
-            for code_serie, nom_serie, nb_cartes, nb_raretes in cursor.fetchall():
-                display_text = f"{code_serie} ({nb_raretes} raretes)"
-                self.series_listbox.insert(tk.END, display_text)
-            
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.code_serie, s.nom_serie, s.nb_cartes_total as nb_cartes,
+                           COALESCE(SUM(st.total), 0) as nb_raretes
+                    FROM series s
+                    LEFT JOIN stats_series_raretes st ON st.serie_id = s.id
+                    GROUP BY s.id, s.code_serie, s.nom_serie
+                    ORDER BY s.code_serie
+                """)
+                
+                for code_serie, nom_serie, nb_cartes, nb_raretes in cursor.fetchall():
+                    display_text = f"{code_serie} ({nb_raretes} raretes)"
+                    self.series_listbox.insert(tk.END, display_text)
             self.log("Series chargees avec succes")
             
         except Exception as e:
@@ -2217,107 +2330,71 @@ class CollectionManagerGUI:
             cartes_possedees = 0
             cartes_affichees = 0
             
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            # Récupérer l'ID de la série pour les opérations de sélection
-            cursor.execute("SELECT id FROM series WHERE code_serie = ?", (code_serie,))
-            serie_result = cursor.fetchone()
-            if serie_result:
-                self.current_serie_id = serie_result[0]
-            else:
-                self.log(f"Erreur : Série {code_serie} non trouvée")
-                conn.close()
-                return
-            
-            # Construire la requête selon le filtre
-            base_query = """
-                SELECT c.numero_carte, c.nom_carte, r.nom_rarete, 
-                       cr.possedee, cr.id as carte_rarete_id
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                JOIN raretes r ON cr.rarete_id = r.id
-                WHERE s.code_serie = ?
-            """
-            
-            # Paramètres pour la requête
-            query_params = [code_serie]
-            
-            # Ajouter le filtre selon la sélection
-            if self.current_filter == "owned":
-                base_query += " AND cr.possedee = 1"
-            elif self.current_filter == "missing":
-                base_query += " AND cr.possedee = 0"
-            
-            # Ajouter le filtre de recherche par nom ou numéro de carte
-            if hasattr(self, 'card_search_term') and self.card_search_term:
-                # Vérifier si le terme de recherche est un numéro (contient uniquement des chiffres)
-                if self.card_search_term.isdigit():
-                    # Recherche par numéro de carte
-                    base_query += " AND c.numero_carte LIKE ?"
-                    query_params.append(f"%{self.card_search_term}%")
-                else:
-                    # Recherche par nom de carte ou combinaison nom/numéro
-                    base_query += " AND (LOWER(c.nom_carte) LIKE ? OR c.numero_carte LIKE ?)"
-                    query_params.append(f"%{self.card_search_term}%")
-                    query_params.append(f"%{self.card_search_term}%")
-            
-            # Ajouter le filtre par rareté
-            if hasattr(self, 'selected_rarity') and self.selected_rarity:
-                base_query += " AND r.nom_rarete = ?"
-                query_params.append(self.selected_rarity)
-            
-            base_query += " ORDER BY c.numero_carte, r.nom_rarete"
-            
-            cursor.execute(base_query, query_params)
-            cartes_filtrees = cursor.fetchall()
-            
-            # Récupérer aussi le total pour les statistiques et le nom complet
-            cursor.execute("""
-                SELECT COUNT(*) as total,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedees,
-                       s.nom_serie
-                FROM series s
-                JOIN cartes c ON s.id = c.serie_id
-                JOIN carte_raretes cr ON c.id = cr.carte_id
-                WHERE s.code_serie = ?
-                GROUP BY s.nom_serie
-            """, (code_serie,))
-            
-            stats_result = cursor.fetchone()
-            total_cartes = stats_result[0] if stats_result else 0
-            cartes_possedees = stats_result[1] if stats_result else 0
-            nom_serie_complet = stats_result[2] if stats_result else code_serie
-            
-            # Sauvegarder les données pour d'autres opérations
-            self.current_serie_data = cartes_filtrees
-            
-            # Afficher les cartes selon le filtre
-            for numero, nom, rarete, possedee_bool, cr_id in cartes_filtrees:
-                cartes_affichees += 1
-                
-                # Créer un affichage visuel moderne
-                if possedee_bool:
-                    possede_display = "✅ Possédé"
-                    tag_style = "owned"
-                else:
-                    possede_display = "❌ Manquant"
-                    tag_style = "not_owned"
-                
-                # Insérer selon le mode actuel
-                if self.selection_mode_active:
-                    # Mode sélection : ajouter la colonne avec cercle vide
-                    item = self.cartes_tree.insert("", tk.END, 
-                                                   values=("⭕", numero, nom, rarete, possede_display),
-                                                   tags=(cr_id, tag_style))
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                # Récupérer l'ID de la série pour les opérations de sélection
+                cursor.execute("SELECT id FROM series WHERE code_serie = ?", (code_serie,))
+                serie_result = cursor.fetchone()
+                if serie_result:
+                    self.current_serie_id = serie_result[0]
                 else:
-                    # Mode normal : sans colonne de sélection
-                    item = self.cartes_tree.insert("", tk.END, 
-                                                   values=(numero, nom, rarete, possede_display),
-                                                   tags=(cr_id, tag_style))
-            
-            conn.close()
+                    self.log(f"Erreur : Série {code_serie} non trouvée")
+                    return
+                
+                # Construire la requête selon le filtre, la recherche et la rareté
+                base_query, query_params = self.db.construire_requete_cartes_serie(
+                    code_serie,
+                    filtre=self.current_filter,
+                    recherche=getattr(self, 'card_search_term', None),
+                    rarete=getattr(self, 'selected_rarity', None)
+                )
+                
+                cursor.execute(base_query, query_params)
+                cartes_filtrees = cursor.fetchall()
+                
+                # Récupérer aussi le total pour les statistiques et le nom complet
+                cursor.execute("""
+                    SELECT COALESCE(SUM(st.total), 0) as total,
+                           COALESCE(SUM(st.possedes), 0) as possedees,
+                           s.nom_serie
+                    FROM series s
+                    LEFT JOIN stats_series_raretes st ON st.serie_id = s.id
+                    WHERE s.code_serie = ?
+                    GROUP BY s.nom_serie
+                """, (code_serie,))
+                
+                stats_result = cursor.fetchone()
+                total_cartes = stats_result[0] if stats_result else 0
+                cartes_possedees = stats_result[1] if stats_result else 0
+                nom_serie_complet = stats_result[2] if stats_result else code_serie
+                
+                # Sauvegarder les données pour d'autres opérations
+                self.current_serie_data = cartes_filtrees
+                
+                # Afficher les cartes selon le filtre
+                for numero, nom, rarete, possedee_bool, cr_id in cartes_filtrees:
+                    cartes_affichees += 1
+                    
+                    # Créer un affichage visuel moderne
+                    if possedee_bool:
+                        possede_display = "✅ Possédé"
+                        tag_style = "owned"
+                    else:
+                        possede_display = "❌ Manquant"
+                        tag_style = "not_owned"
+                    
+                    # Insérer selon le mode actuel
+                    if self.selection_mode_active:
+                        # Mode sélection : ajouter la colonne avec cercle vide
+                        item = self.cartes_tree.insert("", tk.END, 
+                                                       values=("⭕", numero, nom, rarete, possede_display),
+                                                       tags=(cr_id, tag_style))
+                    else:
+                        # Mode normal : sans colonne de sélection
+                        item = self.cartes_tree.insert("", tk.END, 
+                                                       values=(numero, nom, rarete, possede_display),
+                                                       tags=(cr_id, tag_style))
             
             # Mettre à jour les statistiques de la série
             pourcentage = (cartes_possedees / total_cartes * 100) if total_cartes > 0 else 0
@@ -2378,22 +2455,19 @@ class CollectionManagerGUI:
             return
         
         try:
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            cartes_modifiees = 0
-            for item in selected_items:
-                # Récupérer l'ID de carte_rarete depuis les tags
-                cr_id = self.cartes_tree.item(item)['tags'][0]
-                cursor.execute("""
-                    UPDATE carte_raretes 
-                    SET possedee = ? 
-                    WHERE id = ?
-                """, (1 if possede else 0, cr_id))
-                cartes_modifiees += 1
-            
-            conn.commit()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                cartes_modifiees = 0
+                for item in selected_items:
+                    # Récupérer l'ID de carte_rarete depuis les tags
+                    cr_id = self.cartes_tree.item(item)['tags'][0]
+                    cursor.execute("""
+                        UPDATE carte_raretes 
+                        SET possedee = ? 
+                        WHERE id = ?
+                    """, (1 if possede else 0, cr_id))
+                    cartes_modifiees += 1
             
             status = "possedees" if possede else "non possedees"
             self.log(f"{cartes_modifiees} carte(s) marquee(s) comme {status}")
@@ -2644,70 +2718,69 @@ class CollectionManagerGUI:
             title_label.pack(pady=(15, 10))
             
             # Récupérer les données d'évolution
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Données cumulatives de la collection
-            cursor.execute("""
-                WITH RECURSIVE dates AS (
-                    SELECT MIN(date(date_ajout)) as date_point
-                    FROM cartes 
-                    WHERE date_ajout IS NOT NULL
-                    UNION ALL
-                    SELECT date(date_point, '+1 day')
-                    FROM dates
-                    WHERE date_point < date('now')
-                ),
-                daily_totals AS (
-                    SELECT d.date_point,
-                           COUNT(cr.id) as nouvelles_cartes,
-                           (SELECT COUNT(DISTINCT cr2.id) FROM carte_raretes cr2 
-                            JOIN cartes c2 ON cr2.carte_id = c2.id
-                            WHERE date(c2.date_ajout) <= d.date_point 
-                            AND c2.date_ajout IS NOT NULL) as total_cumule
-                    FROM dates d
-                    LEFT JOIN carte_raretes cr ON cr.carte_id IN (
-                        SELECT c.id FROM cartes c WHERE date(c.date_ajout) = d.date_point
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                # Données cumulatives de la collection
+                cursor.execute("""
+                    WITH RECURSIVE dates AS (
+                        SELECT MIN(date(date_ajout)) as date_point
+                        FROM cartes 
+                        WHERE date_ajout IS NOT NULL
+                        UNION ALL
+                        SELECT date(date_point, '+1 day')
+                        FROM dates
+                        WHERE date_point < date('now')
+                    ),
+                    daily_totals AS (
+                        SELECT d.date_point,
+                               COUNT(cr.id) as nouvelles_cartes,
+                               (SELECT COUNT(DISTINCT cr2.id) FROM carte_raretes cr2 
+                                JOIN cartes c2 ON cr2.carte_id = c2.id
+                                WHERE date(c2.date_ajout) <= d.date_point 
+                                AND c2.date_ajout IS NOT NULL) as total_cumule
+                        FROM dates d
+                        LEFT JOIN carte_raretes cr ON cr.carte_id IN (
+                            SELECT c.id FROM cartes c WHERE date(c.date_ajout) = d.date_point
+                        )
+                        GROUP BY d.date_point
+                        HAVING total_cumule > 0
                     )
-                    GROUP BY d.date_point
-                    HAVING total_cumule > 0
-                )
-                SELECT date_point, nouvelles_cartes, total_cumule
-                FROM daily_totals
-                ORDER BY date_point
-            """)
-            
-            evolution_data = cursor.fetchall()
-            
-            # Données de possession (cartes marquées comme possédées)
-            cursor.execute("""
-                WITH RECURSIVE dates AS (
-                    SELECT MIN(date(date_acquisition)) as date_point
-                    FROM carte_raretes 
-                    WHERE date_acquisition IS NOT NULL AND possedee = 1
-                    UNION ALL
-                    SELECT date(date_point, '+1 day')
-                    FROM dates
-                    WHERE date_point < date('now')
-                ),
-                daily_owned AS (
-                    SELECT d.date_point,
-                           COUNT(cr.id) as nouvelles_possedees,
-                           (SELECT COUNT(*) FROM carte_raretes cr2 
-                            WHERE date(cr2.date_acquisition) <= d.date_point 
-                            AND cr2.possedee = 1 AND cr2.date_acquisition IS NOT NULL) as total_possedees
-                    FROM dates d
-                    LEFT JOIN carte_raretes cr ON date(cr.date_acquisition) = d.date_point AND cr.possedee = 1
-                    GROUP BY d.date_point
-                    HAVING total_possedees > 0
-                )
-                SELECT date_point, nouvelles_possedees, total_possedees
-                FROM daily_owned
-                ORDER BY date_point
-            """)
-            
-            possession_data = cursor.fetchall()
-            conn.close()
+                    SELECT date_point, nouvelles_cartes, total_cumule
+                    FROM daily_totals
+                    ORDER BY date_point
+                """)
+                
+                evolution_data = cursor.fetchall()
+                
+                # Données de possession (cartes marquées comme possédées)
+                cursor.execute("""
+                    WITH RECURSIVE dates AS (
+                        SELECT MIN(date(date_acquisition)) as date_point
+                        FROM carte_raretes 
+                        WHERE date_acquisition IS NOT NULL AND possedee = 1
+                        UNION ALL
+                        SELECT date(date_point, '+1 day')
+                        FROM dates
+                        WHERE date_point < date('now')
+                    ),
+                    daily_owned AS (
+                        SELECT d.date_point,
+                               COUNT(cr.id) as nouvelles_possedees,
+                               (SELECT COUNT(*) FROM carte_raretes cr2 
+                                WHERE date(cr2.date_acquisition) <= d.date_point 
+                                AND cr2.possedee = 1 AND cr2.date_acquisition IS NOT NULL) as total_possedees
+                        FROM dates d
+                        LEFT JOIN carte_raretes cr ON date(cr.date_acquisition) = d.date_point AND cr.possedee = 1
+                        GROUP BY d.date_point
+                        HAVING total_possedees > 0
+                    )
+                    SELECT date_point, nouvelles_possedees, total_possedees
+                    FROM daily_owned
+                    ORDER BY date_point
+                """)
+                
+                possession_data = cursor.fetchall()
             
             # Nettoyer les anciens widgets s'ils existent
             for widget in evolution_frame.winfo_children():
@@ -2789,32 +2862,22 @@ class CollectionManagerGUI:
             title_label.pack(pady=(15, 10))
             
             # Récupérer les données pour la heatmap
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.code_serie, r.nom_rarete,
-                       COUNT(cr.id) as total_exemplaires,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes,
-                       CASE WHEN COUNT(cr.id) > 0 
-                            THEN ROUND((CAST(SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) AS FLOAT) / COUNT(cr.id)) * 100, 1)
-                            ELSE 0 END as pourcentage
-                FROM series s
-                CROSS JOIN raretes r
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id AND EXISTS (
-                    SELECT 1 FROM carte_raretes cr2 
-                    JOIN cartes c2 ON cr2.carte_id = c2.id 
-                    JOIN series s2 ON c2.serie_id = s2.id 
-                    WHERE cr2.carte_id = c.id AND s2.id = s.id AND cr2.rarete = r.nom_rarete
-                )
-                GROUP BY s.id, s.code_serie, r.id, r.nom_rarete
-                HAVING total_exemplaires > 0
-                ORDER BY s.code_serie, r.nom_rarete
-            """)
-            
-            heatmap_data = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.code_serie, r.nom_rarete,
+                           st.total as total_exemplaires,
+                           st.possedes,
+                           ROUND((CAST(st.possedes AS FLOAT) / st.total) * 100, 1) as pourcentage
+                    FROM stats_series_raretes st
+                    JOIN series s ON st.serie_id = s.id
+                    JOIN raretes r ON st.rarete_id = r.id
+                    WHERE st.total > 0
+                    ORDER BY s.code_serie, r.nom_rarete
+                """)
+                
+                heatmap_data = cursor.fetchall()
             
             # Nettoyer les anciens widgets
             for widget in heatmap_frame.winfo_children():
@@ -2892,25 +2955,22 @@ class CollectionManagerGUI:
         """Crée le graphique moderne de complétion des séries dans l'onglet Vue d'ensemble"""
         try:
             # Récupérer les données de complétion des séries
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.code_serie, s.nom_serie,
-                       COUNT(DISTINCT cr.id) as total_exemplaires,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes
-                FROM series s
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                WHERE cr.id IS NOT NULL
-                GROUP BY s.id, s.code_serie, s.nom_serie
-                HAVING total_exemplaires > 0
-                ORDER BY (CAST(SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) AS FLOAT) / COUNT(DISTINCT cr.id)) DESC
-                LIMIT 15
-            """)
-            
-            series_data = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.code_serie, s.nom_serie,
+                           SUM(st.total) as total_exemplaires,
+                           SUM(st.possedes) as possedes
+                    FROM series s
+                    JOIN stats_series_raretes st ON st.serie_id = s.id
+                    GROUP BY s.id, s.code_serie, s.nom_serie
+                    HAVING total_exemplaires > 0
+                    ORDER BY (CAST(SUM(st.possedes) AS FLOAT) / SUM(st.total)) DESC
+                    LIMIT 15
+                """)
+                
+                series_data = cursor.fetchall()
             
             if series_data:
                 # Préparer les données
@@ -3080,7 +3140,11 @@ class CollectionManagerGUI:
     
     def run(self):
         """Lance l'interface"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.db.afficher_statistiques_requetes()
+            self.db.fermer()
 
     def creer_graphique_evolution_temporelle_compact(self, parent, row, column):
         """Crée le graphique d'évolution temporelle compact pour la grille"""
@@ -3102,37 +3166,36 @@ class CollectionManagerGUI:
             title_label.pack(pady=8)
             
             # Récupérer les données d'évolution (derniers 6 mois pour un affichage compact)
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Données cumulatives des 6 derniers mois
-            cursor.execute("""
-                WITH RECURSIVE dates AS (
-                    SELECT date('now', '-6 months') as date_point
-                    UNION ALL
-                    SELECT date(date_point, '+1 week')
-                    FROM dates
-                    WHERE date_point < date('now')
-                ),
-                weekly_totals AS (
-                    SELECT d.date_point,
-                           (SELECT COUNT(DISTINCT cr2.id) FROM carte_raretes cr2 
-                            JOIN cartes c2 ON cr2.carte_id = c2.id
-                            WHERE date(c2.date_ajout) <= d.date_point 
-                            AND c2.date_ajout IS NOT NULL) as total_cumule,
-                           (SELECT COUNT(*) FROM carte_raretes cr3 
-                            WHERE date(cr3.date_acquisition) <= d.date_point 
-                            AND cr3.possedee = 1 AND cr3.date_acquisition IS NOT NULL) as total_possedees
-                    FROM dates d
-                )
-                SELECT date_point, total_cumule, total_possedees
-                FROM weekly_totals
-                WHERE total_cumule > 0 OR total_possedees > 0
-                ORDER BY date_point
-            """)
-            
-            evolution_data = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                # Données cumulatives des 6 derniers mois
+                cursor.execute("""
+                    WITH RECURSIVE dates AS (
+                        SELECT date('now', '-6 months') as date_point
+                        UNION ALL
+                        SELECT date(date_point, '+1 week')
+                        FROM dates
+                        WHERE date_point < date('now')
+                    ),
+                    weekly_totals AS (
+                        SELECT d.date_point,
+                               (SELECT COUNT(DISTINCT cr2.id) FROM carte_raretes cr2 
+                                JOIN cartes c2 ON cr2.carte_id = c2.id
+                                WHERE date(c2.date_ajout) <= d.date_point 
+                                AND c2.date_ajout IS NOT NULL) as total_cumule,
+                               (SELECT COUNT(*) FROM carte_raretes cr3 
+                                WHERE date(cr3.date_acquisition) <= d.date_point 
+                                AND cr3.possedee = 1 AND cr3.date_acquisition IS NOT NULL) as total_possedees
+                        FROM dates d
+                    )
+                    SELECT date_point, total_cumule, total_possedees
+                    FROM weekly_totals
+                    WHERE total_cumule > 0 OR total_possedees > 0
+                    ORDER BY date_point
+                """)
+                
+                evolution_data = cursor.fetchall()
             
             # Créer la figure matplotlib compacte (taille réduite)
             plt.close('all')
@@ -3206,37 +3269,31 @@ class CollectionManagerGUI:
             title_label.pack(pady=8)
             
             # Récupérer les données pour la heatmap (top 6 séries pour un affichage plus compact)
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                WITH top_series AS (
-                    SELECT s.id, s.code_serie, COUNT(cr.id) as total_cartes
-                    FROM series s
-                    LEFT JOIN cartes c ON s.id = c.serie_id
-                    LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                    GROUP BY s.id, s.code_serie
-                    HAVING total_cartes > 0
-                    ORDER BY total_cartes DESC
-                    LIMIT 6
-                )
-                SELECT ts.code_serie, r.nom_rarete,
-                       COUNT(cr.id) as total_exemplaires,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes,
-                       CASE WHEN COUNT(cr.id) > 0 
-                            THEN ROUND((CAST(SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) AS FLOAT) / COUNT(cr.id)) * 100, 1)
-                            ELSE 0 END as pourcentage
-                FROM top_series ts
-                CROSS JOIN raretes r
-                LEFT JOIN cartes c ON ts.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id AND cr.rarete_id = r.id
-                GROUP BY ts.id, ts.code_serie, r.id, r.nom_rarete
-                HAVING total_exemplaires > 0
-                ORDER BY ts.code_serie, r.nom_rarete
-            """)
-            
-            heatmap_data = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    WITH top_series AS (
+                        SELECT s.id, s.code_serie, SUM(st.total) as total_cartes
+                        FROM series s
+                        JOIN stats_series_raretes st ON st.serie_id = s.id
+                        GROUP BY s.id, s.code_serie
+                        HAVING total_cartes > 0
+                        ORDER BY total_cartes DESC
+                        LIMIT 6
+                    )
+                    SELECT ts.code_serie, r.nom_rarete,
+                           st.total as total_exemplaires,
+                           st.possedes,
+                           ROUND((CAST(st.possedes AS FLOAT) / st.total) * 100, 1) as pourcentage
+                    FROM top_series ts
+                    JOIN stats_series_raretes st ON st.serie_id = ts.id
+                    JOIN raretes r ON st.rarete_id = r.id
+                    WHERE st.total > 0
+                    ORDER BY ts.code_serie, r.nom_rarete
+                """)
+                
+                heatmap_data = cursor.fetchall()
             
             # Créer la figure matplotlib compacte (taille réduite)
             plt.close('all')
@@ -3325,22 +3382,21 @@ class CollectionManagerGUI:
             title_label.pack(pady=8)
             
             # Récupérer les données
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT r.nom_rarete,
-                       COUNT(cr.id) as total,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as possedes
-                FROM raretes r
-                LEFT JOIN carte_raretes cr ON r.id = cr.rarete_id
-                GROUP BY r.id, r.nom_rarete
-                HAVING total > 0
-                ORDER BY total DESC
-            """)
-            
-            rarity_data = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT r.nom_rarete,
+                           SUM(st.total) as total,
+                           SUM(st.possedes) as possedes
+                    FROM raretes r
+                    JOIN stats_series_raretes st ON r.id = st.rarete_id
+                    GROUP BY r.id, r.nom_rarete
+                    HAVING total > 0
+                    ORDER BY total DESC
+                """)
+                
+                rarity_data = cursor.fetchall()
             
             # Créer le graphique optimisé pour les barres horizontales
             plt.close('all')
@@ -3429,26 +3485,24 @@ class CollectionManagerGUI:
             title_label.pack(pady=8)
             
             # Récupérer les statistiques globales
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT cr.id) as total_cartes,
-                    SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as cartes_possedees,
-                    COUNT(DISTINCT c.serie_id) as total_series,
-                    COUNT(DISTINCT CASE WHEN EXISTS(
-                        SELECT 1 FROM carte_raretes cr2 
-                        WHERE cr2.carte_id IN (
-                            SELECT c2.id FROM cartes c2 WHERE c2.serie_id = c.serie_id
-                        ) AND cr2.possedee = 1
-                    ) THEN c.serie_id END) as series_avec_cartes
-                FROM carte_raretes cr
-                JOIN cartes c ON cr.carte_id = c.id
-            """)
-            
-            stats = cursor.fetchone()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT 
+                        COALESCE(SUM(total), 0) as total_cartes,
+                        COALESCE(SUM(possedes), 0) as cartes_possedees,
+                        COUNT(*) as total_series,
+                        SUM(CASE WHEN possedes > 0 THEN 1 ELSE 0 END) as series_avec_cartes
+                    FROM (
+                        SELECT serie_id, SUM(total) as total, SUM(possedes) as possedes
+                        FROM stats_series_raretes
+                        GROUP BY serie_id
+                        HAVING SUM(total) > 0
+                    )
+                """)
+                
+                stats = cursor.fetchone()
             
             # Créer le graphique de progression
             plt.close('all')
@@ -3512,24 +3566,22 @@ class CollectionManagerGUI:
             title_label.pack(pady=(10, 5))
             
             # Récupérer les données de progression par série
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT s.code_serie, s.nom_serie,
-                       COUNT(cr.id) as total_cartes,
-                       SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) as cartes_possedees
-                FROM series s
-                LEFT JOIN cartes c ON s.id = c.serie_id
-                LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-                GROUP BY s.id, s.code_serie, s.nom_serie
-                HAVING total_cartes > 0
-                ORDER BY (CAST(SUM(CASE WHEN cr.possedee = 1 THEN 1 ELSE 0 END) AS FLOAT) / COUNT(cr.id)) DESC
-                LIMIT 8
-            """)
-            
-            results = cursor.fetchall()
-            conn.close()
+            with self.db.lecture_analytique() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT s.code_serie, s.nom_serie,
+                           SUM(st.total) as total_cartes,
+                           SUM(st.possedes) as cartes_possedees
+                    FROM series s
+                    JOIN stats_series_raretes st ON st.serie_id = s.id
+                    GROUP BY s.id, s.code_serie, s.nom_serie
+                    HAVING total_cartes > 0
+                    ORDER BY (CAST(SUM(st.possedes) AS FLOAT) / SUM(st.total)) DESC
+                    LIMIT 8
+                """)
+                
+                results = cursor.fetchall()
             
             if results:
                 # Préparer les données
@@ -3823,25 +3875,22 @@ class CollectionManagerGUI:
                 return
             
             count_updated = 0
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            for item in self.selected_cards:
-                # Récupérer l'ID de carte_raretes depuis les tags de l'élément
-                tags = self.cartes_tree.item(item, "tags")
-                if tags:
-                    carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
-                    
-                    # Ajouter à la collection (marquer comme possédée)
-                    cursor.execute("""
-                        UPDATE carte_raretes 
-                        SET possedee = 1, date_acquisition = CURRENT_DATE
-                        WHERE id = ?
-                    """, (carte_rarete_id,))
-                    count_updated += 1
-            
-            conn.commit()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                for item in self.selected_cards:
+                    # Récupérer l'ID de carte_raretes depuis les tags de l'élément
+                    tags = self.cartes_tree.item(item, "tags")
+                    if tags:
+                        carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
+                        
+                        # Ajouter à la collection (marquer comme possédée)
+                        cursor.execute("""
+                            UPDATE carte_raretes 
+                            SET possedee = 1, date_acquisition = CURRENT_DATE
+                            WHERE id = ?
+                        """, (carte_rarete_id,))
+                        count_updated += 1
             
             # Actualiser l'affichage
             self.charger_cartes_serie(self.current_serie_name)
@@ -3861,25 +3910,22 @@ class CollectionManagerGUI:
                 return
             
             count_updated = 0
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            for item in self.selected_cards:
-                # Récupérer l'ID de carte_raretes depuis les tags de l'élément
-                tags = self.cartes_tree.item(item, "tags")
-                if tags:
-                    carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
-                    
-                    # Supprimer de la collection (marquer comme non possédée)
-                    cursor.execute("""
-                        UPDATE carte_raretes 
-                        SET possedee = 0, date_acquisition = NULL
-                        WHERE id = ?
-                    """, (carte_rarete_id,))
-                    count_updated += 1
-            
-            conn.commit()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                for item in self.selected_cards:
+                    # Récupérer l'ID de carte_raretes depuis les tags de l'élément
+                    tags = self.cartes_tree.item(item, "tags")
+                    if tags:
+                        carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
+                        
+                        # Supprimer de la collection (marquer comme non possédée)
+                        cursor.execute("""
+                            UPDATE carte_raretes 
+                            SET possedee = 0, date_acquisition = NULL
+                            WHERE id = ?
+                        """, (carte_rarete_id,))
+                        count_updated += 1
             
             # Actualiser l'affichage
             self.charger_cartes_serie(self.current_serie_name)
@@ -3919,24 +3965,21 @@ class CollectionManagerGUI:
                 return
             
             count_deleted = 0
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            for item in self.selected_cards:
-                # Récupérer l'ID de carte_raretes depuis les tags de l'élément
-                tags = self.cartes_tree.item(item, "tags")
-                if tags:
-                    carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
-                    
-                    # Supprimer définitivement de la base de données
-                    cursor.execute("""
-                        DELETE FROM carte_raretes 
-                        WHERE id = ?
-                    """, (carte_rarete_id,))
-                    count_deleted += 1
-            
-            conn.commit()
-            conn.close()
+            with self.db.connexion() as conn:
+                cursor = conn.cursor()
+                
+                for item in self.selected_cards:
+                    # Récupérer l'ID de carte_raretes depuis les tags de l'élément
+                    tags = self.cartes_tree.item(item, "tags")
+                    if tags:
+                        carte_rarete_id = tags[0]  # Le premier tag contient toujours l'ID cr_id
+                        
+                        # Supprimer définitivement de la base de données
+                        cursor.execute("""
+                            DELETE FROM carte_raretes 
+                            WHERE id = ?
+                        """, (carte_rarete_id,))
+                        count_deleted += 1
             
             # Actualiser l'affichage
             self.charger_cartes_serie(self.current_serie_name)
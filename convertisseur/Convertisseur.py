@@ -6,10 +6,31 @@ Extrait le nom français, numéro et rareté de chaque carte
 """
 
 import re
+import sys
+import json
+import random
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import threading
+from contextlib import contextmanager
 from html import unescape
+from pathlib import Path
 import requests
 import time
 import csv
+from urllib.parse import urlsplit, urlencode, unquote, parse_qs
+
+# Enregistrement des cartes extraites et cache des pages (dossier shared/)
+try:
+    from shared.cartes import CarteExtraite, COLONNES_CSV, extraire_code_serie
+    from shared.cache_pages import CachePages
+    from shared.raretes import NormaliseurRaretes
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+    from cartes import CarteExtraite, COLONNES_CSV, extraire_code_serie
+    from cache_pages import CachePages
+    from raretes import NormaliseurRaretes
 
 # Import optionnel pour Selenium (navigateur automatisé)
 try:
@@ -24,10 +45,261 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Headers pour simuler un navigateur web normal et contourner les protections anti-bot
+# (pas de "br" : requests ne décompresse Brotli que si le paquet brotli est installé)
+ENTETES_HTTP = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Politesse par site : jetons par seconde et rafale maximale (seau à jetons)
+DEBIT_REQUETES_PAR_SITE = 1.0
+RAFALE_REQUETES_PAR_SITE = 2
+
+# Réessais des erreurs temporaires (connexion, 429, 5xx) avec attente exponentielle
+NB_TENTATIVES = 4
+DELAI_BASE_REESSAI = 1.0
+DELAI_MAX_REESSAI = 60.0
+STATUTS_A_REESSAYER = (429, 500, 502, 503, 504)
+
+# Disjoncteur : après ce nombre d'échecs consécutifs, un site est évité un moment
+SEUIL_DISJONCTEUR = 5
+DUREE_DISJONCTEUR = 60.0
+
+# Nombre de séries extraites en parallèle par l'extraction en lot
+NB_EXTRACTIONS_PARALLELES = 4
+
+# Nombre de navigateurs gardés ouverts entre deux extractions (voir configurer_pool_navigateurs)
+TAILLE_POOL_NAVIGATEURS = 1
+
+# Ressources inutiles à l'extraction, bloquées au niveau réseau
+RESSOURCES_BLOQUEES = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf"
+]
+
+# Import optionnel pour lxml (analyse des tables en une passe)
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Numéro de carte dans sa cellule (BLMM-FR001, RA02-FR001)
+MOTIF_NUMERO_CELLULE = re.compile(r'[A-Z0-9]+-FR\d+')
+
+# Colonnes utiles repérées par leur en-tête (minuscules, premier libellé trouvé)
+ENTETES_COLONNES = {
+    'numero': ('card number', 'set number', 'numéro', 'number'),
+    'nom': ('french name', 'nom français', 'nom'),
+    'rarete': ('rarity', 'rarities', 'rareté'),
+}
+
+# Source structurée : wikitext du modèle {{Set list}} via l'API MediaWiki,
+# noms français via une requête sémantique "ask" (le navigateur reste en secours)
+UTILISER_API_MEDIAWIKI = True
+PROPRIETE_NOM_FRANCAIS = "French name"
+TAILLE_LOT_ASK = 100
+
+# Bloc {{Set list ...}} d'un wikitext (fermé par "}}" en début de ligne)
+MOTIF_SET_LIST = re.compile(r'\{\{\s*Set list\b(.*?)^\s*\}\}', re.DOTALL | re.IGNORECASE | re.MULTILINE)
+
+# Abréviations des listes Yugipedia absentes de RARETES_CONFIG
+ABREVIATIONS_RARETES_WIKI = {
+    'SP': 'Short Print',
+    'SSP': 'Super Short Print',
+    'GUR': 'Gold Rare',
+    'PGR': 'Premium Gold Rare',
+    'PlR': 'Platinum Rare',
+}
+
+def creer_navigateur_chrome(service):
+    """
+    Lance un Chrome headless allégé : images, polices et CSS bloqués,
+    chargement "eager" (rend la main dès le DOM prêt)
+    
+    Args:
+        service (Service): Service ChromeDriver partagé par le pool
+    
+    Returns:
+        WebDriver: Le navigateur
+    """
+    # Configuration Chrome en mode headless (sans interface)
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Mode sans interface
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+    chrome_options.page_load_strategy = "eager"
+    
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    
+    # Bloquer images, polices et CSS (les préférences ne couvrent pas toutes les requêtes)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": RESSOURCES_BLOQUEES})
+    
+    # Masquer les traces de Selenium sur toutes les pages chargées par ce navigateur
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    })
+    return driver
+
+class PoolNavigateurs:
+    """Navigateurs headless gardés ouverts d'une extraction à l'autre"""
+    
+    def __init__(self, taille=TAILLE_POOL_NAVIGATEURS, fabrique=None):
+        """
+        Args:
+            taille (int): Nombre maximal de navigateurs ouverts en même temps
+            fabrique (callable, optional): Crée un navigateur (Chrome headless allégé par défaut)
+        """
+        self.taille = max(1, taille)
+        self._fabrique = fabrique
+        # Pile des navigateurs libres : le dernier rendu est le premier prêté
+        self._libres = []
+        # Réveille les appelants en attente à chaque navigateur rendu, jeté ou à la fermeture
+        self._condition = threading.Condition()
+        self._verrou_service = threading.Lock()
+        self._nb_ouverts = 0
+        self._ferme = False
+        self.nb_demarrages = 0
+    
+    def _creer(self):
+        with self._verrou_service:
+            if self._fabrique is None:
+                # ChromeDriverManager().install() une seule fois pour tout le pool
+                service = Service(ChromeDriverManager().install())
+                self._fabrique = lambda: creer_navigateur_chrome(service)
+        
+        print("🤖 Lancement du navigateur automatisé...")
+        driver = self._fabrique()
+        with self._condition:
+            self.nb_demarrages += 1
+        return driver
+    
+    def _obtenir(self):
+        """Retourne (navigateur libre ou None, True s'il faut en lancer un)"""
+        with self._condition:
+            while True:
+                if self._ferme:
+                    raise RuntimeError("Pool de navigateurs fermé")
+                if self._libres:
+                    return self._libres.pop(), False
+                # Une place libérée par un navigateur jeté permet d'en relancer un
+                if self._nb_ouverts < self.taille:
+                    self._nb_ouverts += 1
+                    return None, True
+                self._condition.wait()
+    
+    @contextmanager
+    def navigateur(self):
+        """
+        Prête un navigateur du pool (en lance un s'il en reste la place,
+        attend qu'un autre soit rendu ou jeté sinon)
+        
+        Un navigateur qui a levé une erreur est fermé plutôt que rendu au pool.
+        
+        Raises:
+            RuntimeError: Pool fermé avant ou pendant l'attente
+        """
+        driver, lancer = self._obtenir()
+        if lancer:
+            try:
+                driver = self._creer()
+            except BaseException:
+                with self._condition:
+                    self._nb_ouverts -= 1
+                    self._condition.notify()
+                raise
+        
+        try:
+            yield driver
+        except BaseException:
+            self._jeter(driver)
+            raise
+        
+        with self._condition:
+            if not self._ferme:
+                self._libres.append(driver)
+                self._condition.notify()
+                return
+        self._jeter(driver)
+    
+    def _jeter(self, driver):
+        with self._condition:
+            self._nb_ouverts -= 1
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def fermer(self):
+        """
+        Ferme les navigateurs inactifs ; ceux encore prêtés seront fermés à leur
+        retour, et les appelants en attente reçoivent une RuntimeError
+        """
+        with self._condition:
+            self._ferme = True
+            libres, self._libres = self._libres, []
+            self._condition.notify_all()
+        for driver in libres:
+            self._jeter(driver)
+
+_pool_navigateurs = None
+_verrou_pool = threading.Lock()
+
+def configurer_pool_navigateurs(taille):
+    """
+    Change le nombre de navigateurs gardés ouverts (l'ancien pool est fermé,
+    le suivant est créé à la taille voulue)
+    
+    Args:
+        taille (int): Nombre maximal de navigateurs ouverts en même temps
+    """
+    global TAILLE_POOL_NAVIGATEURS
+    TAILLE_POOL_NAVIGATEURS = max(1, taille)
+    fermer_pool_navigateurs()
+
+def obtenir_pool_navigateurs():
+    """Pool partagé, créé au premier besoin"""
+    global _pool_navigateurs
+    with _verrou_pool:
+        if _pool_navigateurs is None:
+            _pool_navigateurs = PoolNavigateurs(TAILLE_POOL_NAVIGATEURS)
+        return _pool_navigateurs
+
+@atexit.register
+def fermer_pool_navigateurs():
+    """Ferme les navigateurs du pool partagé (appelé aussi à la sortie du programme)"""
+    global _pool_navigateurs
+    with _verrou_pool:
+        pool, _pool_navigateurs = _pool_navigateurs, None
+    if pool:
+        pool.fermer()
+
 def recuperer_contenu_selenium(url):
     """
     Utilise Selenium pour récupérer le contenu (contourne les protections anti-bot)
     
+    Le navigateur vient du pool partagé : seule la première extraction paie
+    son démarrage.
+    
     Args:
         url (str): L'URL de la page
     
@@ -39,156 +311,518 @@ def recuperer_contenu_selenium(url):
         return None
     
     try:
-        print("🤖 Lancement du navigateur automatisé...")
-        
-        # Configuration Chrome en mode headless (sans interface)
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Mode sans interface
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Installer et utiliser ChromeDriver automatiquement
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Masquer les traces de Selenium
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        print(f"🌐 Chargement de la page: {url}")
-        driver.get(url)
-        
-        # Attendre que la page se charge complètement
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "tbody"))
-        )
-        
-        # Récupérer le HTML complet
-        page_source = driver.page_source
-        
-        # Fermer le navigateur
-        driver.quit()
-        
-        # Chercher tous les tbody et filtrer celui qui contient des cartes
-        pattern_tbody = r'<tbody>.*?</tbody>'
-        matches = re.findall(pattern_tbody, page_source, re.DOTALL | re.IGNORECASE)
-        
-        print(f"🔍 Trouvé {len(matches)} tableaux sur la page")
-        
-        for i, tbody in enumerate(matches):
-            # Chercher des codes de cartes avec plusieurs patterns
-            patterns_cartes = [
-                r'[A-Z]{4}-FR\d+',           # Pattern standard (BLMM, CYAC, etc.)
-                r'[A-Z]{2}\d{2}-FR\d+',      # Pattern RA02, MP24, etc. (2 lettres + 2 chiffres)
-                r'[A-Z0-9]{4}-FR\d+',        # Pattern mixte lettres/chiffres
-                r'RA02-FR\d+',               # Pattern spécifique RA02
-                r'href="[^"]*-FR\d+'         # Liens vers les cartes
-            ]
+        with obtenir_pool_navigateurs().navigateur() as driver:
+            attendre_tour(url)
+            print(f"🌐 Chargement de la page: {url}")
+            driver.get(url)
             
-            carte_trouvee = False
-            for j, pattern in enumerate(patterns_cartes):
-                matches_pattern = re.findall(pattern, tbody)
-                if matches_pattern:
-                    print(f"✅ Tableau #{i+1} avec cartes trouvé! (Pattern {j+1}: {len(matches_pattern)} cartes)")
-                    print(f"📊 Taille: {len(tbody)} caractères")
-                    print(f"🔍 Exemples trouvés: {matches_pattern[:3]}")
-                    return tbody
+            # Attendre que le tableau des cartes soit dans le DOM
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "tbody"))
+            )
             
-            if not carte_trouvee:
-                print(f"⏭️  Tableau #{i+1} sans cartes (taille: {len(tbody)} chars)")
+            # Récupérer le HTML complet
+            page_source = driver.page_source
         
-        print("❌ Aucun tableau contenant des cartes trouvé")
-        return None
-            
+        # Garder la page rendue : elle pourra être ré-analysée hors ligne
+        obtenir_cache_pages().enregistrer(url, page_source)
+        return extraire_section_cartes(page_source)
+    
     except Exception as e:
         print(f"❌ Erreur Selenium: {e}")
-        if 'driver' in locals():
-            driver.quit()
         return None
 
+def extraire_section_cartes(page_html):
+    """
+    Extrait d'une page complète le premier tableau contenant des cartes
+    
+    Args:
+        page_html (str): HTML de la page
+    
+    Returns:
+        str: Le <tbody> des cartes (ou leurs lignes <tr> sans tbody), None sinon
+    """
+    # Chercher tous les tbody et filtrer celui qui contient des cartes
+    pattern_tbody = r'<tbody>.*?</tbody>'
+    matches = re.findall(pattern_tbody, page_html, re.DOTALL | re.IGNORECASE)
+    
+    print(f"🔍 Trouvé {len(matches)} tableaux sur la page")
+    
+    for i, tbody in enumerate(matches):
+        # Chercher des codes de cartes avec plusieurs patterns
+        patterns_cartes = [
+            r'[A-Z]{4}-FR\d+',           # Pattern standard (BLMM, CYAC, etc.)
+            r'[A-Z]{2}\d{2}-FR\d+',      # Pattern RA02, MP24, etc. (2 lettres + 2 chiffres)
+            r'[A-Z0-9]{4}-FR\d+',        # Pattern mixte lettres/chiffres
+            r'RA02-FR\d+',               # Pattern spécifique RA02
+            r'href="[^"]*-FR\d+'         # Liens vers les cartes
+        ]
+        
+        for j, pattern in enumerate(patterns_cartes):
+            matches_pattern = re.findall(pattern, tbody)
+            if matches_pattern:
+                print(f"✅ Tableau #{i+1} avec cartes trouvé! (Pattern {j+1}: {len(matches_pattern)} cartes)")
+                print(f"📊 Taille: {len(tbody)} caractères")
+                print(f"🔍 Exemples trouvés: {matches_pattern[:3]}")
+                return tbody
+        
+        print(f"⏭️  Tableau #{i+1} sans cartes (taille: {len(tbody)} chars)")
+    
+    # Essayer de chercher directement les lignes de cartes
+    pattern_tr = r'<tr>.*?</tr>'
+    matches_tr = re.findall(pattern_tr, page_html, re.DOTALL | re.IGNORECASE)
+    
+    # Filtrer pour ne garder que les lignes contenant des références de cartes
+    lignes_cartes = [tr for tr in matches_tr if re.search(r'[A-Z0-9]{3,4}-FR\d+', tr)]
+    if lignes_cartes:
+        print(f"Lignes de cartes trouvées directement! ({len(lignes_cartes)} cartes)")
+        return ''.join(lignes_cartes)
+    
+    print("❌ Aucun tableau contenant des cartes trouvé")
+    return None
+
+_cache_pages = None
+_sessions = threading.local()
+_limites_sites = {}
+_verrou_limites = threading.Lock()
+
+def obtenir_cache_pages():
+    """Cache disque partagé des pages téléchargées"""
+    global _cache_pages
+    if _cache_pages is None:
+        _cache_pages = CachePages()
+    return _cache_pages
+
+def configurer_cache_pages(dossier):
+    """
+    Change le dossier du cache partagé des pages
+    
+    Args:
+        dossier (str): Dossier du cache (créé au premier enregistrement)
+    """
+    global _cache_pages
+    _cache_pages = CachePages(Path(dossier))
+
+def obtenir_session():
+    """Session HTTP du thread courant, gardée ouverte (cookies, connexions keep-alive)"""
+    session = getattr(_sessions, 'session', None)
+    if session is None:
+        session = _sessions.session = requests.Session()
+        session.headers.update(ENTETES_HTTP)
+    return session
+
+class CircuitOuvert(requests.exceptions.RequestException):
+    """Site évité après trop d'échecs consécutifs (disjoncteur ouvert)"""
+
+class SeauJetons:
+    """Limiteur de débit : `debit` jetons par seconde, au plus `rafale` d'avance"""
+    
+    def __init__(self, debit, rafale):
+        self.debit = debit
+        self.rafale = max(1, rafale)
+        self._jetons = float(self.rafale)
+        self._instant = time.monotonic()
+        self._verrou = threading.Lock()
+    
+    def prendre(self):
+        """Prend un jeton, en attendant qu'il y en ait un"""
+        with self._verrou:
+            maintenant = time.monotonic()
+            self._jetons = min(self.rafale, self._jetons + (maintenant - self._instant) * self.debit)
+            self._instant = maintenant
+            # Le jeton est réservé tout de suite : les appels suivants attendent leur tour
+            self._jetons -= 1
+            attente = -self._jetons / self.debit if self._jetons < 0 else 0
+        if attente > 0:
+            time.sleep(attente)
+
+class Disjoncteur:
+    """Coupe les requêtes vers un site après `seuil` échecs consécutifs, pendant `duree` secondes"""
+    
+    def __init__(self, seuil, duree):
+        self.seuil = seuil
+        self.duree = duree
+        self._echecs = 0
+        self._ouvert_jusqua = 0.0
+        self._verrou = threading.Lock()
+    
+    def verifier(self, site):
+        """Lève CircuitOuvert si le site est encore évité (un essai est permis ensuite)"""
+        with self._verrou:
+            restant = self._ouvert_jusqua - time.monotonic()
+            if self._echecs >= self.seuil and restant > 0:
+                raise CircuitOuvert(f"{site} évité encore {restant:.0f} s après {self._echecs} échecs")
+    
+    def succes(self):
+        with self._verrou:
+            self._echecs = 0
+    
+    def echec(self):
+        with self._verrou:
+            self._echecs += 1
+            if self._echecs >= self.seuil:
+                self._ouvert_jusqua = time.monotonic() + self.duree
+
+def limites_site(url):
+    """
+    Seau à jetons et disjoncteur du site d'une URL (partagés par tous les threads)
+    
+    Returns:
+        tuple: (site, SeauJetons, Disjoncteur)
+    """
+    site = urlsplit(url).netloc
+    with _verrou_limites:
+        limites = _limites_sites.get(site)
+        if limites is None:
+            limites = _limites_sites[site] = (
+                SeauJetons(DEBIT_REQUETES_PAR_SITE, RAFALE_REQUETES_PAR_SITE),
+                Disjoncteur(SEUIL_DISJONCTEUR, DUREE_DISJONCTEUR)
+            )
+    return (site,) + limites
+
+def configurer_limites_sites(debit=None, rafale=None, seuil=None, duree=None):
+    """
+    Change la politesse par site (les limites en cours sont réinitialisées)
+    
+    Args:
+        debit (float, optional): Requêtes par seconde et par site
+        rafale (int, optional): Requêtes permises d'affilée
+        seuil (int, optional): Échecs consécutifs avant d'éviter un site
+        duree (float, optional): Durée pendant laquelle le site est évité (secondes)
+    """
+    global DEBIT_REQUETES_PAR_SITE, RAFALE_REQUETES_PAR_SITE, SEUIL_DISJONCTEUR, DUREE_DISJONCTEUR
+    with _verrou_limites:
+        if debit is not None:
+            DEBIT_REQUETES_PAR_SITE = debit
+        if rafale is not None:
+            RAFALE_REQUETES_PAR_SITE = rafale
+        if seuil is not None:
+            SEUIL_DISJONCTEUR = seuil
+        if duree is not None:
+            DUREE_DISJONCTEUR = duree
+        _limites_sites.clear()
+
+def attendre_tour(url):
+    """Attend un jeton du site de l'URL ; lève CircuitOuvert si le site est évité"""
+    site, seau, disjoncteur = limites_site(url)
+    disjoncteur.verifier(site)
+    seau.prendre()
+
+def delai_reessai(tentative, response=None):
+    """Attente avant le réessai n° `tentative` : Retry-After, sinon exponentielle avec gigue"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), DELAI_MAX_REESSAI)
+    return min(DELAI_BASE_REESSAI * 2 ** tentative, DELAI_MAX_REESSAI) * random.uniform(0.5, 1.0)
+
+def requete_http(url, entetes=None):
+    """
+    GET poli : jeton du site, réessais des erreurs temporaires, disjoncteur
+    
+    Args:
+        url (str): L'URL demandée
+        entetes (dict, optional): En-têtes supplémentaires (revalidation)
+    
+    Returns:
+        requests.Response: Réponse définitive (2xx, 304 ou erreur non temporaire)
+    
+    Raises:
+        requests.exceptions.RequestException: Échec après NB_TENTATIVES ou site évité
+    """
+    site, _, disjoncteur = limites_site(url)
+    
+    for tentative in range(NB_TENTATIVES):
+        attendre_tour(url)
+        response = None
+        try:
+            response = obtenir_session().get(url, headers=entetes, timeout=30)
+            if response.status_code not in STATUTS_A_REESSAYER:
+                disjoncteur.succes()
+                return response
+            erreur = requests.exceptions.HTTPError(f"HTTP {response.status_code} pour {url}", response=response)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            erreur = e
+        
+        disjoncteur.echec()
+        if tentative + 1 < NB_TENTATIVES:
+            delai = delai_reessai(tentative, response)
+            print(f"🔁 {site} : {erreur} — nouvel essai dans {delai:.1f} s ({tentative + 2}/{NB_TENTATIVES})")
+            time.sleep(delai)
+    
+    raise erreur
+
+def telecharger_page(url, cache=None):
+    """
+    Télécharge une page en revalidant la copie en cache (GET conditionnel)
+    
+    Une réponse 304 renvoie la copie en cache ; une réponse 200 la remplace.
+    En cas d'erreur réseau, la copie en cache est utilisée si elle existe.
+    
+    Args:
+        url (str): L'URL de la page
+        cache (CachePages, optional): Cache des pages (cache partagé par défaut)
+    
+    Returns:
+        str: Le HTML complet de la page, ou None en cas d'erreur sans copie en cache
+    """
+    cache = cache or obtenir_cache_pages()
+    entetes = cache.entetes_conditionnels(url)
+    
+    try:
+        response = requete_http(url, entetes)
+        
+        if response.status_code == 304:
+            contenu = cache.lire(url)
+            if contenu is not None:
+                cache.rafraichir(url)
+                print(f"♻️ Page inchangée depuis le dernier téléchargement (304) : {url}")
+                return contenu
+            # Copie disparue entre-temps : tout retélécharger
+            response = requete_http(url)
+        
+        response.raise_for_status()  # Lève une exception si le statut HTTP indique une erreur
+        cache.enregistrer(url, response.text, response.headers.get('ETag'),
+                          response.headers.get('Last-Modified'))
+        return response.text
+    
+    except requests.exceptions.RequestException as e:
+        contenu = cache.lire(url)
+        if contenu is not None:
+            print(f"⚠️ {e} : copie en cache utilisée")
+        return contenu
+
 def recuperer_contenu_web(url):
     """
     Récupère le contenu HTML d'une page web et extrait la section contenant les cartes
     
+    La page passe par le cache disque : une liste inchangée ne coûte qu'un
+    aller-retour 304.
+    
     Args:
         url (str): L'URL de la page contenant les informations des cartes
     
     Returns:
         str: Le contenu HTML de la section avec les cartes, ou None en cas d'erreur
     """
+    print(f"Récupération du contenu depuis: {url}")
     try:
-        # Headers pour simuler un navigateur web normal et contourner les protections anti-bot
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        print(f"Récupération du contenu depuis: {url}")
-        
-        # Créer une session pour maintenir les cookies
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        # Attendre un peu pour simuler un comportement humain
-        time.sleep(2)
-        
-        response = session.get(url, timeout=30)
-        response.raise_for_status()  # Lève une exception si le statut HTTP indique une erreur
-        
-        # Le contenu HTML complet
-        html_content = response.text
-        
-        # Chercher la section contenant le tableau des cartes
-        # Pattern pour trouver le tbody contenant les cartes
-        pattern_tbody = r'<tbody>.*?</tbody>'
-        match = re.search(pattern_tbody, html_content, re.DOTALL | re.IGNORECASE)
-        
-        if match:
-            tbody_content = match.group(0)
-            print(f"Section des cartes trouvée! ({len(tbody_content)} caractères)")
-            return tbody_content
-        else:
-            print("⚠️  Aucune section <tbody> trouvée dans la page")
-            # Essayer de chercher directement les lignes de cartes
-            pattern_tr = r'<tr>.*?</tr>'
-            matches_tr = re.findall(pattern_tr, html_content, re.DOTALL | re.IGNORECASE)
-            
-            # Filtrer pour ne garder que les lignes contenant des références de cartes
-            lignes_cartes = []
-            for tr in matches_tr:
-                if re.search(r'[A-Z]{4}-FR\d+', tr):  # Pattern générique pour les codes de cartes
-                    lignes_cartes.append(tr)
-            
-            if lignes_cartes:
-                contenu_cartes = ''.join(lignes_cartes)
-                print(f"Lignes de cartes trouvées directement! ({len(lignes_cartes)} cartes)")
-                return contenu_cartes
-            else:
-                print("❌ Aucune carte trouvée dans la page")
-                return None
-                
-    except requests.exceptions.Timeout:
-        print("❌ Erreur: Timeout lors de la récupération de la page")
+        html_content = telecharger_page(url)
+    except Exception as e:
+        print(f"❌ Erreur lors de la récupération du contenu web: {e}")
         return None
-    except requests.exceptions.ConnectionError:
-        print("❌ Erreur: Impossible de se connecter au site")
+    
+    if html_content is None:
+        print("❌ Erreur: Impossible de récupérer la page")
         return None
-    except requests.exceptions.HTTPError as e:
-        print(f"❌ Erreur HTTP: {e}")
+    return extraire_section_cartes(html_content)
+
+def reanalyser_cache(cache=None):
+    """
+    Ré-analyse hors ligne les pages en cache (après une amélioration du parseur)
+    
+    Args:
+        cache (CachePages, optional): Cache des pages (cache partagé par défaut)
+    
+    Returns:
+        dict: {url: liste de CarteExtraite}
+    """
+    cache = cache or obtenir_cache_pages()
+    resultats = {}
+    for url in cache.urls():
+        if urlsplit(url).path.endswith('/api.php'):
+            continue  # Réponses de l'API : déjà structurées
+        page_html = cache.lire(url)
+        section = extraire_section_cartes(page_html) if page_html else None
+        resultats[url] = analyser_cartes(section) if section else []
+    return resultats
+
+_normaliseur_raretes = None
+_noms_francais = {}
+
+def url_api_mediawiki(url):
+    """
+    Point d'accès de l'API et titre de la page d'une URL de wiki
+    Ex: https://yugipedia.com/wiki/Set_Card_Lists:X_(TCG-FR)
+        -> ("https://yugipedia.com/api.php", "Set Card Lists:X (TCG-FR)")
+    
+    Returns:
+        tuple: (url_api, titre), None si l'URL ne désigne pas une page de wiki
+    """
+    morceaux = urlsplit(url)
+    if morceaux.path.startswith('/wiki/'):
+        titre = unquote(morceaux.path[len('/wiki/'):])
+    else:
+        titre = parse_qs(morceaux.query).get('title', [None])[0]
+    if not titre:
         return None
-    except Exception as e:
-        print(f"❌ Erreur lors de la récupération du contenu web: {e}")
+    return f"{morceaux.scheme}://{morceaux.netloc}/api.php", titre.replace('_', ' ')
+
+def requete_api(url_api, parametres):
+    """
+    Appel de l'API MediaWiki (même cache et même politesse que les pages)
+    
+    Args:
+        url_api (str): Point d'accès (…/api.php)
+        parametres (dict): Paramètres de la requête (format=json ajouté)
+    
+    Returns:
+        dict: Réponse JSON, None si l'appel ou l'API a échoué
+    """
+    url = f"{url_api}?{urlencode(dict(parametres, format='json'))}"
+    contenu = telecharger_page(url)
+    if contenu is None:
         return None
+    
+    try:
+        donnees = json.loads(contenu)
+    except ValueError:
+        print(f"❌ Réponse illisible de l'API : {url_api}")
+        return None
+    if 'error' in donnees:
+        print(f"❌ API MediaWiki : {donnees['error'].get('info', donnees['error'])}")
+        return None
+    return donnees
+
+def rarete_wiki(abreviation):
+    """Nom complet d'une rareté de liste Yugipedia (ex. "ScR" -> "Secret Rare")"""
+    global _normaliseur_raretes
+    if abreviation in ABREVIATIONS_RARETES_WIKI:
+        return ABREVIATIONS_RARETES_WIKI[abreviation]
+    if _normaliseur_raretes is None:
+        _normaliseur_raretes = NormaliseurRaretes()
+    return _normaliseur_raretes.canonique(abreviation) or abreviation
+
+def lire_set_list(wikitext):
+    """
+    Lit les lignes de cartes des modèles {{Set list}} d'un wikitext
+    Ligne : "numéro; page de la carte; raretés; ... // option::valeur; ..."
+    Sans raretés sur la ligne, celles du paramètre "rarities" du modèle s'appliquent.
+    
+    Args:
+        wikitext (str): Source de la page de liste
+    
+    Returns:
+        list: Tuples (numéro, page de la carte, raretés, options)
+    """
+    def separer(valeur):
+        return [rarete_wiki(r.strip()) for r in valeur.split(',') if r.strip()]
+    
+    wikitext = re.sub(r'<!--.*?-->', '', wikitext, flags=re.DOTALL)
+    lignes_cartes = []
+    
+    for bloc in MOTIF_SET_LIST.finditer(wikitext):
+        raretes_defaut = []
+        for ligne in bloc.group(1).splitlines():
+            ligne = ligne.strip()
+            if ';' not in ligne:
+                # Paramètres du modèle ("|region=FR|rarities=C, R")
+                for parametre in ligne.split('|'):
+                    nom, egal, valeur = parametre.partition('=')
+                    if egal and nom.strip() == 'rarities':
+                        raretes_defaut = separer(valeur)
+                continue
+            
+            champs_texte, _, options_texte = ligne.partition('//')
+            champs = [champ.strip() for champ in champs_texte.split(';')]
+            if not MOTIF_NUMERO_CELLULE.fullmatch(champs[0]) or not champs[1]:
+                continue
+            
+            raretes = separer(champs[2]) if len(champs) > 2 and champs[2] else raretes_defaut
+            options = {}
+            for option in options_texte.split(';'):
+                cle, double_points, valeur = option.partition('::')
+                if double_points:
+                    options[cle.strip()] = valeur.strip()
+            lignes_cartes.append((champs[0], champs[1], raretes, options))
+    
+    return lignes_cartes
+
+def noms_francais_api(url_api, pages):
+    """
+    Noms français des cartes par requêtes sémantiques "ask" groupées
+    
+    Les lots partent en parallèle (le seau à jetons du site reste le seul
+    frein) et les noms trouvés sont gardés pour les séries suivantes : une
+    carte rééditée n'est demandée qu'une fois par session.
+    
+    Args:
+        url_api (str): Point d'accès (…/api.php)
+        pages (list): Titres des pages des cartes
+    
+    Returns:
+        dict: {page: nom français} (les pages sans nom français sont absentes ;
+        peut contenir des pages demandées pour d'autres séries)
+    """
+    connus = _noms_francais.setdefault(url_api, {})
+    pages = [page for page in dict.fromkeys(pages) if page not in connus]
+    lots = [pages[debut:debut + TAILLE_LOT_ASK] for debut in range(0, len(pages), TAILLE_LOT_ASK)]
+    
+    def demander(lot):
+        requete = f"[[:{'||'.join(lot)}]]|?{PROPRIETE_NOM_FRANCAIS}|limit={len(lot)}"
+        donnees = requete_api(url_api, {'action': 'ask', 'query': requete})
+        resultats = (donnees or {}).get('query', {}).get('results') or {}
+        if isinstance(resultats, list):  # formatversion=2
+            resultats = {resultat.get('fulltext'): resultat for resultat in resultats}
+        
+        noms = {}
+        for page, resultat in resultats.items():
+            valeurs = resultat.get('printouts', {}).get(PROPRIETE_NOM_FRANCAIS) or []
+            if valeurs and isinstance(valeurs[0], str):
+                noms[page] = unescape(valeurs[0])
+        return noms
+    
+    if lots:
+        with ThreadPoolExecutor(max_workers=min(len(lots), NB_EXTRACTIONS_PARALLELES)) as executeur:
+            for noms in executeur.map(demander, lots):
+                connus.update(noms)
+    return connus
+
+def extraire_cartes_api(url):
+    """
+    Extrait les cartes par l'API MediaWiki : wikitext de la liste (action=parse)
+    puis noms français (action=ask), sans rendu de la page
+    
+    Args:
+        url (str): URL de la page de liste sur le wiki
+    
+    Returns:
+        list: Liste de CarteExtraite (vide si l'API ne donne rien d'exploitable)
+    """
+    cible = url_api_mediawiki(url)
+    if cible is None:
+        return []
+    url_api, titre = cible
+    
+    print(f"🧩 Liste demandée à l'API MediaWiki : {titre}")
+    donnees = requete_api(url_api, {'action': 'parse', 'page': titre, 'prop': 'wikitext',
+                                    'formatversion': '2'})
+    if donnees is None:
+        return []
+    
+    wikitext = donnees.get('parse', {}).get('wikitext', '')
+    if isinstance(wikitext, dict):  # formatversion=1 : {"*": "..."}
+        wikitext = wikitext.get('*', '')
+    lignes = lire_set_list(wikitext)
+    if not lignes:
+        print("⚠️ Aucun modèle {{Set list}} exploitable dans le wikitext")
+        return []
+    
+    noms = noms_francais_api(url_api, [page for _, page, _, options in lignes
+                                       if 'printed-name' not in options])
+    cartes = []
+    sans_nom = 0
+    for numero, page, raretes, options in lignes:
+        nom = options.get('printed-name') or noms.get(page)
+        if nom is None:
+            # Nom de la page à défaut (sans précision d'homonymie)
+            nom = re.sub(r'\s*\([^)]*\)$', '', page)
+            sans_nom += 1
+        cartes.append(CarteExtraite(numero, nom, raretes))
+    
+    print(f"✅ {len(cartes)} cartes lues par l'API")
+    if sans_nom:
+        print(f"⚠️ {sans_nom} cartes sans nom français : nom de la page conservé")
+    return cartes
 
 def extraire_cartes_depuis_fichier():
     """
@@ -211,120 +845,46 @@ def extraire_cartes_depuis_fichier():
     print(f"❌ Aucun fichier trouvé parmi: {', '.join(fichiers_possibles)}")
     return None
 
-def extraire_cartes_blmm(url=None):
+def extraire_cartes_blmm(url=None, secours_fichier=True):
     """
     Extrait toutes les cartes depuis une URL ou un fichier local
     
     Args:
         url (str, optional): URL de la page contenant les cartes. Si None, utilise le fichier local.
+        secours_fichier (bool): Lire le fichier local si la page n'a rien donné
     
     Returns:
-        list: Liste de dictionnaires avec nom, numero et rareté
+        list: Liste de CarteExtraite (numéro, nom, toutes les raretés, série)
     """
     cartes = []
     
+    def depuis_html(recuperer):
+        def source(url):
+            contenu = recuperer(url)
+            return analyser_cartes(contenu) if contenu else []
+        return source
+    
     try:
-        # Récupérer le contenu soit depuis l'URL soit depuis le fichier
+        # Sources dans l'ordre, chacune avec le message affiché si elle ne donne rien
         if url:
-            # Essayer d'abord Selenium (plus efficace contre les protections)
-            contenu = recuperer_contenu_selenium(url)
-            
-            # Si Selenium échoue, essayer requests classique
-            if not contenu:
-                print("🔄 Tentative avec requests classique...")
-                contenu = recuperer_contenu_web(url)
-            
-            # Si tout échoue, utiliser le fichier local
-            if not contenu:
-                print("🔄 Échec de la récupération web, tentative avec le fichier local...")
-                contenu = extraire_cartes_depuis_fichier()
+            # HTTP simple d'abord (avec cache), puis l'API MediaWiki, le navigateur en dernier recours
+            suite = "par l'API MediaWiki" if UTILISER_API_MEDIAWIKI else "avec le navigateur"
+            sources = [(depuis_html(recuperer_contenu_web), f"🔄 Page incomplète en HTTP simple, tentative {suite}...")]
+            if UTILISER_API_MEDIAWIKI:
+                sources.append((extraire_cartes_api, "🔄 Rien d'exploitable par l'API, tentative avec le navigateur..."))
+            sources.append((depuis_html(recuperer_contenu_selenium),
+                            "🔄 Échec de la récupération web, tentative avec le fichier local..." if secours_fichier else None))
+            if secours_fichier:
+                sources.append((depuis_html(lambda _: extraire_cartes_depuis_fichier()), None))
         else:
-            contenu = extraire_cartes_depuis_fichier()
-        
-        if not contenu:
-            return []
+            sources = [(depuis_html(lambda _: extraire_cartes_depuis_fichier()), None)]
         
-        # DEBUG: Afficher un extrait du contenu récupéré
-        print(f"🔍 Extrait du contenu récupéré (500 premiers caractères):")
-        print(contenu[:500])
-        print("..." if len(contenu) > 500 else "")
-        
-        # Diviser le contenu en lignes de cartes
-        lignes_tr = re.findall(r'<tr>.*?</tr>', contenu, re.DOTALL)
-        
-        for ligne in lignes_tr:
-            # Extraire le numéro de carte - patterns multiples pour différents sets
-            patterns_numero = [
-                r'<a href="[^"]*?([A-Z]{4}-FR\d+)"',     # Standard 4 lettres
-                r'<a href="[^"]*?([A-Z]{2}\d{2}-FR\d+)"', # RA02, MP24, etc.
-                r'<a href="[^"]*?([A-Z0-9]{4}-FR\d+)"',  # Mixte lettres/chiffres
-                r'title="([A-Z]{2}\d{2}-FR\d+)"',        # Dans les titres
-                r'([A-Z]{2}\d{2}-FR\d+)',                # Pattern direct RA02
-                r'([A-Z]{4}-FR\d+)',                     # Pattern direct standard
-            ]
-            
-            numero = None
-            for pattern in patterns_numero:
-                match_numero = re.search(pattern, ligne)
-                if match_numero:
-                    numero = match_numero.group(1)
-                    break
-            
-            if not numero:
-                continue
-            
-            # Extraire le nom français
-            nom_francais = "Nom non trouvé"
-            
-            # Chercher d'abord dans un span lang="fr" - gérer les guillemets imbriqués
-            match_nom_fr = re.search(r'<span lang="fr">"(.*?)"</span>', ligne, re.DOTALL)
-            if match_nom_fr:
-                nom_francais = match_nom_fr.group(1)
-            else:
-                # Si pas de span, chercher dans les td directement
-                tds = re.findall(r'<td>([^<]*)</td>', ligne)
-                if len(tds) >= 2:
-                    # Essayer de prendre le deuxième td qui pourrait être le nom français
-                    potential_name = tds[1].strip()
-                    if potential_name and potential_name.startswith('"') and potential_name.endswith('"'):
-                        nom_francais = potential_name[1:-1]  # Enlever les guillemets
-            
-            # Nettoyer le nom français
-            nom_francais = unescape(nom_francais.strip())
-            
-            # Extraire les raretés avec patterns améliorés
-            raretes = []
-            patterns_rarete = [
-                r'title="([^"]*(?:Rare|Common)[^"]*)"',    # Pattern principal
-                r'alt="([^"]*(?:Rare|Common)[^"]*)"',      # Pattern alternatif
-                r'>([^<]*(?:Rare|Common)[^<]*)<',          # Dans le texte direct
-            ]
-            
-            for pattern in patterns_rarete:
-                matches_rarete = re.findall(pattern, ligne)
-                for rarete in matches_rarete:
-                    rarete_clean = rarete.strip()
-                    if rarete_clean and rarete_clean not in raretes:
-                        raretes.append(rarete_clean)
-            
-            # Limiter le nombre de raretés pour éviter les chaînes trop longues
-            if len(raretes) > 8:  # Limiter à 8 raretés max
-                raretes = raretes[:8]
-                raretes.append("...")  # Indiquer qu'il y en a plus
-            
-            rarete_finale = " / ".join(raretes) if raretes else "Rareté non trouvée"
-            
-            # Limiter la longueur totale de la chaîne de rareté
-            if len(rarete_finale) > 200:  # Limiter à 200 caractères
-                rarete_finale = rarete_finale[:197] + "..."
-            
-            carte = {
-                'numero': numero,
-                'nom': nom_francais,
-                'rarete': rarete_finale
-            }
-            
-            cartes.append(carte)
+        for source, message_echec in sources:
+            cartes = source(url)
+            if cartes:
+                break
+            if message_echec:
+                print(message_echec)
     
     except Exception as e:
         print(f"Erreur lors du traitement des données: {e}")
@@ -332,22 +892,189 @@ def extraire_cartes_blmm(url=None):
     
     return cartes
 
-def extraire_code_serie(numero_carte):
+def analyser_cartes(contenu):
+    """
+    Analyse le HTML d'une liste de set : tables à en-têtes avec lxml, sinon
+    ligne par ligne par expressions régulières
+    
+    Args:
+        contenu (str): HTML de la page ou de la section des cartes
+    
+    Returns:
+        list: Liste de CarteExtraite
+    """
+    if LXML_AVAILABLE:
+        cartes = extraire_cartes_lxml(contenu)
+        if cartes:
+            return cartes
+        print("🔄 Aucune table à en-têtes reconnue, analyse par expressions régulières...")
+    return extraire_cartes_regex(contenu)
+
+def colonnes_entete(cellules):
+    """
+    Repère les colonnes numéro / nom français / rareté d'une ligne d'en-tête
+    
+    Returns:
+        dict: {'numero': i, 'nom': j, 'rarete': k} ('nom' optionnel), ou None
+        si la ligne n'est pas l'en-tête d'une liste de cartes
+    """
+    textes = [' '.join(''.join(cellule.itertext()).split()).casefold() for cellule in cellules]
+    colonnes = {}
+    for cle, libelles in ENTETES_COLONNES.items():
+        for libelle in libelles:
+            index = next((i for i, texte in enumerate(textes) if libelle in texte), None)
+            if index is not None:
+                colonnes[cle] = index
+                break
+    
+    if 'numero' not in colonnes or 'rarete' not in colonnes:
+        return None
+    return colonnes
+
+def extraire_cartes_lxml(contenu):
+    """
+    Analyse les tables de cartes en une seule passe sur l'arbre lxml
+    
+    Chaque ligne d'en-tête (<th> uniquement) fixe les colonnes des lignes qui
+    la suivent : numéro, nom français (span lang="fr" de préférence) et
+    raretés (une par lien ou par ligne de la cellule). Seules ces trois
+    cellules sont lues sur chaque ligne.
+    
+    Args:
+        contenu (str): HTML de la page ou de la section des cartes
+    
+    Returns:
+        list: Liste de CarteExtraite (vide sans table à en-têtes reconnue),
+        None si le HTML est illisible
+    """
+    try:
+        # etree.HTML plutôt que lxml.html : pas de classes d'éléments à résoudre
+        racine = etree.HTML(contenu)
+    except ValueError:
+        return None
+    if racine is None:
+        return None
+    
+    cartes = []
+    colonnes = None
+    
+    for ligne in racine.iter('tr'):
+        if not len(ligne):
+            continue
+        
+        if all(cellule.tag == 'th' for cellule in ligne):
+            colonnes = colonnes_entete(ligne)
+            derniere_colonne = max(colonnes.values()) if colonnes else 0
+            continue
+        
+        if colonnes is None or len(ligne) <= derniere_colonne:
+            continue
+        
+        match_numero = MOTIF_NUMERO_CELLULE.search(''.join(ligne[colonnes['numero']].itertext()))
+        if not match_numero:
+            continue
+        
+        nom_francais = "Nom non trouvé"
+        if 'nom' in colonnes:
+            cellule_nom = ligne[colonnes['nom']]
+            span_fr = cellule_nom.find('.//span[@lang="fr"]')
+            texte_nom = ''.join((cellule_nom if span_fr is None else span_fr).itertext())
+            nom_francais = ' '.join(texte_nom.split()).strip('"“”') or nom_francais
+        
+        raretes = [' '.join(texte.split()) for texte in ligne[colonnes['rarete']].itertext()]
+        cartes.append(CarteExtraite(match_numero.group(0), nom_francais,
+                                    [rarete for rarete in raretes if rarete.strip('/,')]))
+    
+    return cartes
+
+def extraire_cartes_regex(contenu):
     """
-    Extrait le code de série d'un numéro de carte
-    Ex: BLMM-FR001 -> BLMM, RA02-FR001 -> RA02
+    Analyse ligne par ligne par expressions régulières (sans lxml, ou HTML
+    sans en-têtes de colonnes)
+    
+    Args:
+        contenu (str): HTML de la page ou de la section des cartes
+    
+    Returns:
+        list: Liste de CarteExtraite
     """
-    import re
-    match = re.match(r'([A-Z0-9]+)-FR\d+', numero_carte)
-    if match:
-        return match.group(1)
-    return "UNKNOWN"
+    cartes = []
+    
+        # Diviser le contenu en lignes de cartes
+    lignes_tr = re.findall(r'<tr>.*?</tr>', contenu, re.DOTALL)
+    
+    for ligne in lignes_tr:
+        # Extraire le numéro de carte - patterns multiples pour différents sets
+        patterns_numero = [
+            r'<a href="[^"]*?([A-Z]{4}-FR\d+)"',     # Standard 4 lettres
+            r'<a href="[^"]*?([A-Z]{2}\d{2}-FR\d+)"', # RA02, MP24, etc.
+            r'<a href="[^"]*?([A-Z0-9]{4}-FR\d+)"',  # Mixte lettres/chiffres
+            r'title="([A-Z]{2}\d{2}-FR\d+)"',        # Dans les titres
+            r'([A-Z]{2}\d{2}-FR\d+)',                # Pattern direct RA02
+            r'([A-Z]{4}-FR\d+)',                     # Pattern direct standard
+        ]
+        
+        numero = None
+        for pattern in patterns_numero:
+            match_numero = re.search(pattern, ligne)
+            if match_numero:
+                numero = match_numero.group(1)
+                break
+        
+        if not numero:
+            continue
+        
+        # Extraire le nom français
+        nom_francais = "Nom non trouvé"
+        
+        # Chercher d'abord dans un span lang="fr" - gérer les guillemets imbriqués
+        match_nom_fr = re.search(r'<span lang="fr">"(.*?)"</span>', ligne, re.DOTALL)
+        if match_nom_fr:
+            nom_francais = match_nom_fr.group(1)
+        else:
+            # Si pas de span, chercher dans les td directement
+            tds = re.findall(r'<td>([^<]*)</td>', ligne)
+            if len(tds) >= 2:
+                # Essayer de prendre le deuxième td qui pourrait être le nom français
+                potential_name = tds[1].strip()
+                if potential_name and potential_name.startswith('"') and potential_name.endswith('"'):
+                    nom_francais = potential_name[1:-1]  # Enlever les guillemets
+        
+        # Nettoyer le nom français
+        nom_francais = unescape(nom_francais.strip())
+        
+        # Extraire les raretés avec patterns améliorés (toutes, sans doublon)
+        raretes = {}
+        patterns_rarete = [
+            r'title="([^"]*(?:Rare|Common)[^"]*)"',    # Pattern principal
+            r'alt="([^"]*(?:Rare|Common)[^"]*)"',      # Pattern alternatif
+            r'>([^<]*(?:Rare|Common)[^<]*)<',          # Dans le texte direct
+        ]
+        
+        for pattern in patterns_rarete:
+            matches_rarete = re.findall(pattern, ligne)
+            for rarete in matches_rarete:
+                rarete_clean = rarete.strip()
+                if rarete_clean:
+                    raretes[rarete_clean] = None
+        
+        cartes.append(CarteExtraite(numero, nom_francais, raretes))
+    
+    return cartes
 
-def sauvegarder_cartes_csv(cartes, nom_fichier="cartes.csv"):
+def sauvegarder_cartes_csv(cartes, nom_fichier="cartes.csv", dossier=None):
     """
     Sauvegarde la liste des cartes dans un fichier CSV
     Format: Code_Serie, Nom_Carte, Rareté, Numéro_Carte
     Une ligne par rareté si une carte a plusieurs raretés
+    
+    Args:
+        cartes (list): Liste de CarteExtraite
+        nom_fichier (str): Nom du fichier créé dans le dossier temp
+        dossier (str, optional): Dossier de sortie (convertisseur/temp par défaut)
+    
+    Returns:
+        str: Chemin du fichier écrit, None en cas d'erreur
     """
     try:
         import os
@@ -356,38 +1083,23 @@ def sauvegarder_cartes_csv(cartes, nom_fichier="cartes.csv"):
         repertoire_script = os.path.dirname(os.path.abspath(__file__))
         
         # Créer le dossier temp dans le même répertoire que le convertisseur
-        dossier_temp = os.path.join(repertoire_script, "temp")
+        dossier_temp = dossier or os.path.join(repertoire_script, "temp")
         if not os.path.exists(dossier_temp):
-            os.makedirs(dossier_temp)
+            os.makedirs(dossier_temp, exist_ok=True)
             print(f"📁 Dossier créé: {dossier_temp}")
         
         # Construire le chemin complet vers le fichier CSV
         chemin_fichier = os.path.join(dossier_temp, nom_fichier)
         
-        lignes_csv = []
-        
-        for carte in cartes:
-            code_serie = extraire_code_serie(carte['numero'])
-            nom_carte = carte['nom']
-            numero_carte = carte['numero']
-            
-            # Séparer les raretés multiples
-            if ' / ' in carte['rarete']:
-                raretes = [r.strip() for r in carte['rarete'].split(' / ')]
-            else:
-                raretes = [carte['rarete']]
-            
-            # Créer une ligne pour chaque rareté
-            for rarete in raretes:
-                if rarete and rarete != "...":  # Ignorer les "..." ajoutés pour limiter
-                    lignes_csv.append([code_serie, nom_carte, rarete, numero_carte])
+        # Une ligne par rareté, toutes raretés conservées
+        lignes_csv = [ligne for carte in cartes for ligne in carte.lignes_csv()]
         
         # Écrire le fichier CSV dans le dossier temp
         with open(chemin_fichier, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
             
             # En-têtes
-            writer.writerow(['Code_Serie', 'Nom_Carte', 'Rareté', 'Numéro_Carte'])
+            writer.writerow(COLONNES_CSV)
             
             # Données
             writer.writerows(lignes_csv)
@@ -395,9 +1107,11 @@ def sauvegarder_cartes_csv(cartes, nom_fichier="cartes.csv"):
         print(f"Fichier CSV sauvegardé: {chemin_fichier}")
         print(f"Nombre de lignes créées: {len(lignes_csv)} (cartes avec raretés séparées)")
         print(f"Nombre de cartes originales: {len(cartes)}")
+        return chemin_fichier
         
     except Exception as e:
         print(f"Erreur lors de la sauvegarde CSV: {e}")
+        return None
 
 def sauvegarder_cartes_txt(cartes, nom_fichier="cartes_BOLM.txt"):
     """
@@ -409,9 +1123,9 @@ def sauvegarder_cartes_txt(cartes, nom_fichier="cartes_BOLM.txt"):
             f.write("=" * 50 + "\n\n")
             
             for carte in cartes:
-                f.write(f"Numéro: {carte['numero']}\n")
-                f.write(f"Nom: {carte['nom']}\n")
-                f.write(f"Rareté: {carte['rarete']}\n")
+                f.write(f"Numéro: {carte.numero}\n")
+                f.write(f"Nom: {carte.nom}\n")
+                f.write(f"Rareté: {carte.rarete}\n")
                 f.write("-" * 30 + "\n")
         
         print(f"Fichier sauvegardé: {nom_fichier}")
@@ -420,6 +1134,97 @@ def sauvegarder_cartes_txt(cartes, nom_fichier="cartes_BOLM.txt"):
     except Exception as e:
         print(f"Erreur lors de la sauvegarde: {e}")
 
+def collecter_urls_series():
+    """
+    Rassemble les URLs de toutes les séries connues : SETS_PREDEFINED (config.py
+    de la racine), URLS_DEFAUT (shared/config.py) et urls_sauvees.json
+    
+    Returns:
+        dict: {nom de série: url}, une seule entrée par URL
+    """
+    series = {}
+    racine = Path(__file__).parent.parent
+    
+    # config.py de la racine chargé par son chemin : shared/ a aussi un config.py
+    try:
+        spec = importlib.util.spec_from_file_location("config_sets", racine / "config.py")
+        config_sets = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(config_sets)
+        for code, infos in config_sets.SETS_PREDEFINED.items():
+            series.setdefault(code, infos["url"])
+    except (OSError, AttributeError) as e:
+        print(f"⚠️ SETS_PREDEFINED indisponible : {e}")
+    
+    try:
+        from shared.config import URLS_DEFAUT
+    except ImportError:
+        from config import URLS_DEFAUT
+    for code, url in URLS_DEFAUT.items():
+        series.setdefault(code, url)
+    
+    try:
+        from shared.registre_urls import obtenir_registre
+    except ImportError:
+        from registre_urls import obtenir_registre
+    for nom, url in obtenir_registre().obtenir().items():
+        series.setdefault(nom, url)
+    
+    # Une seule extraction par URL (le premier nom trouvé est gardé)
+    par_url = {}
+    for nom, url in series.items():
+        par_url.setdefault(url, nom)
+    return {nom: url for url, nom in par_url.items()}
+
+def nom_fichier_serie(nom):
+    """Nom de fichier CSV d'une série ("BLMM - Monster Mayhem" -> "BLMM.csv")"""
+    code = nom.split(" - ")[0].strip()
+    return re.sub(r'[^\w-]+', '_', code).strip('_') + ".csv"
+
+def extraire_series_en_lot(series=None, nb_paralleles=NB_EXTRACTIONS_PARALLELES, dossier=None, rappel=None):
+    """
+    Extrait plusieurs séries en parallèle et écrit un CSV par série
+    
+    La politesse reste assurée par site (seau à jetons, réessais, disjoncteur)
+    quel que soit le nombre d'extractions simultanées.
+    
+    Args:
+        series (dict, optional): {nom: url} (toutes les séries connues par défaut)
+        nb_paralleles (int): Nombre de séries extraites en même temps
+        dossier (str, optional): Dossier des CSV (convertisseur/temp par défaut)
+        rappel (callable, optional): Appelé avec (nom, resultat) à la fin de chaque série
+    
+    Returns:
+        dict: {nom: {'url', 'cartes', 'fichier', 'erreur'}}
+    """
+    if series is None:
+        series = collecter_urls_series()
+    
+    def extraire(nom, url):
+        cartes = extraire_cartes_blmm(url, secours_fichier=False)
+        if not cartes:
+            return {'url': url, 'cartes': 0, 'fichier': None, 'erreur': "Aucune carte trouvée"}
+        fichier = sauvegarder_cartes_csv(cartes, nom_fichier_serie(nom), dossier)
+        return {'url': url, 'cartes': len(cartes), 'fichier': fichier,
+                'erreur': None if fichier else "Écriture du CSV impossible"}
+    
+    print(f"📚 Extraction de {len(series)} séries ({nb_paralleles} en parallèle)")
+    resultats = {}
+    with ThreadPoolExecutor(max_workers=max(1, nb_paralleles)) as executeur:
+        taches = {executeur.submit(extraire, nom, url): nom for nom, url in series.items()}
+        for tache in as_completed(taches):
+            nom = taches[tache]
+            try:
+                resultat = tache.result()
+            except Exception as e:
+                resultat = {'url': series[nom], 'cartes': 0, 'fichier': None, 'erreur': str(e)}
+            resultats[nom] = resultat
+            if rappel:
+                rappel(nom, resultat)
+    
+    reussies = sum(1 for resultat in resultats.values() if not resultat['erreur'])
+    print(f"✅ {reussies}/{len(series)} séries extraites")
+    return resultats
+
 def main(url=None):
     """
     Fonction principale
@@ -442,7 +1247,7 @@ def main(url=None):
         print(f"\nNombre de cartes trouvées: {len(cartes)}")
         print("\nPremières cartes extraites:")
         for i, carte in enumerate(cartes[:5]):
-            print(f"{i+1}. {carte['numero']} - {carte['nom']} ({carte['rarete']})")
+            print(f"{i+1}. {carte.numero} - {carte.nom} ({carte.rarete})")
         
         # Sauvegarder dans un fichier
         sauvegarder_cartes_txt(cartes)
@@ -12,11 +12,15 @@ import sys
 import os
 from pathlib import Path
 import webbrowser
-import json
 import re
 
 # Import du convertisseur existant
-from Convertisseur import extraire_cartes_blmm, sauvegarder_cartes_csv
+from Convertisseur import (extraire_cartes_blmm, sauvegarder_cartes_csv, fermer_pool_navigateurs,
+                           extraire_series_en_lot, collecter_urls_series)
+
+# Registre partagé des URLs (dossier shared/)
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+from registre_urls import obtenir_registre
 
 class ConvertisseurGUI:
     def __init__(self):
@@ -142,6 +146,13 @@ class ConvertisseurGUI:
         )
         self.btn_extraire.pack(side=tk.LEFT)
         
+        self.btn_extraire_tout = ttk.Button(
+            action_frame,
+            text="📚 Extraire toutes les séries",
+            command=self.lancer_extraction_lot
+        )
+        self.btn_extraire_tout.pack(side=tk.LEFT, padx=(10, 0))
+        
         ttk.Button(
             action_frame,
             text="📂 Ouvrir dossier",
@@ -184,14 +195,11 @@ class ConvertisseurGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
     def charger_urls_sauvees(self):
-        """Charge les URLs sauvées depuis le fichier JSON"""
-        try:
-            if os.path.exists(self.urls_file):
-                with open(self.urls_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data
-        except Exception as e:
-            print(f"⚠️ Erreur lors du chargement des URLs : {e}")
+        """Charge les URLs sauvées depuis le fichier JSON (via le registre partagé)"""
+        if os.path.exists(self.urls_file):
+            urls = obtenir_registre([Path(self.urls_file)]).obtenir()
+            if urls:
+                return urls
         
         # URLs par défaut si le fichier n'existe pas
         return {
@@ -203,8 +211,7 @@ class ConvertisseurGUI:
     def sauvegarder_urls(self):
         """Sauvegarde les URLs dans le fichier JSON"""
         try:
-            with open(self.urls_file, 'w', encoding='utf-8') as f:
-                json.dump(self.urls_sauvees, f, indent=2, ensure_ascii=False)
+            obtenir_registre([Path(self.urls_file)]).enregistrer(self.urls_sauvees)
             self.log(f"💾 URLs sauvées dans {self.urls_file}")
         except Exception as e:
             self.log(f"❌ Erreur lors de la sauvegarde des URLs : {e}")
@@ -386,7 +393,7 @@ class ConvertisseurGUI:
                 # Afficher quelques exemples
                 self.log("📋 Aperçu des cartes extraites :")
                 for i, carte in enumerate(cartes[:3]):
-                    self.log(f"  {i+1}. {carte['numero']} - {carte['nom']} ({carte['rarete']})")
+                    self.log(f"  {i+1}. {carte.numero} - {carte.nom} ({carte.rarete})")
                 if len(cartes) > 3:
                     self.log(f"  ... et {len(cartes) - 3} autres cartes")
                 
@@ -422,6 +429,67 @@ class ConvertisseurGUI:
             self.btn_extraire.config(state="normal")
             self.progress_bar.stop()
     
+    def lancer_extraction_lot(self):
+        """Lance l'extraction de toutes les séries connues en arrière-plan"""
+        series = collecter_urls_series()
+        if not series:
+            messagebox.showerror("Erreur", "Aucune série connue à extraire")
+            return
+        
+        if not messagebox.askyesno(
+            "Extraire toutes les séries",
+            f"📚 {len(series)} séries vont être extraites et sauvées en CSV.\n\nContinuer ?"
+        ):
+            return
+        
+        self.btn_extraire.config(state="disabled")
+        self.btn_extraire_tout.config(state="disabled")
+        self.progress_bar.start()
+        
+        thread = threading.Thread(target=self.extraire_toutes_series, args=(series,))
+        thread.daemon = True
+        thread.start()
+    
+    def extraire_toutes_series(self, series):
+        """Effectue l'extraction de plusieurs séries (un CSV par série)"""
+        terminees = []
+        
+        def rappel(nom, resultat):
+            terminees.append(nom)
+            self.progression_var.set(f"📚 {len(terminees)}/{len(series)} séries traitées...")
+            if resultat['erreur']:
+                self.log(f"❌ {nom} : {resultat['erreur']}")
+            else:
+                self.log(f"✅ {nom} : {resultat['cartes']} cartes → {Path(resultat['fichier']).name}")
+        
+        try:
+            self.progression_var.set(f"🚀 Extraction de {len(series)} séries...")
+            self.log(f"📚 Début de l'extraction de {len(series)} séries")
+            
+            resultats = extraire_series_en_lot(series, rappel=rappel)
+            
+            reussies = [nom for nom, resultat in resultats.items() if not resultat['erreur']]
+            total_cartes = sum(resultat['cartes'] for resultat in resultats.values())
+            self.progression_var.set(f"✅ {len(reussies)}/{len(series)} séries extraites ({total_cartes} cartes)")
+            self.log(f"📊 {len(reussies)}/{len(series)} séries extraites, {total_cartes} cartes au total")
+            
+            messagebox.showinfo(
+                "Extraction terminée",
+                f"🎉 {len(reussies)}/{len(series)} séries extraites\n"
+                f"📊 {total_cartes} cartes au total\n\n"
+                f"Le détail est dans le journal d'activité."
+            )
+        
+        except Exception as e:
+            self.log(f"❌ Erreur : {e}")
+            self.progression_var.set("❌ Erreur lors de l'extraction")
+            messagebox.showerror("Erreur", f"Erreur lors de l'extraction :\n{e}")
+        
+        finally:
+            self.btn_extraire.config(state="normal")
+            self.btn_extraire_tout.config(state="normal")
+            self.progress_bar.stop()
+    
     def ouvrir_dossier(self):
         """Ouvre le dossier contenant les fichiers"""
         try:
@@ -511,7 +579,11 @@ class ConvertisseurGUI:
     
     def run(self):
         """Lance l'interface graphique"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # Les navigateurs restent ouverts entre deux extractions
+            fermer_pool_navigateurs()
 
 def main():
     """Fonction principale"""
@@ -1,18 +1,205 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Importateur de fichiers CSV dans la base de données SQLite
+Importateur de fichiers CSV (ainsi que JSON Lines et Parquet/Arrow, voir
+lecteurs.py) dans la base de données SQLite
 """
 
 import csv
 import os
 import re
-import json
-import requests
+import sys
+import time
+import queue
+import hashlib
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Optional, Callable
 from db_manager import DatabaseManager
+from lecteurs import COLONNES_REQUISES, LecteurCatalogue, PointReprise, obtenir_lecteur, est_supporte
+
+try:
+    from shared.registre_urls import obtenir_registre
+    from shared.raretes import NormaliseurRaretes
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+    from registre_urls import obtenir_registre
+    from raretes import NormaliseurRaretes
+
+# Nombre de lignes envoyées à la base par transaction en import par flux
+TAILLE_LOT_DEFAUT = 5000
+
+# Lots lus d'avance par fichier en import parallèle (mémoire bornée)
+LOTS_EN_AVANCE = 2
+
+# Numéro de carte : code de série, langue puis numéro (BLMM-FR001, RA02-FR001)
+MOTIF_NUMERO_CARTE = re.compile(r'^([A-Z0-9]+)-([A-Z]{1,2})([A-Z]{0,2}\d+)$')
+
+# Anomalies qui font rejeter un fichier en simulation ; une rareté inconnue est
+# seulement signalée (l'import la crée), une rareté illisible (nom tronqué
+# ambigu) écarte sa ligne ; une rareté non lue par le convertisseur est
+# importée sous RARETE_INCONNUE
+ANOMALIES_BLOQUANTES = ('format', 'champ_vide', 'numero_invalide', 'serie_incoherente')
+
+# Nombre d'anomalies détaillées gardées par fichier (les compteurs restent exacts)
+MAX_ANOMALIES_DETAILLEES = 1000
+
+def empreinte_fichier(chemin: str, taille_bloc: int = 1024 * 1024) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier, lu par blocs"""
+    empreinte = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(taille_bloc), b''):
+            empreinte.update(bloc)
+    return empreinte.hexdigest()
+
+def cle_fichier(chemin: str) -> str:
+    """Clé d'un fichier dans le manifeste des imports : son chemin absolu résolu"""
+    return os.path.realpath(chemin)
+
+class ImportAnnule(Exception):
+    """Import interrompu à la demande de l'utilisateur"""
+
+class SuiviImport:
+    """
+    Progression et annulation d'un import, partagées entre le thread qui
+    importe et celui qui l'affiche (interface graphique)
+    
+    L'importateur appelle avancer() après chaque lot écrit et verifier() entre
+    deux lots ; annuler() peut être appelé depuis n'importe quel thread.
+    """
+    
+    def __init__(self, rappel: Callable[[Dict], None] = None, intervalle: float = 0.2):
+        """
+        Args:
+            rappel (Callable, optional): Fonction appelée avec etat() au fil de l'import,
+                depuis le thread d'import
+            intervalle (float): Délai minimal entre deux appels du rappel, en secondes
+        """
+        self.rappel = rappel
+        self.intervalle = intervalle
+        self._verrou = threading.Lock()
+        self._annulation = threading.Event()
+        self._estimations = {}
+        self._lignes_fichiers_termines = 0
+        self._lignes_fichier_courant = 0
+        self._debut = time.perf_counter()
+        self._dernier_rappel = 0.0
+        self.demarre = False
+        self.etape = ""
+        self.fichier_courant = None
+        self.fichiers_traites = 0
+        self.lignes_totales = None
+    
+    def demarrer(self, chemins: List[str]):
+        """Estime le volume à importer (nombre de lignes de chaque fichier)"""
+        with self._verrou:
+            for chemin in chemins:
+                lecteur = obtenir_lecteur(chemin)
+                try:
+                    estimation = lecteur.estimer_nb_lignes(chemin) if lecteur else None
+                except OSError:
+                    estimation = None
+                self._estimations[os.path.basename(chemin)] = estimation
+            
+            estimations = list(self._estimations.values())
+            self.lignes_totales = sum(estimations) if None not in estimations else None
+            self._debut = time.perf_counter()
+            self.demarre = True
+        self._notifier(forcer=True)
+    
+    def annuler(self):
+        """Demande l'arrêt de l'import (pris en compte entre deux lots)"""
+        self._annulation.set()
+    
+    @property
+    def annule(self) -> bool:
+        return self._annulation.is_set()
+    
+    def verifier(self):
+        """
+        Raises:
+            ImportAnnule: Si l'annulation a été demandée
+        """
+        if self.annule:
+            raise ImportAnnule("Import annulé")
+    
+    def commencer_fichier(self, fichier: str, etape: str = "Import"):
+        """Signale le début du traitement d'un fichier"""
+        with self._verrou:
+            self.fichier_courant = os.path.basename(fichier)
+            self.etape = etape
+            self._lignes_fichier_courant = 0
+        self._notifier(forcer=True)
+    
+    def terminer_fichier(self):
+        """Signale la fin du fichier courant (importé, ignoré ou en échec)"""
+        with self._verrou:
+            estimation = self._estimations.get(self.fichier_courant)
+            self._lignes_fichiers_termines += (
+                estimation if estimation is not None else self._lignes_fichier_courant
+            )
+            self._lignes_fichier_courant = 0
+            self.fichiers_traites += 1
+        self._notifier(forcer=True)
+    
+    def avancer(self, nb_lignes: int):
+        """Ajoute des lignes traitées dans le fichier courant"""
+        with self._verrou:
+            self._lignes_fichier_courant += nb_lignes
+        self._notifier()
+    
+    def etat(self) -> Dict:
+        """
+        Returns:
+            Dict: fichier, etape, fichiers_traites, fichiers_total, lignes_traitees,
+            lignes_totales, fraction (0 à 1, None si inconnue), debit_lignes_s,
+            eta_s (None si inconnue), duree_s et annule
+        """
+        with self._verrou:
+            estimation = self._estimations.get(self.fichier_courant)
+            lignes_courant = self._lignes_fichier_courant
+            if estimation is not None:
+                lignes_courant = min(lignes_courant, estimation)
+            lignes_traitees = self._lignes_fichiers_termines + lignes_courant
+            duree = time.perf_counter() - self._debut
+            fichiers_total = len(self._estimations)
+            fichiers_traites = self.fichiers_traites
+            fichier = self.fichier_courant
+            etape = self.etape
+        
+        debit = lignes_traitees / duree if duree > 0 else 0.0
+        if self.lignes_totales:
+            fraction = min(lignes_traitees / self.lignes_totales, 1.0)
+            eta = (self.lignes_totales - lignes_traitees) / debit if debit > 0 else None
+        else:
+            fraction = fichiers_traites / fichiers_total if fichiers_total else None
+            eta = None
+        
+        return {
+            'fichier': fichier,
+            'etape': etape,
+            'fichiers_traites': fichiers_traites,
+            'fichiers_total': fichiers_total,
+            'lignes_traitees': lignes_traitees,
+            'lignes_totales': self.lignes_totales,
+            'fraction': fraction,
+            'debit_lignes_s': debit,
+            'eta_s': max(eta, 0.0) if eta is not None else None,
+            'duree_s': duree,
+            'annule': self.annule
+        }
+    
+    def _notifier(self, forcer: bool = False):
+        if self.rappel is None:
+            return
+        maintenant = time.perf_counter()
+        if not forcer and maintenant - self._dernier_rappel < self.intervalle:
+            return
+        self._dernier_rappel = maintenant
+        self.rappel(self.etat())
 
 class CSVImporter:
     def __init__(self, db_manager: DatabaseManager = None):
@@ -24,43 +211,30 @@ class CSVImporter:
         """
         self.db = db_manager or DatabaseManager()
     
+    @classmethod
+    def sans_base(cls) -> 'CSVImporter':
+        """Instance limitée à la lecture et à l'analyse des CSV (aucune base ouverte)"""
+        importer = cls.__new__(cls)
+        importer.db = None
+        importer.normaliseur_raretes = NormaliseurRaretes()
+        return importer
+    
+    def normaliser_rarete(self, nom_rarete: str) -> Optional[str]:
+        """Nom canonique d'une rareté lue (None si ce n'est pas une rareté lisible)"""
+        if self.db is not None:
+            return self.db.normaliser_rarete(nom_rarete)
+        return self.normaliseur_raretes.canonique(nom_rarete)
+    
     def charger_urls_sauvees(self) -> Dict[str, str]:
         """
         Charge les URLs sauvegardées depuis les fichiers JSON du convertisseur
         
+        Passe par le registre partagé : le fichier n'est relu que s'il a changé.
+        
         Returns:
             Dict[str, str]: Dictionnaire {code_serie: url}
         """
-        urls = {}
-        
-        # Chemins possibles pour les fichiers d'URLs
-        chemins_possibles = [
-            # Fichier global dans la racine du projet
-            Path(__file__).parent.parent / "urls_sauvees.json",
-            # Fichier dans le convertisseur
-            Path(__file__).parent.parent / "convertisseur" / "urls_sauvees.json",
-            # Fichier local dans le répertoire courant
-            Path("urls_sauvees.json")
-        ]
-        
-        for chemin in chemins_possibles:
-            try:
-                if chemin.exists():
-                    with open(chemin, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        urls.update(data)
-                    print(f"📂 URLs chargées depuis : {chemin}")
-                    break
-            except Exception as e:
-                print(f"⚠️ Erreur lors du chargement de {chemin} : {e}")
-                continue
-        
-        if urls:
-            print(f"🔗 {len(urls)} URLs de séries chargées")
-        else:
-            print("⚠️ Aucune URL de série trouvée")
-        
-        return urls
+        return obtenir_registre().obtenir()
     
     def extraire_nom_serie_depuis_url(self, url: str) -> str:
         """
@@ -154,6 +328,36 @@ class CSVImporter:
         
         return code_serie, nom_serie
     
+    def infos_serie(self, code_serie: str, urls_sauvees: Dict[str, str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Nom et URL d'une série d'après le registre des URLs
+        
+        Args:
+            code_serie (str): Code de la série
+            urls_sauvees (Dict[str, str], optional): URLs déjà chargées (registre partagé sinon)
+        
+        Returns:
+            Tuple[str, Optional[str]]: (nom_serie, url_source) ; "Série CODE" sans URL connue
+        """
+        if urls_sauvees is None:
+            urls_sauvees = self.charger_urls_sauvees()
+        url_serie = urls_sauvees.get(code_serie)
+        nom_serie = self.extraire_nom_serie_depuis_url(url_serie) if url_serie else None
+        return nom_serie or f"Série {code_serie}", url_serie
+    
+    def code_serie_ligne(self, code_serie: Optional[str], numero_carte: Optional[str]) -> str:
+        """
+        Série d'une ligne : colonne Code_Serie, sinon préfixe du numéro de carte
+        
+        Returns:
+            str: Code de la série ('' si ni la colonne ni le numéro ne la donnent)
+        """
+        code_serie = (code_serie or '').strip()
+        if code_serie and code_serie != "UNKNOWN":
+            return code_serie
+        match_numero = MOTIF_NUMERO_CARTE.match((numero_carte or '').strip())
+        return match_numero.group(1) if match_numero else ''
+    
     def valider_format_csv(self, fichier_csv: str) -> Tuple[bool, str]:
         """
         Valide que le fichier CSV a le bon format
@@ -162,161 +366,655 @@ class CSVImporter:
             Tuple[bool, str]: (est_valide, message)
         """
         try:
-            with open(fichier_csv, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                # Vérifier les colonnes requises
-                colonnes_requises = ['Code_Serie', 'Nom_Carte', 'Rareté', 'Numéro_Carte']
-                colonnes_presentes = reader.fieldnames
+            lecteur = self.lecteur_pour(fichier_csv)
+            
+            # Vérifier les colonnes requises
+            erreur = self.verifier_entetes(lecteur.colonnes(fichier_csv))
+            if erreur:
+                return False, erreur
+            
+            # Tester la première ligne pour vérifier le format
+            premier_lot = next(lecteur.lire_colonnes(fichier_csv, 1), None)
+            if not premier_lot:
+                return False, f"Fichier {lecteur.nom} sans données"
+            
+            # Vérifier que les champs ne sont pas vides
+            erreur = self.verifier_premiere_ligne(
+                {colonne: valeurs[0] for colonne, valeurs in zip(COLONNES_REQUISES, premier_lot[1:])}
+            )
+            if erreur:
+                return False, erreur
+            
+            return True, f"Format {lecteur.nom} valide"
                 
-                if not colonnes_presentes:
-                    return False, "Fichier CSV vide ou sans en-têtes"
+        except Exception as e:
+            return False, f"Erreur lors de la validation : {e}"
+    
+    def lecteur_pour(self, fichier: str) -> LecteurCatalogue:
+        """
+        Retourne le lecteur du format d'un fichier (CSV, JSONL, Parquet/Arrow)
+        
+        Raises:
+            ValueError: Extension non supportée
+        """
+        lecteur = obtenir_lecteur(fichier)
+        if lecteur is None:
+            raise ValueError(f"Format non supporté : {Path(fichier).suffix or Path(fichier).name}")
+        return lecteur
+    
+    def verifier_entetes(self, colonnes_presentes: Optional[List[str]]) -> Optional[str]:
+        """
+        Vérifie les en-têtes (noms de colonnes) d'un fichier
+        
+        Returns:
+            Optional[str]: Message d'erreur, None si les en-têtes sont valides
+        """
+        if not colonnes_presentes:
+            return "Fichier vide ou sans en-têtes"
+        
+        colonnes_manquantes = [col for col in COLONNES_REQUISES if col not in colonnes_presentes]
+        if colonnes_manquantes:
+            return f"Colonnes manquantes : {', '.join(colonnes_manquantes)}"
+        
+        return None
+    
+    def verifier_premiere_ligne(self, ligne: Dict[str, str]) -> Optional[str]:
+        """
+        Vérifie que la première ligne de données a tous ses champs remplis
+        
+        Returns:
+            Optional[str]: Message d'erreur, None si la ligne est valide
+        """
+        for colonne in COLONNES_REQUISES:
+            if not (ligne.get(colonne) or '').strip():
+                return f"Première ligne invalide : colonne '{colonne}' vide"
+        return None
+    
+    def lire_lots(self, fichier: str, taille_lot: int = TAILLE_LOT_DEFAUT,
+                  reprise: PointReprise = None) -> Iterator[Tuple[List[Tuple[str, str, str, str]], PointReprise]]:
+        """
+        Lit un fichier (CSV, JSONL, Parquet/Arrow) en une seule passe et le découpe en lots validés
+        
+        Les en-têtes et chaque ligne sont vérifiés pendant la lecture ; seul le
+        lot en cours est gardé en mémoire. Un lot ne coupe jamais les raretés
+        d'une même carte (lignes consécutives de même numéro). Les raretés
+        sont ramenées à leur nom canonique et la série de chaque ligne est
+        résolue dès la lecture.
+        
+        Args:
+            fichier (str): Chemin vers le fichier
+            taille_lot (int): Nombre de lignes visé par lot
+            reprise (PointReprise, optional): Reprendre la lecture à ce point
+                (retourné avec un lot précédent) sans relire le début du fichier
+        
+        Yields:
+            Tuple[List[Tuple[str, str, str, str]], PointReprise]: Lignes (numero_carte,
+            nom_carte, nom_rarete, code_serie) et point de reprise juste après le lot ;
+            code_serie vaut '' si la ligne ne donne pas sa série
+        
+        Raises:
+            ValueError: Format non supporté, en-têtes manquants, fichier sans
+            données ou première ligne invalide
+        """
+        lecteur = self.lecteur_pour(fichier)
+        
+        erreur = self.verifier_entetes(lecteur.colonnes(fichier))
+        if erreur:
+            raise ValueError(f"Format {lecteur.nom} invalide : {erreur}")
+        
+        lot = []
+        numero_precedent = None
+        point_precedent = reprise
+        nb_lignes = 0
+        
+        for (numeros_ligne, codes, noms, raretes, numeros), positions in lecteur.lire_depuis(fichier, taille_lot, reprise):
+            if nb_lignes == 0 and not reprise:
+                erreur = self.verifier_premiere_ligne(
+                    dict(zip(COLONNES_REQUISES, (codes[0], noms[0], raretes[0], numeros[0])))
+                )
+                if erreur:
+                    raise ValueError(f"Format {lecteur.nom} invalide : {erreur}")
+            nb_lignes += len(numeros)
+            
+            for i, code_serie, nom_carte, nom_rarete, numero_carte, position in zip(numeros_ligne, codes, noms,
+                                                                                    raretes, numeros, positions):
+                numero_carte = (numero_carte or '').strip()
+                nom_carte = (nom_carte or '').strip()
+                nom_rarete = (nom_rarete or '').strip()
                 
-                colonnes_manquantes = [col for col in colonnes_requises if col not in colonnes_presentes]
-                if colonnes_manquantes:
-                    return False, f"Colonnes manquantes : {', '.join(colonnes_manquantes)}"
+                if not (numero_carte and nom_carte and nom_rarete):
+                    print(f"⚠️  Ligne {i} : données manquantes, ignorée")
+                    point_precedent = (position, i + 1)
+                    continue
                 
-                # Tester la première ligne pour vérifier le format
-                premiere_ligne = next(reader, None)
-                if not premiere_ligne:
-                    return False, "Fichier CSV sans données"
+                rarete = self.normaliser_rarete(nom_rarete)
+                if rarete is None:
+                    print(f"⚠️  Ligne {i} : rareté illisible ({nom_rarete}), ignorée")
+                    point_precedent = (position, i + 1)
+                    continue
                 
-                # Vérifier que les champs ne sont pas vides
-                for colonne in colonnes_requises:
-                    if not premiere_ligne.get(colonne, '').strip():
-                        return False, f"Première ligne invalide : colonne '{colonne}' vide"
+                # Lot plein : l'envoyer dès qu'une nouvelle carte commence
+                if len(lot) >= taille_lot and numero_carte != numero_precedent:
+                    yield lot, point_precedent
+                    lot = []
                 
-                return True, "Format CSV valide"
+                lot.append((numero_carte, nom_carte, rarete, self.code_serie_ligne(code_serie, numero_carte)))
+                numero_precedent = numero_carte
+                point_precedent = (position, i + 1)
+        
+        if nb_lignes == 0 and not reprise:
+            raise ValueError(f"Format {lecteur.nom} invalide : Fichier {lecteur.nom} sans données")
+        
+        if lot:
+            yield lot, point_precedent
+    
+    def analyser_anomalies(self, fichier_csv: str, raretes_connues: Optional[set] = None) -> Dict:
+        """
+        Parcourt tout un fichier (CSV, JSONL, Parquet/Arrow) en une passe, sans écrire en base
+        
+        Args:
+            fichier_csv (str): Chemin vers le fichier
+            raretes_connues (set, optional): Noms canoniques des raretés existantes
+                (non vérifiés si None)
+        
+        Returns:
+            Dict: Rapport du fichier :
+                - lignes / lignes_valides : lignes lues et lignes importables
+                - code_serie : série de la première ligne
+                - series : {code_serie: nombre de lignes} (un fichier peut couvrir plusieurs séries)
+                - anomalies : liste de {'ligne', 'type', 'message'} (limitée à
+                  MAX_ANOMALIES_DETAILLEES), nb_anomalies : compteurs par type
+                - raretes_inconnues : {rareté canonique: nombre de lignes}
+                - valide : aucune anomalie bloquante
+        """
+        rapport = {
+            'lignes': 0,
+            'lignes_valides': 0,
+            'code_serie': None,
+            'series': {},
+            'anomalies': [],
+            'nb_anomalies': {},
+            'raretes_inconnues': {},
+            'valide': False
+        }
+        
+        def signaler(numero_ligne: int, type_anomalie: str, message: str):
+            rapport['nb_anomalies'][type_anomalie] = rapport['nb_anomalies'].get(type_anomalie, 0) + 1
+            if len(rapport['anomalies']) < MAX_ANOMALIES_DETAILLEES:
+                rapport['anomalies'].append({'ligne': numero_ligne, 'type': type_anomalie, 'message': message})
+        
+        try:
+            lecteur = self.lecteur_pour(fichier_csv)
+            erreur = self.verifier_entetes(lecteur.colonnes(fichier_csv))
+            if erreur:
+                signaler(1, 'format', erreur)
+                return rapport
+            
+            for numeros_ligne, *colonnes in lecteur.lire_colonnes(fichier_csv, TAILLE_LOT_DEFAUT):
+                rapport['lignes'] += len(numeros_ligne)
                 
-        except Exception as e:
-            return False, f"Erreur lors de la validation : {e}"
+                for numero_ligne, *valeurs in zip(numeros_ligne, *colonnes):
+                    valeurs = [(valeur or '').strip() for valeur in valeurs]
+                    code_serie, _, nom_rarete, numero_carte = valeurs
+                    # Code_Serie vide : l'import prend le préfixe du numéro
+                    valeurs[0] = code_serie = self.code_serie_ligne(code_serie, numero_carte) or code_serie
+                    
+                    vides = [colonne for colonne, valeur in zip(COLONNES_REQUISES, valeurs) if not valeur]
+                    if vides:
+                        signaler(numero_ligne, 'champ_vide', f"Colonne(s) vide(s) : {', '.join(vides)}")
+                        continue
+                    
+                    ligne_valide = True
+                    match_numero = MOTIF_NUMERO_CARTE.match(numero_carte)
+                    if not match_numero:
+                        signaler(numero_ligne, 'numero_invalide', f"Numéro de carte invalide : {numero_carte}")
+                        ligne_valide = False
+                    elif match_numero.group(1) != code_serie:
+                        signaler(numero_ligne, 'serie_incoherente',
+                                 f"Numéro {numero_carte} hors de la série {code_serie}")
+                        ligne_valide = False
+                    
+                    # Chaque ligne est importée dans sa propre série
+                    if rapport['code_serie'] is None:
+                        rapport['code_serie'] = code_serie
+                    rapport['series'][code_serie] = rapport['series'].get(code_serie, 0) + 1
+                    
+                    # Variantes d'une rareté connue ("secret rare", "ScR") : pas une anomalie
+                    rarete = self.normaliser_rarete(nom_rarete)
+                    if rarete is None:
+                        signaler(numero_ligne, 'rarete_illisible', f"Rareté illisible : {nom_rarete}")
+                        continue
+                    nom_rarete = rarete
+                    
+                    # Une seule anomalie par rareté inconnue, à sa première occurrence
+                    if raretes_connues is not None and nom_rarete not in raretes_connues:
+                        if nom_rarete not in rapport['raretes_inconnues']:
+                            signaler(numero_ligne, 'rarete_inconnue', f"Rareté inconnue : {nom_rarete}")
+                            rapport['raretes_inconnues'][nom_rarete] = 0
+                        rapport['raretes_inconnues'][nom_rarete] += 1
+                    
+                    if ligne_valide:
+                        rapport['lignes_valides'] += 1
+            
+            if rapport['lignes'] == 0:
+                signaler(1, 'format', f"Fichier {lecteur.nom} sans données")
+        
+        except (OSError, UnicodeDecodeError, csv.Error, ValueError) as e:
+            signaler(0, 'format', f"Fichier illisible : {e}")
+        
+        rapport['valide'] = not any(t in rapport['nb_anomalies'] for t in ANOMALIES_BLOQUANTES)
+        return rapport
+    
+    def simuler_import(self, chemin: str, raretes_connues: List[str] = None,
+                       afficher: bool = True) -> Dict[str, Dict]:
+        """
+        Mode simulation : valide un fichier ou tous les fichiers d'un dossier sans rien écrire
+        
+        Chaque fichier est lu entièrement en flux ; les numéros de carte mal
+        formés, champs vides, raretés inconnues et incohérences de série sont
+        relevés avec leur numéro de ligne.
+        
+        Args:
+            chemin (str): Fichier (CSV, JSONL, Parquet/Arrow) ou dossier
+            raretes_connues (List[str], optional): Raretés de référence (celles de la base par défaut)
+            afficher (bool): Afficher le rapport
+        
+        Returns:
+            Dict[str, Dict]: Rapport par nom de fichier (voir analyser_anomalies)
+        """
+        if os.path.isdir(chemin):
+            fichiers_csv = [os.path.join(chemin, f) for f in os.listdir(chemin) if est_supporte(f)]
+        else:
+            fichiers_csv = [chemin]
+        
+        if raretes_connues is None and self.db is not None:
+            raretes_connues = self.db.get_noms_raretes()
+        raretes = ({self.normaliser_rarete(r) or r for r in raretes_connues}
+                   if raretes_connues is not None else None)
+        
+        rapports = {}
+        for fichier in fichiers_csv:
+            rapports[os.path.basename(fichier)] = self.analyser_anomalies(fichier, raretes)
+        
+        if afficher:
+            self.afficher_simulation(rapports)
+        return rapports
+    
+    def afficher_simulation(self, rapports: Dict[str, Dict], nb_details: int = 10):
+        """Affiche le rapport d'une simulation d'import"""
+        print(f"🔎 Simulation d'import de {len(rapports)} fichier(s)")
+        for fichier, rapport in rapports.items():
+            nb_total = sum(rapport['nb_anomalies'].values())
+            series = f", {len(rapport['series'])} séries" if len(rapport['series']) > 1 else ""
+            if nb_total == 0:
+                print(f"✅ {fichier} : {rapport['lignes']} lignes{series}, aucune anomalie")
+                continue
+            
+            symbole = "⚠️" if rapport['valide'] else "❌"
+            detail = ", ".join(f"{nb} {t}" for t, nb in rapport['nb_anomalies'].items())
+            print(f"{symbole} {fichier} : {rapport['lignes_valides']}/{rapport['lignes']} lignes valides{series} ({detail})")
+            for anomalie in rapport['anomalies'][:nb_details]:
+                print(f"    Ligne {anomalie['ligne']} : {anomalie['message']}")
+            if len(rapport['anomalies']) > nb_details:
+                print(f"    ... {nb_total - nb_details} autre(s) anomalie(s)")
     
     def importer_csv(self, fichier_csv: str, auto_detect: bool = True, 
                     code_serie_force: str = None, nom_serie_force: str = None,
-                    url_source: str = None) -> Dict[str, int]:
+                    url_source: str = None, taille_lot: int = TAILLE_LOT_DEFAUT,
+                    suivi: SuiviImport = None, reprendre: bool = False) -> Dict[str, int]:
         """
         Importe un fichier CSV dans la base de données
         
+        Le fichier est lu en flux et chargé par lots de `taille_lot` lignes,
+        chacun dans sa propre transaction : la mémoire utilisée ne dépend pas
+        de la taille du fichier. Une annulation via le suivi est vérifiée entre
+        deux lots : les lots déjà validés restent en base avec leur point de
+        reprise, le lot suivant n'est pas commencé.
+        
+        Avec la détection automatique, chaque ligne est importée dans la série
+        de sa colonne Code_Serie (ou du préfixe de son numéro) : un export
+        couvrant des centaines de séries s'importe en une seule passe.
+        
+        Chaque lot validé enregistre en base son point de reprise. Si l'import
+        est interrompu, le relancer avec `reprendre` repart directement de ce
+        point, à condition que le fichier n'ait pas changé entre-temps.
+        
         Args:
             fichier_csv (str): Chemin vers le fichier CSV
-            auto_detect (bool): Détection automatique des infos de série
-            code_serie_force (str): Forcer un code de série spécifique
+            auto_detect (bool): Série de chaque ligne lue dans le fichier
+            code_serie_force (str): Forcer un code de série pour toutes les lignes
             nom_serie_force (str): Forcer un nom de série spécifique
             url_source (str): URL source Yugipedia
+            taille_lot (int): Nombre de lignes par transaction
+            suivi (SuiviImport, optional): Progression et annulation de l'import
+            reprendre (bool): Reprendre un import interrompu de ce fichier
         
         Returns:
-            Dict[str, int]: Statistiques d'import (cartes ajoutées, liens créés, etc.)
+            Dict[str, int]: Statistiques d'import (cartes ajoutées, liens créés, etc.),
+            limitées aux lignes relues en cas de reprise
+        
+        Raises:
+            ImportAnnule: Annulation demandée via le suivi (l'import pourra
+            reprendre après le dernier lot validé)
         """
         print(f"📥 Import du fichier : {fichier_csv}")
+        if suivi:
+            if not suivi.demarre:
+                suivi.demarrer([fichier_csv])
+            suivi.commencer_fichier(fichier_csv)
         
-        # Valider le format
-        valide, message = self.valider_format_csv(fichier_csv)
-        if not valide:
-            raise ValueError(f"Format CSV invalide : {message}")
+        # Fichier identique au dernier import : rien à relire ni à écrire
+        empreinte = empreinte_fichier(fichier_csv)
+        inchange = self.verifier_manifeste(fichier_csv, empreinte, code_serie_force)
+        if inchange:
+            if suivi:
+                suivi.terminer_fichier()
+            return inchange
         
-        print(f"✅ {message}")
+        point = self.verifier_point_reprise(fichier_csv, empreinte, reprendre)
+        infos, lots = self.preparer_import(
+            fichier_csv, auto_detect, code_serie_force, nom_serie_force, url_source, taille_lot, point
+        )
+        infos['nom_fichier'] = cle_fichier(fichier_csv)
+        infos['empreinte'] = empreinte
+        stats = self.ecrire_lots(infos, lots, suivi)
+        if suivi:
+            suivi.terminer_fichier()
+        return stats
+    
+    def verifier_manifeste(self, fichier_csv: str, empreinte: str,
+                           code_serie_force: str = None) -> Optional[Dict[str, int]]:
+        """
+        Compare un fichier au manifeste des imports
         
-        stats = {
+        Le manifeste est indexé par chemin absolu : deux fichiers de même nom
+        dans des dossiers différents ont chacun leur historique. Une entrée
+        d'un ancien manifeste (indexé par nom de fichier) est rattachée au
+        premier chemin importé sous ce nom.
+        
+        Returns:
+            Optional[Dict[str, int]]: Statistiques d'un import ignoré si le fichier
+            est inchangé depuis son dernier import, None s'il doit être importé
+        """
+        cle = cle_fichier(fichier_csv)
+        self.db.rattacher_import_fichier(os.path.basename(fichier_csv), cle)
+        manifeste = self.db.get_manifeste_import(cle)
+        if not manifeste or manifeste['empreinte_sha256'] != empreinte:
+            return None
+        if code_serie_force and code_serie_force != manifeste['code_serie']:
+            return None
+        
+        print(f"⏭️ Fichier inchangé depuis son import du {manifeste['date_import']} "
+              f"({manifeste['nb_lignes']} lignes, {manifeste['code_serie']}) : ignoré")
+        return {
             'cartes_ajoutees': 0,
             'liens_crees': 0,
             'cartes_existantes': 0,
-            'erreurs': 0
+            'erreurs': 0,
+            'fichier_inchange': True
         }
+    
+    def verifier_point_reprise(self, fichier_csv: str, empreinte: str,
+                               reprendre: bool = False) -> Optional[Dict]:
+        """
+        Cherche le point de reprise d'un import interrompu du fichier
         
-        # Lire le CSV
-        with open(fichier_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            lignes = list(reader)
+        Returns:
+            Optional[Dict]: Point de reprise (voir DatabaseManager.get_point_reprise)
+            si l'import doit reprendre, None s'il doit partir du début
+        """
+        point = self.db.get_point_reprise(cle_fichier(fichier_csv))
+        if not point:
+            return None
+        
+        if point['empreinte_sha256'] != empreinte:
+            print(f"⚠️ Fichier modifié depuis l'import interrompu du {point['date_maj']} : "
+                  f"import depuis le début")
+            return None
+        if not reprendre:
+            print(f"💡 Import interrompu à la ligne {point['numero_ligne']} : "
+                  f"relancer avec reprendre=True pour repartir de là")
+            return None
+        
+        print(f"⏩ Reprise à la ligne {point['numero_ligne']} "
+              f"({point['nb_lignes']} lignes déjà chargées, {point['code_serie']})")
+        return point
+    
+    def preparer_import(self, fichier_csv: str, auto_detect: bool = True,
+                        code_serie_force: str = None, nom_serie_force: str = None,
+                        url_source: str = None, taille_lot: int = TAILLE_LOT_DEFAUT,
+                        reprise: Dict = None) -> Tuple[Dict[str, str], Iterator]:
+        """
+        Phase de lecture d'un import : valide le début du fichier et résout la série
         
-        if not lignes:
-            raise ValueError("Fichier CSV vide")
+        N'écrit rien en base : peut s'exécuter dans un thread lecteur de l'import parallèle.
         
-        # Détecter ou utiliser les informations de série
-        if auto_detect and not code_serie_force:
-            premier_numero = lignes[0]['Numéro_Carte']
-            code_serie, nom_serie = self.detecter_info_serie(fichier_csv, premier_numero)
+        Args:
+            reprise (Dict, optional): Point de reprise d'un import interrompu : la
+                lecture repart de là et la série principale est celle de l'import interrompu
+        
+        Returns:
+            Tuple[Dict[str, str], Iterator]: Infos de la série principale (code_serie,
+            nom_serie, url_source), 'series_par_ligne' (chaque ligne va dans sa propre
+            série), plus 'nb_lignes_reprises' en cas de reprise ; et lots de lignes
+            validées avec leur point de reprise
+        """
+        # Lecture en flux : en-têtes et lignes validés au fil de la lecture
+        if reprise:
+            lots = self.lire_lots(fichier_csv, taille_lot, (reprise['position'], reprise['numero_ligne']))
+        else:
+            lots = self.lire_lots(fichier_csv, taille_lot)
+        premier_lot = next(lots, None)
+        
+        # Reprise après le dernier lot : il ne reste qu'à finaliser
+        if not premier_lot and not reprise:
+            raise ValueError("Fichier vide")
+        
+        print(f"✅ Format {self.lecteur_pour(fichier_csv).nom} valide")
+        
+        # Détecter ou utiliser les informations de série (série principale :
+        # celle de la première ligne, enregistrée dans le manifeste)
+        series_par_ligne = auto_detect and not code_serie_force
+        if series_par_ligne:
+            if reprise:
+                code_serie = reprise['code_serie']
+            else:
+                numero_carte, _, _, code_serie = premier_lot[0][0]
+                if not code_serie:
+                    code_serie, _ = self.detecter_info_serie(fichier_csv, numero_carte)
+            nom_serie, url_serie = self.infos_serie(code_serie)
         else:
             code_serie = code_serie_force or "UNKNOWN"
             nom_serie = nom_serie_force or f"Série {code_serie}"
+            url_serie = self.charger_urls_sauvees().get(code_serie)
         
         print(f"📊 Série détectée : {code_serie} - {nom_serie}")
         
-        # Charger les URLs sauvegardées et récupérer l'URL pour cette série
-        if not url_source:  # Si pas d'URL fournie en paramètre
-            urls_sauvees = self.charger_urls_sauvees()
-            url_source = urls_sauvees.get(code_serie)
+        # URL sauvegardée pour cette série, sauf si fournie en paramètre
+        if not url_source:
+            url_source = url_serie
             if url_source:
                 print(f"🔗 URL trouvée pour {code_serie} : {url_source}")
         
-        # Ajouter/récupérer la série
-        try:
-            serie_id = self.db.ajouter_serie(code_serie, nom_serie, url_source)
-        except Exception as e:
-            print(f"❌ Erreur lors de l'ajout de série : {e}")
-            return stats
+        infos = {
+            'code_serie': code_serie,
+            'nom_serie': nom_serie,
+            'url_source': url_source,
+            'series_par_ligne': series_par_ligne
+        }
+        if reprise:
+            infos['nb_lignes_reprises'] = reprise['nb_lignes']
+        return infos, itertools.chain([premier_lot] if premier_lot else [], lots)
+    
+    def ecrire_lots(self, infos: Dict[str, str], lots, suivi: SuiviImport = None) -> Dict[str, int]:
+        """
+        Phase d'écriture d'un import : crée les séries et charge les lots
+        
+        Les séries sont résolues une seule fois par import (cache code -> id),
+        avant la transaction du lot qui les utilise en premier.
+        
+        Seules les lignes absentes de la version précédente du fichier sont
+        écrites ; les exemplaires qui ont disparu du fichier sont retirés et le
+        manifeste est mis à jour si tous les lots ont été chargés.
+        
+        Le point de reprise est enregistré dans la transaction de chaque lot
+        validé : il désigne toujours le dernier lot validé, et tous les lots
+        qui le précèdent le sont aussi. Au premier lot en échec, le chargement
+        du fichier s'arrête : aucun lot suivant n'est écrit, et une reprise
+        repart exactement du lot en échec.
         
-        # Traiter chaque ligne
-        cartes_traitees = set()  # Pour éviter les doublons de cartes
+        Args:
+            infos (Dict[str, str]): Infos de série retournées par preparer_import,
+                complétées par 'nom_fichier' (clé du manifeste, voir cle_fichier)
+                et 'empreinte'
+            lots: Itérable de lots de lignes (numero_carte, nom_carte, nom_rarete,
+                code_serie), chacun avec son point de reprise
+            suivi (SuiviImport, optional): Progression et annulation, vérifiée avant
+                chaque lot (les lots déjà validés sont conservés)
         
-        for i, ligne in enumerate(lignes, 1):
+        Returns:
+            Dict[str, int]: Statistiques d'import (cartes ajoutées, liens créés, etc.)
+        
+        Raises:
+            ImportAnnule: Annulation demandée via le suivi, entre deux lots
+        """
+        code_serie = infos['code_serie']
+        stats = {
+            'cartes_ajoutees': 0,
+            'liens_crees': 0,
+            'cartes_existantes': 0,
+            'erreurs': 0
+        }
+        
+        series_ids = {}
+        
+        # Chaque lot est chargé dans sa propre transaction avec son point de
+        # reprise : une annulation ou un arrêt brutal ne perd au plus que le lot
+        # en cours. Transaction simple : les triggers nb_cartes_total sont en
+        # O(1), les suspendre à chaque lot coûterait un changement de schéma
+        # et un recomptage des séries par lot
+        nb_lignes = infos.get('nb_lignes_reprises', 0)
+        if nb_lignes:
+            stats['lignes_reprises'] = nb_lignes
+        for lot, (position, numero_ligne) in lots:
+            if suivi:
+                suivi.verifier()
+            nb_lignes += len(lot)
             try:
-                numero_carte = ligne['Numéro_Carte'].strip()
-                nom_carte = ligne['Nom_Carte'].strip()
-                nom_rarete = ligne['Rareté'].strip()
-                
-                if not all([numero_carte, nom_carte, nom_rarete]):
-                    print(f"⚠️  Ligne {i} : données manquantes, ignorée")
-                    continue
-                
-                # Ajouter la carte si pas encore traitée
-                if numero_carte not in cartes_traitees:
-                    carte_id = self.db.ajouter_carte(numero_carte, nom_carte, serie_id)
-                    if carte_id:
-                        stats['cartes_ajoutees'] += 1
-                        cartes_traitees.add(numero_carte)
-                    else:
-                        stats['cartes_existantes'] += 1
-                        cartes_traitees.add(numero_carte)
-                
-                # Récupérer l'ID de la carte
-                carte_id = self.db.get_connection().execute(
-                    'SELECT id FROM cartes WHERE numero_carte = ?', (numero_carte,)
-                ).fetchone()
-                
-                if not carte_id:
-                    print(f"❌ Ligne {i} : impossible de trouver la carte {numero_carte}")
-                    stats['erreurs'] += 1
-                    continue
-                
-                carte_id = carte_id[0]
-                
-                # Récupérer/créer l'ID de la rareté
-                rarete_id = self.db.get_rarete_id(nom_rarete)
-                
-                # Créer le lien carte-rareté
-                if self.db.lier_carte_rarete(carte_id, rarete_id):
-                    stats['liens_crees'] += 1
-                
+                lignes_par_serie = self.grouper_par_serie(lot, infos, series_ids)
+                with self.db.connexion():
+                    resultats = [
+                        self.db.charger_lot_fichier(infos['nom_fichier'], infos['empreinte'], serie_id, lignes)
+                        for serie_id, lignes in lignes_par_serie.items()
+                    ]
+                    self.db.enregistrer_point_reprise(
+                        infos['nom_fichier'], infos['empreinte'], code_serie,
+                        position, numero_ligne, nb_lignes
+                    )
+                for resultat in resultats:
+                    for cle, valeur in resultat.items():
+                        stats[cle] = stats.get(cle, 0) + valeur
             except Exception as e:
-                print(f"❌ Erreur ligne {i} : {e}")
-                stats['erreurs'] += 1
-                continue
+                # Le point de reprise reste sur le dernier lot validé : ne rien écrire après
+                print(f"❌ Erreur lors du chargement des cartes : {e}")
+                print(f"⏹️ Chargement de {os.path.basename(infos['nom_fichier'])} arrêté sur ce lot : "
+                      f"relancer avec reprendre=True pour repartir de là")
+                stats['erreurs'] += len(lot)
+                break
+            if suivi:
+                suivi.avancer(len(lot))
+        
+        # Un lot en échec garde l'ancienne empreinte : ne rien retirer, reprendre au prochain import
+        if stats['erreurs'] == 0:
+            stats.update(self.db.finaliser_import_fichier(
+                infos['nom_fichier'], infos['empreinte'], nb_lignes, code_serie
+            ))
+    
+        stats['series'] = len(series_ids)
         
         # Afficher le résumé
-        print(f"\n📊 Import terminé pour {code_serie} :")
+        autres_series = f" et {len(series_ids) - 1} autre(s) série(s)" if len(series_ids) > 1 else ""
+        print(f"\n📊 Import terminé pour {code_serie}{autres_series} :")
         print(f"  ➕ Cartes ajoutées : {stats['cartes_ajoutees']}")
         print(f"  🔗 Liens carte-rareté créés : {stats['liens_crees']}")
         print(f"  ↻  Cartes existantes : {stats['cartes_existantes']}")
+        if stats.get('lignes_reprises'):
+            print(f"  ⏩ Lignes chargées avant l'interruption : {stats['lignes_reprises']}")
+        if stats.get('lignes_inchangees'):
+            print(f"  ⏭️ Lignes inchangées : {stats['lignes_inchangees']}")
+        if stats.get('liens_supprimes') or stats.get('liens_conserves'):
+            print(f"  ➖ Exemplaires retirés : {stats['liens_supprimes']}"
+                  f" ({stats['liens_conserves']} possédés conservés)")
         print(f"  ❌ Erreurs : {stats['erreurs']}")
         
         return stats
     
-    def importer_dossier(self, dossier_csv: str = "convertisseur/temp") -> Dict[str, Dict]:
+    def grouper_par_serie(self, lot: List[Tuple[str, str, str, str]], infos: Dict,
+                          series_ids: Dict[str, int]) -> Dict[int, List[Tuple[str, str, str]]]:
+        """
+        Répartit un lot par série, en créant les séries pas encore résolues
+        
+        Args:
+            lot (List[Tuple[str, str, str, str]]): Lignes (numero_carte, nom_carte, nom_rarete, code_serie)
+            infos (Dict): Infos de la série principale (voir preparer_import) : séries par ligne
+                ou série unique, et série des lignes qui ne donnent pas la leur
+            series_ids (Dict[str, int]): Cache code_serie -> serie_id de l'import, complété ici
+        
+        Returns:
+            Dict[int, List[Tuple[str, str, str]]]: {serie_id: lignes (numero_carte, nom_carte, nom_rarete)}
+        """
+        code_principal = infos['code_serie']
+        par_ligne = infos.get('series_par_ligne', False)
+        lignes_par_serie = {}
+        
+        for numero_carte, nom_carte, nom_rarete, code_serie in lot:
+            if not (par_ligne and code_serie):
+                code_serie = code_principal
+            
+            serie_id = series_ids.get(code_serie)
+            if serie_id is None:
+                if code_serie == code_principal:
+                    nom_serie, url_serie = infos['nom_serie'], infos['url_source']
+                else:
+                    nom_serie, url_serie = self.infos_serie(code_serie)
+                serie_id = series_ids[code_serie] = self.db.ajouter_serie(code_serie, nom_serie, url_serie)
+            
+            lignes_par_serie.setdefault(serie_id, []).append((numero_carte, nom_carte, nom_rarete))
+        
+        return lignes_par_serie
+    
+    def importer_dossier(self, dossier_csv: str = "convertisseur/temp", parallele: bool = False,
+                         nb_lecteurs: int = None, staging: bool = False,
+                         simulation_prealable: bool = False, suivi: SuiviImport = None,
+                         reprendre: bool = False) -> Dict[str, Dict]:
         """
-        Importe tous les fichiers CSV d'un dossier
+        Importe tous les fichiers d'un dossier (CSV, JSONL, Parquet/Arrow)
+        
+        En mode parallèle, des threads lecteurs lisent, valident et découpent
+        les fichiers en lots pendant que le thread appelant, seul à écrire dans
+        la base, charge les lots déjà prêts : la lecture d'un fichier se
+        recouvre avec l'écriture du précédent (SQLite relâche le GIL pendant
+        l'exécution des requêtes). Un import CSV est limité par l'écriture :
+        le gain vient des fichiers coûteux à lire (JSON Lines, disque lent).
+        
+        En mode table de transit, toutes les lignes sont chargées brutes puis
+        fusionnées en une seule passe ensembliste : le plus rapide pour de très
+        gros lots, mais sans suppression des exemplaires retirés d'un fichier.
         
         Args:
             dossier_csv (str): Chemin vers le dossier contenant les CSV
+            parallele (bool): Lire les fichiers en parallèle de l'écriture
+            nb_lecteurs (int, optional): Nombre de threads lecteurs (nombre de cœurs par défaut)
+            staging (bool): Importer par table de transit
+            simulation_prealable (bool): Valider d'abord chaque fichier en entier et
+                écarter, sans rien écrire, ceux qui ont des anomalies bloquantes
+            suivi (SuiviImport, optional): Progression et annulation. Après une
+                annulation, le fichier en cours est annulé et les fichiers restants
+                sont laissés en place, marqués 'annule' ; le fichier en cours garde
+                ses lots déjà validés et son point de reprise (tout est annulé en
+                mode table de transit)
+            reprendre (bool): Reprendre les imports interrompus depuis leur dernier
+                lot validé (sans effet en mode table de transit)
         
         Returns:
             Dict[str, Dict]: Statistiques d'import par fichier
@@ -325,29 +1023,81 @@ class CSVImporter:
             print(f"❌ Dossier non trouvé : {dossier_csv}")
             return {}
         
-        fichiers_csv = [f for f in os.listdir(dossier_csv) if f.endswith('.csv')]
+        fichiers_csv = [f for f in os.listdir(dossier_csv) if est_supporte(f)]
         
         if not fichiers_csv:
-            print(f"❌ Aucun fichier CSV trouvé dans {dossier_csv}")
+            print(f"❌ Aucun fichier CSV, JSONL ou Parquet/Arrow trouvé dans {dossier_csv}")
             return {}
         
-        print(f"📁 Import de {len(fichiers_csv)} fichiers CSV...")
+        print(f"📁 Import de {len(fichiers_csv)} fichiers...")
         
-        resultats = {}
-        fichiers_a_supprimer = []
+        rejetes = {}
+        if simulation_prealable:
+            rapports = self.simuler_import(dossier_csv)
+            for fichier, rapport in rapports.items():
+                if not rapport['valide']:
+                    nb_bloquantes = sum(rapport['nb_anomalies'].get(t, 0) for t in ANOMALIES_BLOQUANTES)
+                    rejetes[fichier] = {
+                        'erreur': f"Simulation : {nb_bloquantes} anomalie(s) bloquante(s)",
+                        'simulation': rapport
+                    }
+            fichiers_a_importer = [f for f in fichiers_csv if f not in rejetes]
+        else:
+            fichiers_a_importer = fichiers_csv
         
-        for fichier in fichiers_csv:
-            chemin_complet = os.path.join(dossier_csv, fichier)
+        if suivi:
+            suivi.demarrer([os.path.join(dossier_csv, f) for f in fichiers_a_importer])
+        
+        if not fichiers_a_importer:
+            resultats = {}
+        elif staging:
             try:
-                stats = self.importer_csv(chemin_complet)
-                resultats[fichier] = stats
-                # Marquer le fichier pour suppression si l'import a réussi
-                if stats.get('cartes_ajoutees', 0) > 0 or stats.get('liens_crees', 0) > 0:
-                    fichiers_a_supprimer.append(chemin_complet)
-                    stats['fichier_supprime'] = True
-            except Exception as e:
-                print(f"❌ Échec import {fichier} : {e}")
-                resultats[fichier] = {'erreur': str(e)}
+                resultats = self._importer_fichiers_staging(dossier_csv, fichiers_a_importer, suivi=suivi)
+            except ImportAnnule:
+                print("⏹️ Import annulé : aucune ligne fusionnée")
+                resultats = {}
+        elif parallele and len(fichiers_a_importer) > 1:
+            resultats = self._importer_fichiers_parallele(dossier_csv, fichiers_a_importer, nb_lecteurs,
+                                                          suivi, reprendre)
+        else:
+            resultats = {}
+            for fichier in fichiers_a_importer:
+                if suivi and suivi.annule:
+                    break
+                chemin_complet = os.path.join(dossier_csv, fichier)
+                try:
+                    resultats[fichier] = self.importer_csv(chemin_complet, suivi=suivi, reprendre=reprendre)
+                except ImportAnnule:
+                    print(f"⏹️ Import annulé pendant {fichier}")
+                    break
+                except Exception as e:
+                    print(f"❌ Échec import {fichier} : {e}")
+                    resultats[fichier] = {'erreur': str(e)}
+                    if suivi:
+                        suivi.terminer_fichier()
+        
+        # Fichiers non terminés après une annulation : au plus leurs premiers lots
+        # sont en base, l'import reprendra après eux avec `reprendre`
+        for fichier in fichiers_a_importer:
+            if fichier not in resultats:
+                resultats[fichier] = {'erreur': "Import annulé", 'annule': True}
+        
+        resultats.update(rejetes)
+        resultats = {fichier: resultats[fichier] for fichier in fichiers_csv}
+        
+        # Marquer les fichiers pour suppression si l'import a réussi
+        # (cartes existantes incluses : le fichier a bien été traité). Un fichier
+        # avec des erreurs est gardé : son import reprendra au lot en échec
+        fichiers_a_supprimer = []
+        for fichier, stats in resultats.items():
+            if stats.get('erreurs'):
+                continue
+            if (stats.get('cartes_ajoutees', 0) > 0 or stats.get('liens_crees', 0) > 0
+                    or stats.get('cartes_existantes', 0) > 0 or stats.get('lignes_inchangees', 0) > 0
+                    or stats.get('liens_supprimes', 0) > 0 or stats.get('lignes_reprises', 0) > 0
+                    or stats.get('fichier_inchange')):
+                fichiers_a_supprimer.append(os.path.join(dossier_csv, fichier))
+                stats['fichier_supprime'] = True
         
         # Supprimer les fichiers importés avec succès
         for chemin_fichier in fichiers_a_supprimer:
@@ -359,6 +1109,223 @@ class CSVImporter:
                 print(f"⚠️ Impossible de supprimer {nom_fichier} : {e}")
         
         return resultats
+    
+    def _importer_fichiers_parallele(self, dossier_csv: str, fichiers_csv: List[str],
+                                     nb_lecteurs: int = None, suivi: SuiviImport = None,
+                                     reprendre: bool = False) -> Dict[str, Dict]:
+        """
+        Lit les fichiers dans un pool de threads et les écrit un par un depuis ce thread
+        
+        Chaque lecteur passe les lots validés de son fichier à l'écrivain par
+        une file bornée (LOTS_EN_AVANCE lots) : au plus un fichier par lecteur
+        est en mémoire, quelques lots à la fois. Les fichiers sont écrits dans
+        l'ordre où ils ont été confiés aux lecteurs.
+        """
+        resultats = {}
+        empreintes = {}
+        points = {}
+        a_lire = []
+        for fichier in fichiers_csv:
+            chemin = os.path.join(dossier_csv, fichier)
+            try:
+                # Les fichiers inchangés ne sont même pas confiés aux lecteurs
+                empreintes[fichier] = empreinte_fichier(chemin)
+                inchange = self.verifier_manifeste(chemin, empreintes[fichier])
+                points[fichier] = None if inchange else self.verifier_point_reprise(
+                    chemin, empreintes[fichier], reprendre)
+            except Exception as e:
+                print(f"❌ Échec import {fichier} : {e}")
+                resultats[fichier] = {'erreur': str(e)}
+                continue
+            
+            if inchange:
+                resultats[fichier] = inchange
+                if suivi:
+                    suivi.commencer_fichier(fichier)
+                    suivi.terminer_fichier()
+            else:
+                a_lire.append(fichier)
+        
+        if not a_lire:
+            return resultats
+        
+        nb_lecteurs = min(nb_lecteurs or os.cpu_count() or 1, len(a_lire))
+        print(f"⚡ Lecture parallèle sur {nb_lecteurs} threads")
+        
+        files = {fichier: queue.Queue(maxsize=LOTS_EN_AVANCE) for fichier in a_lire}
+        arrets = {fichier: threading.Event() for fichier in a_lire}
+        with ThreadPoolExecutor(max_workers=nb_lecteurs, thread_name_prefix="lecteur_import") as executeur:
+            for fichier in a_lire:
+                executeur.submit(self._lire_fichier_en_lots, os.path.join(dossier_csv, fichier),
+                                 points[fichier], files[fichier], arrets[fichier])
+            
+            try:
+                # Écrivain unique, dans l'ordre de soumission : le lecteur du fichier
+                # attendu est toujours lancé, les précédents ont terminé
+                for fichier in a_lire:
+                    if suivi and suivi.annule:
+                        break
+                    if suivi:
+                        suivi.commencer_fichier(fichier)
+                    chemin = os.path.join(dossier_csv, fichier)
+                    try:
+                        recus = self._lots_recus(files[fichier])
+                        infos = next(recus)
+                        infos['nom_fichier'] = cle_fichier(chemin)
+                        infos['empreinte'] = empreintes[fichier]
+                        print(f"📥 Import du fichier : {chemin}")
+                        resultats[fichier] = self.ecrire_lots(infos, recus, suivi)
+                    except ImportAnnule:
+                        print(f"⏹️ Import annulé pendant {fichier}")
+                        break
+                    except Exception as e:
+                        print(f"❌ Échec import {fichier} : {e}")
+                        resultats[fichier] = {'erreur': str(e)}
+                    finally:
+                        # Chargement arrêté avant la fin : libérer le lecteur
+                        arrets[fichier].set()
+                    if suivi:
+                        suivi.terminer_fichier()
+            finally:
+                for arret in arrets.values():
+                    arret.set()
+        
+        return resultats
+    
+    def _lire_fichier_en_lots(self, chemin: str, point: Optional[Dict],
+                              file_lots: queue.Queue, arret: threading.Event):
+        """
+        Lecteur de l'import parallèle : valide un fichier et passe ses lots à l'écrivain
+        
+        Envoie ('infos', infos de série), puis ('lot', (lot, point de reprise))
+        pour chaque lot et ('fin', None) ; ('erreur', exception) si la lecture
+        échoue. S'arrête dès que l'écrivain lève `arret`.
+        """
+        def envoyer(message) -> bool:
+            while not arret.is_set():
+                try:
+                    file_lots.put(message, timeout=0.2)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        try:
+            infos, lots = self.preparer_import(chemin, taille_lot=TAILLE_LOT_DEFAUT, reprise=point)
+            if not envoyer(('infos', infos)):
+                return
+            for lot in lots:
+                if not envoyer(('lot', lot)):
+                    return
+        except Exception as e:
+            envoyer(('erreur', e))
+            return
+        envoyer(('fin', None))
+    
+    @staticmethod
+    def _lots_recus(file_lots: queue.Queue) -> Iterator:
+        """Infos de série puis lots d'un fichier, tels que les envoie son lecteur"""
+        while True:
+            nature, contenu = file_lots.get()
+            if nature == 'fin':
+                return
+            if nature == 'erreur':
+                raise contenu
+            yield contenu
+    
+    def _importer_fichiers_staging(self, dossier_csv: str, fichiers_csv: List[str],
+                                   taille_lot: int = TAILLE_LOT_DEFAUT,
+                                   suivi: SuiviImport = None) -> Dict[str, Dict]:
+        """
+        Charge les lignes brutes de tous les fichiers dans une table de transit,
+        puis les fusionne dans la base en quelques requêtes ensemblistes
+        
+        Mode additif : les exemplaires retirés d'un fichier ne sont pas supprimés.
+        Tout se fait dans une seule transaction : une annulation (ImportAnnule)
+        n'écrit rien.
+        """
+        print("🚚 Import par table de transit")
+        resultats = {}
+        empreintes = {}
+        # Les lignes de transit portent la clé du manifeste de leur fichier
+        noms_fichiers = {}
+        
+        with self.db.chargement_en_masse():
+            self.db.preparer_staging()
+            
+            for fichier in fichiers_csv:
+                chemin = os.path.join(dossier_csv, fichier)
+                cle = cle_fichier(chemin)
+                noms_fichiers[cle] = fichier
+                if suivi:
+                    suivi.commencer_fichier(fichier, etape="Lecture")
+                try:
+                    empreintes[cle] = empreinte_fichier(chemin)
+                    inchange = self.verifier_manifeste(chemin, empreintes[cle])
+                    if inchange:
+                        resultats[fichier] = inchange
+                        if suivi:
+                            suivi.terminer_fichier()
+                        continue
+                    
+                    lecteur = self.lecteur_pour(chemin)
+                    erreur_format = self.verifier_entetes(lecteur.colonnes(chemin))
+                    if erreur_format:
+                        raise ValueError(f"Format {lecteur.nom} invalide : {erreur_format}")
+                    
+                    for numeros_ligne, codes, noms, raretes, numeros in lecteur.lire_colonnes(chemin, taille_lot):
+                        if suivi:
+                            suivi.verifier()
+                        # Rareté illisible : ligne écartée comme une donnée manquante
+                        raretes = [self.normaliser_rarete(rarete) for rarete in raretes]
+                        codes = [self.code_serie_ligne(code, numero) or code for code, numero in zip(codes, numeros)]
+                        self.db.charger_staging(list(zip(itertools.repeat(cle), numeros_ligne,
+                                                         codes, noms, raretes, numeros)))
+                        if suivi:
+                            suivi.avancer(len(numeros_ligne))
+                except ImportAnnule:
+                    raise
+                except Exception as e:
+                    print(f"❌ Échec import {fichier} : {e}")
+                    self.db.retirer_staging(cle)
+                    resultats[fichier] = {'erreur': str(e)}
+                    empreintes.pop(cle, None)
+                if suivi:
+                    suivi.terminer_fichier()
+            
+            if suivi:
+                suivi.verifier()
+                suivi.commencer_fichier(f"{len(fichiers_csv)} fichiers", etape="Fusion")
+            
+            # Noms des séries depuis le registre des URLs (une seule lecture)
+            urls_sauvees = self.charger_urls_sauvees()
+            infos_series = {}
+            for code_serie in self.db.valider_staging():
+                infos_series[code_serie] = self.infos_serie(code_serie, urls_sauvees)
+            
+            fusion = self.db.fusionner_staging(infos_series, empreintes)
+        
+        for erreur in fusion['lignes_en_erreur']:
+            print(f"⚠️ {noms_fichiers[erreur['fichier']]}, ligne {erreur['ligne']} : {erreur['erreur']}")
+        
+        for cle, stats in fusion['par_fichier'].items():
+            fichier = noms_fichiers[cle]
+            stats.pop('lignes')
+            resultats[fichier] = stats
+            print(f"✅ {fichier} : {stats['cartes_ajoutees']} cartes ajoutées, "
+                  f"{stats['liens_crees']} liens créés, {stats['cartes_existantes']} cartes existantes, "
+                  f"{stats['erreurs']} erreurs")
+        
+        if fusion['series_ajoutees']:
+            print(f"📦 {fusion['series_ajoutees']} série(s) créée(s)")
+        
+        # Fichier vide (en-têtes seuls) : rien à fusionner
+        for fichier in fichiers_csv:
+            if fichier not in resultats:
+                nom_format = self.lecteur_pour(fichier).nom
+                resultats[fichier] = {'erreur': f"Format {nom_format} invalide : Fichier {nom_format} sans données"}
+        
+        return {fichier: resultats[fichier] for fichier in fichiers_csv}
 
 # Test et utilitaires
 def tester_import():
@@ -392,7 +1359,23 @@ def tester_import():
                 except Exception as e:
                     print(f"❌ Erreur : {e}")
     
+    importer.db.afficher_statistiques_requetes()
     print("✅ Test terminé")
 
 if __name__ == "__main__":
+    if "--simuler" in sys.argv[1:-1]:
+        # python csv_importer.py --simuler <fichier_ou_dossier>
+        # (raretés vérifiées seulement si la base existe déjà : la simulation ne crée rien)
+        chemin_base = "database/collection.db"
+        importer = CSVImporter(DatabaseManager(chemin_base)) if os.path.exists(chemin_base) else CSVImporter.sans_base()
+        rapports = importer.simuler_import(sys.argv[-1])
+        sys.exit(0 if all(r['valide'] for r in rapports.values()) else 1)
+    if "--reprendre" in sys.argv[1:-1]:
+        # python csv_importer.py --reprendre <fichier_ou_dossier>
+        importer = CSVImporter(DatabaseManager("database/collection.db"))
+        if os.path.isdir(sys.argv[-1]):
+            importer.importer_dossier(sys.argv[-1], reprendre=True)
+        else:
+            importer.importer_csv(sys.argv[-1], reprendre=True)
+        sys.exit(0)
     tester_import()
\ No newline at end of file
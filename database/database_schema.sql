@@ -1,8 +1,10 @@
 -- 🎯 Schema SQLite pour Collection Yu-Gi-Oh
 -- Base de données: collection.db
+-- Les évolutions ultérieures (compteurs matérialisés, ...) sont appliquées
+-- par les migrations de db_manager.py (PRAGMA user_version)
 
 -- Table des séries Yu-Gi-Oh
-CREATE TABLE series (
+CREATE TABLE IF NOT EXISTS series (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     code_serie VARCHAR(10) NOT NULL UNIQUE,           -- BLMM, RA02, CYAC
     nom_serie VARCHAR(100) NOT NULL,                  -- "Monster Mayhem", "25th Anniversary"
@@ -12,20 +14,18 @@ CREATE TABLE series (
 );
 
 -- Table des cartes
-CREATE TABLE cartes (
+CREATE TABLE IF NOT EXISTS cartes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     numero_carte VARCHAR(20) NOT NULL UNIQUE,        -- BLMM-FR001, RA02-FR001
     nom_carte VARCHAR(200) NOT NULL,                 -- "Dragon Blanc aux Yeux Bleus"
     serie_id INTEGER NOT NULL,                       -- Référence vers series.id
     date_ajout DATETIME DEFAULT CURRENT_TIMESTAMP,
     
-    FOREIGN KEY (serie_id) REFERENCES series (id),
-    INDEX idx_numero (numero_carte),
-    INDEX idx_serie (serie_id)
+    FOREIGN KEY (serie_id) REFERENCES series (id)
 );
 
 -- Table des raretés
-CREATE TABLE raretes (
+CREATE TABLE IF NOT EXISTS raretes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     nom_rarete VARCHAR(50) NOT NULL UNIQUE,          -- "Secret Rare", "Ultra Rare"
     couleur_hex VARCHAR(7),                          -- Couleur d'affichage (optionnel)
@@ -33,7 +33,7 @@ CREATE TABLE raretes (
 );
 
 -- Table de liaison cartes-raretés (many-to-many)
-CREATE TABLE carte_raretes (
+CREATE TABLE IF NOT EXISTS carte_raretes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     carte_id INTEGER NOT NULL,
     rarete_id INTEGER NOT NULL,
@@ -45,15 +45,21 @@ CREATE TABLE carte_raretes (
     
     FOREIGN KEY (carte_id) REFERENCES cartes (id),
     FOREIGN KEY (rarete_id) REFERENCES raretes (id),
-    UNIQUE (carte_id, rarete_id),                   -- Une carte-rareté unique
-    INDEX idx_possession (possedee),
-    INDEX idx_carte_rarete (carte_id, rarete_id)
+    UNIQUE (carte_id, rarete_id)                    -- Une carte-rareté unique
 );
 
+-- Index (SQLite n'accepte pas INDEX dans CREATE TABLE)
+-- numero_carte et (carte_id, rarete_id) sont déjà indexés par leurs contraintes UNIQUE
+CREATE INDEX IF NOT EXISTS idx_cartes_serie_numero ON cartes (serie_id, numero_carte);
+CREATE INDEX IF NOT EXISTS idx_carte_raretes_carte_rarete ON carte_raretes (carte_id, rarete_id, possedee);
+CREATE INDEX IF NOT EXISTS idx_carte_raretes_rarete ON carte_raretes (rarete_id);
+CREATE INDEX IF NOT EXISTS idx_carte_raretes_non_possedees ON carte_raretes (carte_id, rarete_id)
+    WHERE possedee = 0;                             -- Index partiel des exemplaires manquants
+
 -- Vues pratiques pour les requêtes
 
 -- Vue collection complète
-CREATE VIEW vue_collection AS
+CREATE VIEW IF NOT EXISTS vue_collection AS
 SELECT 
     s.code_serie,
     s.nom_serie,
@@ -71,7 +77,7 @@ JOIN raretes r ON cr.rarete_id = r.id
 ORDER BY s.code_serie, c.numero_carte, r.ordre_tri;
 
 -- Vue statistiques par série
-CREATE VIEW vue_stats_series AS
+CREATE VIEW IF NOT EXISTS vue_stats_series AS
 SELECT 
     s.code_serie,
     s.nom_serie,
@@ -88,7 +94,7 @@ GROUP BY s.id, s.code_serie, s.nom_serie
 ORDER BY s.code_serie;
 
 -- Insertion des raretés standards
-INSERT INTO raretes (nom_rarete, ordre_tri) VALUES 
+INSERT OR IGNORE INTO raretes (nom_rarete, ordre_tri) VALUES 
 ('Common', 1),
 ('Rare', 2),
 ('Super Rare', 3),
@@ -102,18 +108,26 @@ INSERT INTO raretes (nom_rarete, ordre_tri) VALUES
 ('Quarter Century Secret Rare', 11);
 
 -- Triggers pour maintenir les compteurs
-CREATE TRIGGER update_nb_cartes_insert 
+CREATE TRIGGER IF NOT EXISTS update_nb_cartes_insert 
 AFTER INSERT ON cartes 
 BEGIN
-    UPDATE series SET nb_cartes_total = (
-        SELECT COUNT(*) FROM cartes WHERE serie_id = NEW.serie_id
-    ) WHERE id = NEW.serie_id;
+    UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) + 1
+    WHERE id = NEW.serie_id;
 END;
 
-CREATE TRIGGER update_nb_cartes_delete 
+CREATE TRIGGER IF NOT EXISTS update_nb_cartes_delete 
 AFTER DELETE ON cartes 
 BEGIN
-    UPDATE series SET nb_cartes_total = (
-        SELECT COUNT(*) FROM cartes WHERE serie_id = OLD.serie_id
-    ) WHERE id = OLD.serie_id;
+    UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) - 1
+    WHERE id = OLD.serie_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_nb_cartes_serie 
+AFTER UPDATE OF serie_id ON cartes 
+WHEN OLD.serie_id <> NEW.serie_id
+BEGIN
+    UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) - 1
+    WHERE id = OLD.serie_id;
+    UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) + 1
+    WHERE id = NEW.serie_id;
 END;
\ No newline at end of file
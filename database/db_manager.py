@@ -6,20 +6,600 @@ Gestionnaire de base de données SQLite pour la collection Yu-Gi-Oh
 
 import sqlite3
 import os
+import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
+try:
+    from . import instrumentation
+except ImportError:
+    import instrumentation
+
+try:
+    from shared.raretes import NormaliseurRaretes
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+    from raretes import NormaliseurRaretes
+
+# Nombre maximal de paramètres par clause IN (limite SQLite par défaut : 999)
+TAILLE_MAX_CLAUSE_IN = 500
+
+# Schéma de base : tables, raretés standards, triggers et vues (idempotent)
+SCHEMA_BASE_SQL = '''
+    CREATE TABLE IF NOT EXISTS series (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        code_serie VARCHAR(10) NOT NULL UNIQUE,
+        nom_serie VARCHAR(100) NOT NULL,
+        url_source TEXT,
+        date_ajout DATETIME DEFAULT CURRENT_TIMESTAMP,
+        nb_cartes_total INTEGER DEFAULT 0
+    );
+    
+    CREATE TABLE IF NOT EXISTS cartes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        numero_carte VARCHAR(20) NOT NULL UNIQUE,
+        nom_carte VARCHAR(200) NOT NULL,
+        serie_id INTEGER NOT NULL,
+        date_ajout DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (serie_id) REFERENCES series (id)
+    );
+    
+    CREATE TABLE IF NOT EXISTS raretes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nom_rarete VARCHAR(50) NOT NULL UNIQUE,
+        couleur_hex VARCHAR(7),
+        ordre_tri INTEGER DEFAULT 0
+    );
+    
+    CREATE TABLE IF NOT EXISTS carte_raretes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        carte_id INTEGER NOT NULL,
+        rarete_id INTEGER NOT NULL,
+        possedee BOOLEAN DEFAULT FALSE,
+        date_acquisition DATE,
+        condition VARCHAR(20) DEFAULT 'NM',
+        prix_achat DECIMAL(10,2),
+        notes TEXT,
+        FOREIGN KEY (carte_id) REFERENCES cartes (id),
+        FOREIGN KEY (rarete_id) REFERENCES raretes (id),
+        UNIQUE (carte_id, rarete_id)
+    );
+    
+    INSERT OR IGNORE INTO raretes (nom_rarete, ordre_tri) VALUES
+        ('Common', 1), ('Rare', 2), ('Super Rare', 3), ('Ultra Rare', 4),
+        ('Secret Rare', 5), ('Ultimate Rare', 6), ('Ghost Rare', 7),
+        ('Starlight Rare', 8), ('Collector''s Rare', 9),
+        ('Platinum Secret Rare', 10), ('Quarter Century Secret Rare', 11);
+    
+    CREATE VIEW IF NOT EXISTS vue_collection AS
+    SELECT 
+        s.code_serie,
+        s.nom_serie,
+        c.numero_carte,
+        c.nom_carte,
+        r.nom_rarete,
+        cr.possedee,
+        cr.date_acquisition,
+        cr.condition,
+        cr.prix_achat
+    FROM carte_raretes cr
+    JOIN cartes c ON cr.carte_id = c.id
+    JOIN series s ON c.serie_id = s.id  
+    JOIN raretes r ON cr.rarete_id = r.id
+    ORDER BY s.code_serie, c.numero_carte, r.ordre_tri;
+    
+    CREATE VIEW IF NOT EXISTS vue_stats_series AS
+    SELECT 
+        s.code_serie,
+        s.nom_serie,
+        COUNT(cr.id) as total_exemplaires,
+        SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END) as possedes,
+        ROUND(
+            (SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END) * 100.0) / COUNT(cr.id), 
+            2
+        ) as pourcentage_collection
+    FROM series s
+    LEFT JOIN cartes c ON s.id = c.serie_id
+    LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
+    GROUP BY s.id, s.code_serie, s.nom_serie
+    ORDER BY s.code_serie;
+    
+    CREATE TRIGGER IF NOT EXISTS update_nb_cartes_insert 
+    AFTER INSERT ON cartes 
+    BEGIN
+        UPDATE series SET nb_cartes_total = (
+            SELECT COUNT(*) FROM cartes WHERE serie_id = NEW.serie_id
+        ) WHERE id = NEW.serie_id;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS update_nb_cartes_delete 
+    AFTER DELETE ON cartes 
+    BEGIN
+        UPDATE series SET nb_cartes_total = (
+            SELECT COUNT(*) FROM cartes WHERE serie_id = OLD.serie_id
+        ) WHERE id = OLD.serie_id;
+    END;
+'''
+
+# Compteurs matérialisés (série, rareté) -> exemplaires / possédés,
+# tenus à jour par triggers pour éviter de recalculer la jointure complète
+STATS_SERIES_RARETES_SQL = '''
+    CREATE TABLE IF NOT EXISTS stats_series_raretes (
+        serie_id INTEGER NOT NULL,
+        rarete_id INTEGER NOT NULL,
+        total INTEGER NOT NULL DEFAULT 0,
+        possedes INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (serie_id, rarete_id)
+    ) WITHOUT ROWID;
+    
+    CREATE INDEX IF NOT EXISTS idx_stats_series_raretes_rarete ON stats_series_raretes (rarete_id);
+    
+    CREATE TRIGGER IF NOT EXISTS stats_carte_raretes_insert
+    AFTER INSERT ON carte_raretes
+    BEGIN
+        INSERT INTO stats_series_raretes (serie_id, rarete_id, total, possedes)
+        SELECT c.serie_id, NEW.rarete_id, 1, CASE WHEN NEW.possedee THEN 1 ELSE 0 END
+        FROM cartes c WHERE c.id = NEW.carte_id
+        ON CONFLICT (serie_id, rarete_id) DO UPDATE SET
+            total = total + excluded.total,
+            possedes = possedes + excluded.possedes;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS stats_carte_raretes_delete
+    AFTER DELETE ON carte_raretes
+    BEGIN
+        UPDATE stats_series_raretes
+        SET total = total - 1,
+            possedes = possedes - (CASE WHEN OLD.possedee THEN 1 ELSE 0 END)
+        WHERE rarete_id = OLD.rarete_id
+        AND serie_id = (SELECT serie_id FROM cartes WHERE id = OLD.carte_id);
+    END;
+    
+    -- Cas courant : bascule possédé / non possédé
+    CREATE TRIGGER IF NOT EXISTS stats_carte_raretes_possession
+    AFTER UPDATE OF possedee ON carte_raretes
+    WHEN OLD.carte_id = NEW.carte_id AND OLD.rarete_id = NEW.rarete_id
+    BEGIN
+        UPDATE stats_series_raretes
+        SET possedes = possedes
+            + (CASE WHEN NEW.possedee THEN 1 ELSE 0 END)
+            - (CASE WHEN OLD.possedee THEN 1 ELSE 0 END)
+        WHERE rarete_id = NEW.rarete_id
+        AND serie_id = (SELECT serie_id FROM cartes WHERE id = NEW.carte_id);
+    END;
+    
+    -- Changement de carte ou de rareté : retirer l'ancien couple, ajouter le nouveau
+    CREATE TRIGGER IF NOT EXISTS stats_carte_raretes_deplacement
+    AFTER UPDATE OF carte_id, rarete_id ON carte_raretes
+    WHEN OLD.carte_id <> NEW.carte_id OR OLD.rarete_id <> NEW.rarete_id
+    BEGIN
+        UPDATE stats_series_raretes
+        SET total = total - 1,
+            possedes = possedes - (CASE WHEN OLD.possedee THEN 1 ELSE 0 END)
+        WHERE rarete_id = OLD.rarete_id
+        AND serie_id = (SELECT serie_id FROM cartes WHERE id = OLD.carte_id);
+        
+        INSERT INTO stats_series_raretes (serie_id, rarete_id, total, possedes)
+        SELECT c.serie_id, NEW.rarete_id, 1, CASE WHEN NEW.possedee THEN 1 ELSE 0 END
+        FROM cartes c WHERE c.id = NEW.carte_id
+        ON CONFLICT (serie_id, rarete_id) DO UPDATE SET
+            total = total + excluded.total,
+            possedes = possedes + excluded.possedes;
+    END;
+    
+    -- Carte déplacée vers une autre série : transférer ses exemplaires
+    CREATE TRIGGER IF NOT EXISTS stats_cartes_changement_serie
+    AFTER UPDATE OF serie_id ON cartes
+    WHEN OLD.serie_id <> NEW.serie_id
+    BEGIN
+        UPDATE stats_series_raretes
+        SET total = total - (
+                SELECT COUNT(*) FROM carte_raretes cr
+                WHERE cr.carte_id = NEW.id AND cr.rarete_id = stats_series_raretes.rarete_id
+            ),
+            possedes = possedes - (
+                SELECT COUNT(*) FROM carte_raretes cr
+                WHERE cr.carte_id = NEW.id AND cr.rarete_id = stats_series_raretes.rarete_id
+                AND cr.possedee
+            )
+        WHERE serie_id = OLD.serie_id;
+        
+        INSERT INTO stats_series_raretes (serie_id, rarete_id, total, possedes)
+        SELECT NEW.serie_id, cr.rarete_id, COUNT(*), SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END)
+        FROM carte_raretes cr WHERE cr.carte_id = NEW.id
+        GROUP BY cr.rarete_id
+        ON CONFLICT (serie_id, rarete_id) DO UPDATE SET
+            total = total + excluded.total,
+            possedes = possedes + excluded.possedes;
+    END;
+    
+    -- Carte supprimée : ses exemplaires ne comptent plus
+    CREATE TRIGGER IF NOT EXISTS stats_cartes_delete
+    AFTER DELETE ON cartes
+    BEGIN
+        UPDATE stats_series_raretes
+        SET total = total - (
+                SELECT COUNT(*) FROM carte_raretes cr
+                WHERE cr.carte_id = OLD.id AND cr.rarete_id = stats_series_raretes.rarete_id
+            ),
+            possedes = possedes - (
+                SELECT COUNT(*) FROM carte_raretes cr
+                WHERE cr.carte_id = OLD.id AND cr.rarete_id = stats_series_raretes.rarete_id
+                AND cr.possedee
+            )
+        WHERE serie_id = OLD.serie_id;
+    END;
+'''
+
+# Compteur nb_cartes_total tenu à jour en O(1) par incrément / décrément
+TRIGGERS_NB_CARTES_SQL = '''
+    CREATE TRIGGER IF NOT EXISTS update_nb_cartes_insert 
+    AFTER INSERT ON cartes 
+    BEGIN
+        UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) + 1
+        WHERE id = NEW.serie_id;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS update_nb_cartes_delete 
+    AFTER DELETE ON cartes 
+    BEGIN
+        UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) - 1
+        WHERE id = OLD.serie_id;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS update_nb_cartes_serie 
+    AFTER UPDATE OF serie_id ON cartes 
+    WHEN OLD.serie_id <> NEW.serie_id
+    BEGIN
+        UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) - 1
+        WHERE id = OLD.serie_id;
+        UPDATE series SET nb_cartes_total = COALESCE(nb_cartes_total, 0) + 1
+        WHERE id = NEW.serie_id;
+    END;
+'''
+
+SUPPRIMER_TRIGGERS_NB_CARTES_SQL = '''
+    DROP TRIGGER IF EXISTS update_nb_cartes_insert;
+    DROP TRIGGER IF EXISTS update_nb_cartes_delete;
+    DROP TRIGGER IF EXISTS update_nb_cartes_serie;
+'''
+
+RECALCULER_NB_CARTES_SQL = '''
+    UPDATE series SET nb_cartes_total = (
+        SELECT COUNT(*) FROM cartes WHERE serie_id = series.id
+    );
+'''
+
+# Import massif : seul le trigger d'insertion est suspendu, puis les séries
+# des cartes insérées depuis le début du chargement (id > ?) sont recomptées
+SUSPENDRE_TRIGGER_INSERTION_SQL = '''
+    DROP TRIGGER IF EXISTS update_nb_cartes_insert;
+'''
+
+RECALCULER_NB_CARTES_CHARGEES_SQL = '''
+    UPDATE series SET nb_cartes_total = (
+        SELECT COUNT(*) FROM cartes WHERE serie_id = series.id
+    )
+    WHERE id IN (SELECT DISTINCT serie_id FROM cartes WHERE id > ?)
+'''
+
+# Recalcul complet des compteurs matérialisés (réparation)
+RECONSTRUIRE_STATS_SQL = '''
+    DELETE FROM stats_series_raretes;
+    
+    INSERT INTO stats_series_raretes (serie_id, rarete_id, total, possedes)
+    SELECT c.serie_id, cr.rarete_id, COUNT(*), SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END)
+    FROM carte_raretes cr
+    JOIN cartes c ON c.id = cr.carte_id
+    GROUP BY c.serie_id, cr.rarete_id;
+''' + RECALCULER_NB_CARTES_SQL
+
+# Tables temporaires du mode d'import par table de transit (staging)
+STAGING_SQL = '''
+    CREATE TEMP TABLE IF NOT EXISTS import_staging (
+        id INTEGER PRIMARY KEY,
+        fichier TEXT NOT NULL,
+        ligne INTEGER NOT NULL,
+        code_serie TEXT,
+        nom_carte TEXT,
+        nom_rarete TEXT,
+        numero_carte TEXT,
+        erreur TEXT
+    );
+    
+    CREATE INDEX IF NOT EXISTS temp.idx_import_staging_exemplaire
+        ON import_staging (numero_carte, nom_rarete);
+    
+    CREATE TEMP TABLE IF NOT EXISTS import_staging_series (
+        code_serie TEXT PRIMARY KEY,
+        nom_serie TEXT NOT NULL,
+        url_source TEXT
+    );
+    
+    CREATE TEMP TABLE IF NOT EXISTS import_staging_fichiers (
+        fichier TEXT PRIMARY KEY,
+        empreinte_sha256 TEXT NOT NULL
+    );
+    
+    DELETE FROM import_staging;
+    DELETE FROM import_staging_series;
+    DELETE FROM import_staging_fichiers;
+'''
+
+# Migrations du schéma : (version, description, script SQL idempotent).
+# La version courante est stockée dans PRAGMA user_version.
+MIGRATIONS = [
+    (1, "Schéma de base", SCHEMA_BASE_SQL),
+    (2, "Index des requêtes de collection et de statistiques", '''
+        CREATE INDEX IF NOT EXISTS idx_cartes_serie_numero ON cartes (serie_id, numero_carte);
+        CREATE INDEX IF NOT EXISTS idx_carte_raretes_carte_rarete ON carte_raretes (carte_id, rarete_id, possedee);
+        CREATE INDEX IF NOT EXISTS idx_carte_raretes_rarete ON carte_raretes (rarete_id);
+        CREATE INDEX IF NOT EXISTS idx_carte_raretes_non_possedees ON carte_raretes (carte_id, rarete_id)
+            WHERE possedee = 0;
+        ANALYZE;
+    '''),
+    (3, "Compteurs matérialisés par série et rareté", STATS_SERIES_RARETES_SQL + RECONSTRUIRE_STATS_SQL),
+    (4, "Triggers nb_cartes_total en O(1)",
+        SUPPRIMER_TRIGGERS_NB_CARTES_SQL + TRIGGERS_NB_CARTES_SQL + RECALCULER_NB_CARTES_SQL),
+    (5, "Manifeste des fichiers importés", '''
+        CREATE TABLE IF NOT EXISTS imports_fichiers (
+            nom_fichier TEXT PRIMARY KEY,
+            empreinte_sha256 CHAR(64) NOT NULL,
+            nb_lignes INTEGER NOT NULL DEFAULT 0,
+            code_serie VARCHAR(10),
+            date_import DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- Exemplaires (numéro, rareté) fournis par chaque fichier, marqués par
+        -- l'empreinte de la dernière version du fichier qui les contenait
+        CREATE TABLE IF NOT EXISTS imports_lignes (
+            nom_fichier TEXT NOT NULL,
+            numero_carte VARCHAR(20) NOT NULL,
+            nom_rarete VARCHAR(50) NOT NULL,
+            nom_carte VARCHAR(200) NOT NULL,
+            empreinte_sha256 CHAR(64) NOT NULL,
+            PRIMARY KEY (nom_fichier, numero_carte, nom_rarete)
+        ) WITHOUT ROWID;
+        
+        CREATE INDEX IF NOT EXISTS idx_imports_lignes_exemplaire ON imports_lignes (numero_carte, nom_rarete);
+    '''),
+    (6, "Points de reprise des imports interrompus", '''
+        -- Dernier lot validé d'un import en cours : position dans le fichier
+        -- (octet pour CSV/JSONL, rang pour Arrow) et numéro de la ligne suivante
+        CREATE TABLE IF NOT EXISTS imports_reprises (
+            nom_fichier TEXT PRIMARY KEY,
+            empreinte_sha256 CHAR(64) NOT NULL,
+            code_serie VARCHAR(10) NOT NULL,
+            position INTEGER NOT NULL,
+            numero_ligne INTEGER NOT NULL,
+            nb_lignes INTEGER NOT NULL,
+            date_maj DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+    '''),
+]
+
+def executer_script(conn: sqlite3.Connection, script: str):
+    """
+    Exécute un script SQL instruction par instruction dans la transaction courante
+    
+    Contrairement à executescript(), aucun COMMIT implicite n'est émis : le script
+    est validé ou annulé avec la transaction de l'appelant.
+    """
+    instruction = ""
+    for ligne in script.splitlines(keepends=True):
+        instruction += ligne
+        if sqlite3.complete_statement(instruction):
+            conn.execute(instruction)
+            instruction = ""
+    
+    if instruction.strip():
+        conn.execute(instruction)
+
+class GestionnaireConnexions:
+    """
+    Pool de connexions SQLite persistantes : une connexion par thread,
+    ouverte à la première utilisation et réutilisée ensuite.
+    """
+    
+    def __init__(self, db_path: str, taille_cache_requetes: int = 256):
+        """
+        Args:
+            db_path (str): Chemin vers le fichier de base de données
+            taille_cache_requetes (int): Nombre de requêtes préparées gardées en cache par connexion
+        """
+        self.db_path = db_path
+        self.taille_cache_requetes = taille_cache_requetes
+        self._local = threading.local()
+        self._verrou = threading.Lock()
+        self._connexions = []
+    
+    def ouvrir(self) -> sqlite3.Connection:
+        """Ouvre une nouvelle connexion configurée (WAL, cache de requêtes)"""
+        # check_same_thread=False uniquement pour pouvoir fermer le pool depuis
+        # n'importe quel thread : chaque connexion reste propre à un seul thread
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            cached_statements=self.taille_cache_requetes,
+            check_same_thread=False,
+            factory=instrumentation.fabrique_connexion()
+        )
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        conn.execute('PRAGMA cache_size = -16000')  # ~16 Mo de cache de pages
+        return conn
+    
+    def obtenir(self) -> sqlite3.Connection:
+        """Retourne la connexion persistante du thread courant"""
+        conn = getattr(self._local, 'connexion', None)
+        if conn is None:
+            conn = self.ouvrir()
+            self._local.connexion = conn
+            self._local.profondeur = 0
+            with self._verrou:
+                self._connexions.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Contexte transactionnel sur la connexion du thread courant.
+        
+        Le niveau le plus externe ouvre la transaction et la valide (ou l'annule
+        en cas d'exception) ; les niveaux imbriqués utilisent des SAVEPOINT.
+        """
+        conn = self.obtenir()
+        profondeur = self._local.profondeur
+        savepoint = f"sp_{profondeur}"
+        
+        if profondeur == 0:
+            if not conn.in_transaction:
+                conn.execute('BEGIN')
+        else:
+            conn.execute(f'SAVEPOINT {savepoint}')
+        
+        self._local.profondeur = profondeur + 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.profondeur = profondeur
+            if profondeur == 0:
+                conn.rollback()
+            else:
+                conn.execute(f'ROLLBACK TO {savepoint}')
+                conn.execute(f'RELEASE {savepoint}')
+            raise
+        else:
+            self._local.profondeur = profondeur
+            if profondeur == 0:
+                conn.commit()
+            else:
+                conn.execute(f'RELEASE {savepoint}')
+    
+    def fermer(self):
+        """Ferme toutes les connexions ouvertes par le pool"""
+        with self._verrou:
+            for conn in self._connexions:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connexions.clear()
+        self._local = threading.local()
+
+class InstantaneAnalytique:
+    """
+    Copie en mémoire de la base pour les requêtes analytiques (graphiques, stats).
+    
+    La copie est faite avec l'API de sauvegarde SQLite et n'est refaite que
+    lorsque PRAGMA data_version signale un commit d'une autre connexion :
+    les agrégations lourdes ne touchent jamais le fichier en cours d'écriture.
+    """
+    
+    def __init__(self, db_path: str, pages_par_etape: int = 1024):
+        """
+        Args:
+            db_path (str): Chemin vers le fichier de base de données source
+            pages_par_etape (int): Pages copiées par étape de sauvegarde
+        """
+        self.db_path = db_path
+        self.pages_par_etape = pages_par_etape
+        self._verrou = threading.RLock()
+        self._source = None
+        self._copie = None
+        self._version = None
+        self.nb_rafraichissements = 0
+    
+    def _ouvrir(self):
+        """Ouvre la connexion source (lecture seule) et la base mémoire"""
+        self._source = sqlite3.connect(
+            f"file:{Path(self.db_path).resolve().as_posix()}?mode=ro",
+            uri=True,
+            timeout=30,
+            check_same_thread=False
+        )
+        self._copie = sqlite3.connect(
+            ':memory:',
+            check_same_thread=False,
+            factory=instrumentation.fabrique_connexion()
+        )
+    
+    def _version_source(self) -> int:
+        """Version des données vue par la connexion source"""
+        return self._source.execute('PRAGMA data_version').fetchone()[0]
+    
+    def rafraichir(self, forcer: bool = False) -> bool:
+        """
+        Recopie la base si elle a changé depuis la dernière copie
+        
+        Args:
+            forcer (bool): Recopier même sans changement détecté
+        
+        Returns:
+            bool: True si la copie a été refaite
+        """
+        with self._verrou:
+            if self._source is None:
+                self._ouvrir()
+            
+            version = self._version_source()
+            if not forcer and version == self._version:
+                return False
+            
+            self._copie.execute('PRAGMA query_only = 0')
+            self._source.backup(self._copie, pages=self.pages_par_etape)
+            self._copie.execute('PRAGMA query_only = 1')
+            
+            self._version = version
+            self.nb_rafraichissements += 1
+            return True
+    
+    @contextmanager
+    def lecture(self):
+        """
+        Contexte donnant la copie mémoire à jour (lecture seule)
+        
+        Le verrou est tenu pendant la lecture : un rafraîchissement demandé par
+        un autre thread attend la fin des requêtes en cours.
+        """
+        with self._verrou:
+            self.rafraichir()
+            yield self._copie
+    
+    def fermer(self):
+        """Ferme la connexion source et libère la copie mémoire"""
+        with self._verrou:
+            for conn in (self._source, self._copie):
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except sqlite3.Error:
+                        pass
+            self._source = None
+            self._copie = None
+            self._version = None
+
 class DatabaseManager:
-    def __init__(self, db_path: str = "database/collection.db"):
+    def __init__(self, db_path: str = "database/collection.db", taille_cache_requetes: int = 256):
         """
         Initialise le gestionnaire de base de données
         
         Args:
             db_path (str): Chemin vers le fichier de base de données
+            taille_cache_requetes (int): Taille du cache de requêtes préparées par connexion
         """
         self.db_path = db_path
+        self.connexions = GestionnaireConnexions(db_path, taille_cache_requetes)
+        self._chargement = threading.local()
+        self.normaliseur_raretes = NormaliseurRaretes()
+        self._verrou_raretes = threading.Lock()
+        self._ids_raretes = None
         self.ensure_database_exists()
+        self.instantane = InstantaneAnalytique(db_path)
     
     def ensure_database_exists(self):
         """S'assure que la base de données et ses tables existent"""
@@ -32,6 +612,9 @@ class DatabaseManager:
             self.create_database()
         else:
             print(f"✅ Base de données trouvée : {self.db_path}")
+        
+        # Mettre à niveau le schéma (bases existantes comme nouvelles)
+        self.appliquer_migrations()
     
     def create_database(self):
         """Crée la structure de base de données à partir du schema SQL"""
@@ -41,13 +624,9 @@ class DatabaseManager:
             with open(schema_path, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Exécuter le schema
-            cursor.executescript(schema_sql)
-            conn.commit()
-            conn.close()
+            # executescript gère lui-même ses transactions
+            conn = self.connexions.obtenir()
+            conn.executescript(schema_sql)
             
             print("✅ Base de données créée avec succès")
             
@@ -60,76 +639,143 @@ class DatabaseManager:
     
     def create_basic_schema(self):
         """Crée un schema de base si le fichier SQL n'existe pas"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Tables basiques
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS series (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                code_serie VARCHAR(10) NOT NULL UNIQUE,
-                nom_serie VARCHAR(100) NOT NULL,
-                url_source TEXT,
-                date_ajout DATETIME DEFAULT CURRENT_TIMESTAMP,
-                nb_cartes_total INTEGER DEFAULT 0
-            )
-        ''')
+        with self.connexion() as conn:
+            self._creer_schema_basique(conn)
+        print("✅ Schema basique créé")
+    
+    def _creer_schema_basique(self, conn: sqlite3.Connection):
+        """Crée les tables et raretés de base sur la connexion fournie"""
+        executer_script(conn, SCHEMA_BASE_SQL)
+    
+    def get_version_schema(self) -> int:
+        """Retourne la version du schéma (PRAGMA user_version)"""
+        with self.connexion() as conn:
+            return conn.execute('PRAGMA user_version').fetchone()[0]
+    
+    def appliquer_migrations(self) -> int:
+        """
+        Met à jour le schéma en place en appliquant les migrations manquantes
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cartes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                numero_carte VARCHAR(20) NOT NULL UNIQUE,
-                nom_carte VARCHAR(200) NOT NULL,
-                serie_id INTEGER NOT NULL,
-                date_ajout DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (serie_id) REFERENCES series (id)
-            )
-        ''')
+        Chaque migration s'exécute dans sa propre transaction avec la mise à jour
+        de PRAGMA user_version : une migration interrompue est entièrement annulée.
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS raretes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nom_rarete VARCHAR(50) NOT NULL UNIQUE,
-                ordre_tri INTEGER DEFAULT 0
-            )
-        ''')
+        Returns:
+            int: Version du schéma après migration
+        """
+        version = self.get_version_schema()
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS carte_raretes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                carte_id INTEGER NOT NULL,
-                rarete_id INTEGER NOT NULL,
-                possedee BOOLEAN DEFAULT FALSE,
-                date_acquisition DATE,
-                condition VARCHAR(20) DEFAULT 'NM',
-                prix_achat DECIMAL(10,2),
-                notes TEXT,
-                FOREIGN KEY (carte_id) REFERENCES cartes (id),
-                FOREIGN KEY (rarete_id) REFERENCES raretes (id),
-                UNIQUE (carte_id, rarete_id)
-            )
-        ''')
+        for numero, description, sql in MIGRATIONS:
+            if numero <= version:
+                continue
+            
+            with self.connexion() as conn:
+                executer_script(conn, sql)
+                conn.execute(f'PRAGMA user_version = {numero:d}')
+            
+            version = numero
+            print(f"🔧 Migration {numero} appliquée : {description}")
         
-        # Raretés de base
-        raretes_base = [
-            ('Common', 1), ('Rare', 2), ('Super Rare', 3), ('Ultra Rare', 4),
-            ('Secret Rare', 5), ('Ultimate Rare', 6), ('Ghost Rare', 7),
-            ('Starlight Rare', 8), ('Collector\'s Rare', 9),
-            ('Platinum Secret Rare', 10), ('Quarter Century Secret Rare', 11)
-        ]
-        
-        cursor.executemany(
-            'INSERT OR IGNORE INTO raretes (nom_rarete, ordre_tri) VALUES (?, ?)',
-            raretes_base
-        )
+        return version
+    
+    def reconstruire_stats(self):
+        """Recalcule entièrement les compteurs matérialisés (commande de réparation)"""
+        with self.connexion() as conn:
+            executer_script(conn, RECONSTRUIRE_STATS_SQL)
+        print("✅ Compteurs de collection reconstruits")
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Retourne une nouvelle connexion indépendante, à fermer par l'appelant.
         
-        conn.commit()
-        conn.close()
-        print("✅ Schema basique créé")
+        Préférer `connexion()`, qui réutilise la connexion persistante du thread.
+        """
+        return self.connexions.ouvrir()
     
-    def get_connection(self):
-        """Retourne une connexion à la base de données"""
-        return sqlite3.connect(self.db_path)
+    @contextmanager
+    def connexion(self):
+        """
+        Contexte donnant la connexion persistante du thread courant.
+        
+        Valide la transaction en sortie, l'annule si une exception est levée.
+        
+        Example:
+            with db.connexion() as conn:
+                conn.execute('UPDATE carte_raretes SET possedee = 1 WHERE id = ?', (cr_id,))
+        """
+        with self.connexions.transaction() as conn:
+            yield conn
+    
+    @contextmanager
+    def chargement_en_masse(self):
+        """
+        Contexte d'import massif : le trigger d'insertion de nb_cartes_total est
+        suspendu et seules les séries des cartes insérées pendant le chargement
+        sont recomptées, une seule fois en fin de chargement.
+        
+        Les cartes insérées sont celles dont l'id dépasse le plus grand id
+        présent à l'entrée du contexte : le recomptage suit la taille du
+        chargement, pas celle du catalogue. Les suppressions et changements de
+        série gardent leurs triggers en O(1) (une carte insérée puis supprimée
+        dans le même contexte n'est pas prévue).
+        
+        La suppression et la recréation du trigger ont lieu dans la même
+        transaction que le chargement : les autres connexions ne voient jamais
+        la base sans ses triggers. Les contextes imbriqués sont sans effet.
+        
+        Example:
+            with db.chargement_en_masse():
+                db.charger_lot_cartes(serie_id, lignes)
+        """
+        profondeur = getattr(self._chargement, 'profondeur', 0)
+        
+        with self.connexion() as conn:
+            if profondeur > 0:
+                yield conn
+                return
+            
+            dernier_carte_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM cartes').fetchone()[0]
+            executer_script(conn, SUSPENDRE_TRIGGER_INSERTION_SQL)
+            self._chargement.profondeur = 1
+            try:
+                yield conn
+            finally:
+                self._chargement.profondeur = 0
+            
+            conn.execute(RECALCULER_NB_CARTES_CHARGEES_SQL, (dernier_carte_id,))
+            executer_script(conn, TRIGGERS_NB_CARTES_SQL)
+    
+    @contextmanager
+    def lecture_analytique(self):
+        """
+        Contexte donnant une connexion en lecture seule sur l'instantané mémoire
+        
+        À utiliser pour les agrégations des graphiques et statistiques : elles
+        voient les données validées sans concurrencer les écritures.
+        
+        Example:
+            with db.lecture_analytique() as conn:
+                conn.execute('SELECT SUM(total) FROM stats_series_raretes')
+        """
+        with self.instantane.lecture() as conn:
+            yield conn
+    
+    def afficher_statistiques_requetes(self, limite: int = 15, export: str = None):
+        """
+        Affiche le résumé de l'instrumentation SQL du processus
+        
+        Args:
+            limite (int): Nombre de requêtes affichées (les plus coûteuses)
+            export (str, optional): Fichier JSON où écrire toutes les statistiques
+        """
+        instrumentation.afficher_resume(limite)
+        if export:
+            instrumentation.exporter_resume(export)
+            print(f"💾 Statistiques SQL exportées : {export}")
+    
+    def fermer(self):
+        """Ferme toutes les connexions persistantes"""
+        self.instantane.fermer()
+        self.connexions.fermer()
     
     def ajouter_serie(self, code_serie: str, nom_serie: str, url_source: str = None) -> int:
         """
@@ -143,156 +789,772 @@ class DatabaseManager:
         Returns:
             int: ID de la série créée
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                INSERT INTO series (code_serie, nom_serie, url_source)
-                VALUES (?, ?, ?)
-            ''', (code_serie, nom_serie, url_source))
-            
-            serie_id = cursor.lastrowid
-            conn.commit()
-            
-            print(f"✅ Série ajoutée : {code_serie} - {nom_serie}")
-            return serie_id
+        with self.connexion() as conn:
+            cursor = conn.cursor()
             
-        except sqlite3.IntegrityError:
-            # Série existe déjà, vérifier et mettre à jour l'URL et le nom si nécessaire
-            cursor.execute('SELECT id, nom_serie, url_source FROM series WHERE code_serie = ?', (code_serie,))
-            result = cursor.fetchone()
-            if result:
-                serie_id, nom_existant, url_existante = result
-                
-                # Préparer les mises à jour
-                mises_a_jour = []
-                params = []
+            try:
+                cursor.execute('''
+                    INSERT INTO series (code_serie, nom_serie, url_source)
+                    VALUES (?, ?, ?)
+                ''', (code_serie, nom_serie, url_source))
                 
-                # Mettre à jour l'URL si elle est fournie et (différente OU si l'existante est NULL/vide)
-                if url_source and (not url_existante or url_source != url_existante):
-                    mises_a_jour.append("url_source = ?")
-                    params.append(url_source)
+                serie_id = cursor.lastrowid
                 
-                # Mettre à jour le nom si le nom existant est générique et qu'on a un nom plus complet
-                nom_generique = f"Série {code_serie}"
-                if nom_existant == nom_generique and nom_serie != nom_generique:
-                    mises_a_jour.append("nom_serie = ?")
-                    params.append(nom_serie)
+                print(f"✅ Série ajoutée : {code_serie} - {nom_serie}")
+                return serie_id
                 
-                # Exécuter les mises à jour si nécessaire
-                if mises_a_jour:
-                    params.append(code_serie)  # Pour la clause WHERE
-                    cursor.execute(f'''
-                        UPDATE series SET {", ".join(mises_a_jour)} WHERE code_serie = ?
-                    ''', params)
-                    conn.commit()
+            except sqlite3.IntegrityError:
+                # Série existe déjà, vérifier et mettre à jour l'URL et le nom si nécessaire
+                cursor.execute('SELECT id, nom_serie, url_source FROM series WHERE code_serie = ?', (code_serie,))
+                result = cursor.fetchone()
+                if result:
+                    serie_id, nom_existant, url_existante = result
                     
-                    # Messages informatifs
+                    # Préparer les mises à jour
+                    mises_a_jour = []
+                    params = []
+                    
+                    # Mettre à jour l'URL si elle est fournie et (différente OU si l'existante est NULL/vide)
                     if url_source and (not url_existante or url_source != url_existante):
-                        if not url_existante:
-                            print(f"🔗 URL ajoutée pour {code_serie} : {url_source}")
-                        else:
-                            print(f"🔗 URL mise à jour pour {code_serie} : {url_source}")
+                        mises_a_jour.append("url_source = ?")
+                        params.append(url_source)
                     
+                    # Mettre à jour le nom si le nom existant est générique et qu'on a un nom plus complet
+                    nom_generique = f"Série {code_serie}"
                     if nom_existant == nom_generique and nom_serie != nom_generique:
-                        print(f"📝 Nom mis à jour pour {code_serie} : {nom_serie}")
-                
-                else:
-                    if url_existante and nom_existant != nom_generique:
-                        print(f"ℹ️  Série existante : {code_serie} (déjà complète)")
+                        mises_a_jour.append("nom_serie = ?")
+                        params.append(nom_serie)
+                    
+                    # Exécuter les mises à jour si nécessaire
+                    if mises_a_jour:
+                        params.append(code_serie)  # Pour la clause WHERE
+                        cursor.execute(f'''
+                            UPDATE series SET {", ".join(mises_a_jour)} WHERE code_serie = ?
+                        ''', params)
+                        
+                        # Messages informatifs
+                        if url_source and (not url_existante or url_source != url_existante):
+                            if not url_existante:
+                                print(f"🔗 URL ajoutée pour {code_serie} : {url_source}")
+                            else:
+                                print(f"🔗 URL mise à jour pour {code_serie} : {url_source}")
+                        
+                        if nom_existant == nom_generique and nom_serie != nom_generique:
+                            print(f"📝 Nom mis à jour pour {code_serie} : {nom_serie}")
+                    
                     else:
-                        print(f"ℹ️  Série existante : {code_serie}")
-                return serie_id
-            raise
-        finally:
-            conn.close()
+                        if url_existante and nom_existant != nom_generique:
+                            print(f"ℹ️  Série existante : {code_serie} (déjà complète)")
+                        else:
+                            print(f"ℹ️  Série existante : {code_serie}")
+                    return serie_id
+                raise
     
     def get_serie_id(self, code_serie: str) -> Optional[int]:
         """Retourne l'ID d'une série par son code"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT id FROM series WHERE code_serie = ?', (code_serie,))
-        result = cursor.fetchone()
-        conn.close()
+        with self.connexion() as conn:
+            result = conn.execute('SELECT id FROM series WHERE code_serie = ?', (code_serie,)).fetchone()
         
         return result[0] if result else None
     
     def get_rarete_id(self, nom_rarete: str) -> Optional[int]:
-        """Retourne l'ID d'une rareté par son nom"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT id FROM raretes WHERE nom_rarete = ?', (nom_rarete,))
-        result = cursor.fetchone()
+        """Retourne l'ID d'une rareté par son nom (variantes comprises), en la créant si besoin"""
+        if self.normaliser_rarete(nom_rarete) is None:
+            return None
+        with self.connexion() as conn:
+            return self._resoudre_raretes(conn, [nom_rarete])[nom_rarete]
+    
+    def normaliser_rarete(self, nom_rarete: str) -> Optional[str]:
+        """
+        Ramène un nom de rareté lu dans un fichier à son nom canonique
         
-        if not result:
-            # Créer la rareté si elle n'existe pas
-            cursor.execute('''
-                INSERT INTO raretes (nom_rarete, ordre_tri) 
-                VALUES (?, (SELECT COALESCE(MAX(ordre_tri), 0) + 1 FROM raretes))
-            ''', (nom_rarete,))
-            conn.commit()
-            rarete_id = cursor.lastrowid
-            print(f"➕ Nouvelle rareté créée : {nom_rarete}")
-        else:
-            rarete_id = result[0]
+        Les raretés déjà en base sont connues du normaliseur : une variante
+        d'une rareté personnalisée lui est ramenée comme pour les standards.
         
-        conn.close()
-        return rarete_id
+        Returns:
+            Optional[str]: Nom canonique, None si le nom n'est pas une rareté lisible
+        """
+        if self._ids_raretes is None:
+            self._charger_ids_raretes()
+        return self.normaliseur_raretes.canonique(nom_rarete)
     
-    def ajouter_carte(self, numero_carte: str, nom_carte: str, serie_id: int) -> int:
-        """Ajoute une carte à la base de données"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def _charger_ids_raretes(self) -> Dict[str, int]:
+        """
+        (Re)charge le cache {nom_rarete: id} depuis les raretés validées
         
+        La lecture passe par une connexion distincte : une rareté créée dans
+        une transaction encore ouverte (et peut-être annulée) n'entre jamais
+        dans le cache.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
         try:
-            cursor.execute('''
-                INSERT INTO cartes (numero_carte, nom_carte, serie_id)
-                VALUES (?, ?, ?)
-            ''', (numero_carte, nom_carte, serie_id))
-            
-            carte_id = cursor.lastrowid
-            conn.commit()
-            return carte_id
-            
-        except sqlite3.IntegrityError:
-            # Carte existe déjà
-            cursor.execute('SELECT id FROM cartes WHERE numero_carte = ?', (numero_carte,))
-            result = cursor.fetchone()
-            return result[0] if result else None
+            lignes = conn.execute('SELECT nom_rarete, id FROM raretes ORDER BY ordre_tri, id').fetchall()
         finally:
             conn.close()
+        
+        for nom_rarete, _ in lignes:
+            self.normaliseur_raretes.ajouter(nom_rarete)
+        with self._verrou_raretes:
+            self._ids_raretes = dict(lignes)
+            return self._ids_raretes
+    
+    def get_noms_raretes(self) -> List[str]:
+        """Retourne les noms de toutes les raretés connues, dans l'ordre de tri"""
+        with self.connexion() as conn:
+            return [row[0] for row in conn.execute('SELECT nom_rarete FROM raretes ORDER BY ordre_tri')]
+    
+    def ajouter_carte(self, numero_carte: str, nom_carte: str, serie_id: int) -> int:
+        """Ajoute une carte à la base de données"""
+        with self.connexion() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                cursor.execute('''
+                    INSERT INTO cartes (numero_carte, nom_carte, serie_id)
+                    VALUES (?, ?, ?)
+                ''', (numero_carte, nom_carte, serie_id))
+                
+                return cursor.lastrowid
+                
+            except sqlite3.IntegrityError:
+                # Carte existe déjà
+                cursor.execute('SELECT id FROM cartes WHERE numero_carte = ?', (numero_carte,))
+                result = cursor.fetchone()
+                return result[0] if result else None
     
     def lier_carte_rarete(self, carte_id: int, rarete_id: int) -> bool:
         """Crée une liaison entre une carte et une rareté"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.connexion() as conn:
+            try:
+                conn.execute('''
+                    INSERT INTO carte_raretes (carte_id, rarete_id, possedee)
+                    VALUES (?, ?, FALSE)
+                ''', (carte_id, rarete_id))
+                
+                return True
+                
+            except sqlite3.IntegrityError:
+                # Liaison existe déjà
+                return False
+    
+    def _resoudre_raretes(self, conn: sqlite3.Connection, noms_raretes) -> Dict[str, int]:
+        """
+        Résout un ensemble de noms de raretés en IDs, en créant les manquantes
         
-        try:
-            cursor.execute('''
+        Chaque nom est d'abord ramené à son nom canonique puis cherché dans le
+        cache en mémoire ; seules les raretés réellement nouvelles passent par
+        la base.
+        
+        Args:
+            conn: Connexion de la transaction en cours
+            noms_raretes: Noms de raretés à résoudre (bruts ou canoniques)
+        
+        Returns:
+            Dict[str, int]: Dictionnaire {nom_rarete: rarete_id} pour les noms fournis
+        
+        Raises:
+            ValueError: Nom qui n'est pas une rareté lisible (vide ou tronqué de façon ambiguë)
+        """
+        ids = self._ids_raretes if self._ids_raretes is not None else self._charger_ids_raretes()
+        rarete_ids = {}
+        manquantes = {}
+        
+        for nom_rarete in set(noms_raretes):
+            canonique = self.normaliseur_raretes.canonique(nom_rarete)
+            if canonique is None:
+                raise ValueError(f"Rareté illisible : {nom_rarete!r}")
+            rarete_id = ids.get(canonique)
+            if rarete_id is None:
+                manquantes.setdefault(canonique, []).append(nom_rarete)
+            else:
+                rarete_ids[nom_rarete] = rarete_id
+        
+        if manquantes:
+            # Raretés validées depuis le dernier chargement (autre import, autre thread)
+            ids = self._charger_ids_raretes()
+            
+            for canonique, noms in manquantes.items():
+                rarete_id = ids.get(canonique)
+                if rarete_id is None:
+                    # Créée dans cette transaction, ou réellement nouvelle
+                    ligne = conn.execute('SELECT id FROM raretes WHERE nom_rarete = ?', (canonique,)).fetchone()
+                    if ligne:
+                        rarete_id = ligne[0]
+                    else:
+                        rarete_id = conn.execute('''
+                            INSERT INTO raretes (nom_rarete, ordre_tri) 
+                            VALUES (?, (SELECT COALESCE(MAX(ordre_tri), 0) + 1 FROM raretes))
+                            RETURNING id
+                        ''', (canonique,)).fetchall()[0][0]
+                        print(f"➕ Nouvelle rareté créée : {canonique}")
+                for nom_rarete in noms:
+                    rarete_ids[nom_rarete] = rarete_id
+        
+        return rarete_ids
+    
+    def charger_lot_cartes(self, serie_id: int, lignes: List[Tuple[str, str, str]]) -> Dict[str, int]:
+        """
+        Charge un lot de lignes (numero, nom, rarete) en une seule transaction
+        
+        Les cartes sont insérées avec INSERT ... ON CONFLICT DO NOTHING RETURNING id,
+        les cartes déjà présentes sont résolues en une requête, puis les liens
+        carte-rareté sont créés avec executemany.
+        
+        Args:
+            serie_id (int): ID de la série des cartes du lot
+            lignes (List[Tuple[str, str, str]]): Lignes (numero_carte, nom_carte, nom_rarete)
+        
+        Returns:
+            Dict[str, int]: Compteurs 'cartes_ajoutees', 'liens_crees' et 'cartes_existantes'
+        """
+        stats = {
+            'cartes_ajoutees': 0,
+            'liens_crees': 0,
+            'cartes_existantes': 0
+        }
+        
+        if not lignes:
+            return stats
+        
+        # Une seule insertion par numéro (le premier nom rencontré fait foi)
+        cartes = {}
+        for numero_carte, nom_carte, _ in lignes:
+            cartes.setdefault(numero_carte, nom_carte)
+        
+        with self.connexion() as conn:
+            rarete_ids = self._resoudre_raretes(conn, (nom_rarete for _, _, nom_rarete in lignes))
+            
+            carte_ids = {}
+            for numero_carte, nom_carte in cartes.items():
+                insere = conn.execute('''
+                    INSERT INTO cartes (numero_carte, nom_carte, serie_id)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (numero_carte) DO NOTHING
+                    RETURNING id
+                ''', (numero_carte, nom_carte, serie_id)).fetchall()
+                if insere:
+                    carte_ids[numero_carte] = insere[0][0]
+            
+            stats['cartes_ajoutees'] = len(carte_ids)
+            
+            # Cartes déjà présentes : résolution groupée des IDs
+            existantes = [numero for numero in cartes if numero not in carte_ids]
+            stats['cartes_existantes'] = len(existantes)
+            
+            for i in range(0, len(existantes), TAILLE_MAX_CLAUSE_IN):
+                morceau = existantes[i:i + TAILLE_MAX_CLAUSE_IN]
+                marqueurs = ", ".join("?" * len(morceau))
+                carte_ids.update(conn.execute(
+                    f'SELECT numero_carte, id FROM cartes WHERE numero_carte IN ({marqueurs})', morceau
+                ).fetchall())
+            
+            liens = {
+                (carte_ids[numero_carte], rarete_ids[nom_rarete])
+                for numero_carte, _, nom_rarete in lignes
+            }
+            
+            cursor = conn.executemany('''
                 INSERT INTO carte_raretes (carte_id, rarete_id, possedee)
                 VALUES (?, ?, FALSE)
-            ''', (carte_id, rarete_id))
+                ON CONFLICT (carte_id, rarete_id) DO NOTHING
+            ''', liens)
+            # rowcount (contrairement à total_changes) ignore les écritures faites par les triggers
+            stats['liens_crees'] = max(cursor.rowcount, 0)
+        
+        return stats
+    
+    def get_manifeste_import(self, nom_fichier: str) -> Optional[Dict]:
+        """
+        Retourne l'entrée du manifeste d'import d'un fichier
+        
+        Args:
+            nom_fichier (str): Chemin absolu résolu du fichier (clé du manifeste)
+        
+        Returns:
+            Optional[Dict]: empreinte_sha256, nb_lignes, code_serie, date_import ; None si jamais importé
+        """
+        with self.connexion() as conn:
+            row = conn.execute('''
+                SELECT empreinte_sha256, nb_lignes, code_serie, date_import
+                FROM imports_fichiers WHERE nom_fichier = ?
+            ''', (nom_fichier,)).fetchone()
+        
+        if not row:
+            return None
+        
+        return {
+            'empreinte_sha256': row[0],
+            'nb_lignes': row[1],
+            'code_serie': row[2],
+            'date_import': row[3]
+        }
+    
+    def rattacher_import_fichier(self, nom_ancien: str, nom_fichier: str) -> bool:
+        """
+        Rattache à un chemin l'historique d'import enregistré sous le seul nom du fichier
+        
+        Les anciens manifestes étaient indexés par nom de fichier, sans dossier :
+        la première importation d'un fichier de ce nom reprend son entrée, ses
+        lignes et son point de reprise. Rien n'est fait si le chemin a déjà
+        son propre historique.
+        
+        Args:
+            nom_ancien (str): Nom du fichier sans dossier (ancienne clé)
+            nom_fichier (str): Chemin absolu résolu du fichier (nouvelle clé)
+        
+        Returns:
+            bool: True si une entrée ancienne a été rattachée
+        """
+        tables = ('imports_fichiers', 'imports_lignes', 'imports_reprises')
+        with self.connexion() as conn:
+            for table in tables:
+                if conn.execute(f'SELECT 1 FROM {table} WHERE nom_fichier = ? LIMIT 1', (nom_fichier,)).fetchone():
+                    return False
             
-            conn.commit()
-            return True
+            rattachees = 0
+            for table in tables:
+                cursor = conn.execute(f'UPDATE {table} SET nom_fichier = ? WHERE nom_fichier = ?',
+                                      (nom_fichier, nom_ancien))
+                rattachees += max(cursor.rowcount, 0)
+        
+        return rattachees > 0
+    
+    def charger_lot_fichier(self, nom_fichier: str, empreinte: str, serie_id: int,
+                            lignes: List[Tuple[str, str, str]]) -> Dict[str, int]:
+        """
+        Charge un lot d'un fichier en ne touchant que ce qui a changé depuis son dernier import
+        
+        Les lignes déjà présentes dans le manifeste du fichier sont seulement
+        marquées avec la nouvelle empreinte ; les nouvelles passent par
+        charger_lot_cartes et les cartes renommées sont mises à jour.
+        
+        Args:
+            nom_fichier (str): Chemin absolu résolu du fichier (clé du manifeste)
+            empreinte (str): Empreinte SHA-256 de la version importée
+            serie_id (int): ID de la série des cartes du lot
+            lignes (List[Tuple[str, str, str]]): Lignes (numero_carte, nom_carte, nom_rarete)
+        
+        Returns:
+            Dict[str, int]: Compteurs de charger_lot_cartes plus 'lignes_inchangees' et 'cartes_renommees'
+        """
+        # Noms de raretés canoniques : manifeste et liens partagent les mêmes noms
+        lignes = [(numero_carte, nom_carte, self.normaliser_rarete(nom_rarete) or nom_rarete)
+                  for numero_carte, nom_carte, nom_rarete in lignes]
+        
+        with self.connexion() as conn:
+            connues = {}
+            numeros = list({numero_carte for numero_carte, _, _ in lignes})
+            for i in range(0, len(numeros), TAILLE_MAX_CLAUSE_IN):
+                morceau = numeros[i:i + TAILLE_MAX_CLAUSE_IN]
+                marqueurs = ", ".join("?" * len(morceau))
+                for numero_carte, nom_rarete, nom_carte in conn.execute(f'''
+                    SELECT numero_carte, nom_rarete, nom_carte FROM imports_lignes
+                    WHERE nom_fichier = ? AND numero_carte IN ({marqueurs})
+                ''', [nom_fichier] + morceau):
+                    connues[(numero_carte, nom_rarete)] = nom_carte
             
-        except sqlite3.IntegrityError:
-            # Liaison existe déjà
-            return False
-        finally:
-            conn.close()
+            nouvelles = []
+            renommees = {}
+            for numero_carte, nom_carte, nom_rarete in lignes:
+                ancien_nom = connues.get((numero_carte, nom_rarete))
+                if ancien_nom is None:
+                    nouvelles.append((numero_carte, nom_carte, nom_rarete))
+                elif ancien_nom != nom_carte:
+                    renommees[numero_carte] = nom_carte
+            
+            stats = self.charger_lot_cartes(serie_id, nouvelles)
+            stats['lignes_inchangees'] = len(lignes) - len(nouvelles)
+            
+            if renommees:
+                conn.executemany(
+                    'UPDATE cartes SET nom_carte = ? WHERE numero_carte = ?',
+                    [(nom_carte, numero_carte) for numero_carte, nom_carte in renommees.items()]
+                )
+            stats['cartes_renommees'] = len(renommees)
+            
+            conn.executemany('''
+                INSERT INTO imports_lignes (nom_fichier, numero_carte, nom_rarete, nom_carte, empreinte_sha256)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (nom_fichier, numero_carte, nom_rarete) DO UPDATE SET
+                    nom_carte = excluded.nom_carte,
+                    empreinte_sha256 = excluded.empreinte_sha256
+            ''', [(nom_fichier, numero_carte, nom_rarete, nom_carte, empreinte)
+                  for numero_carte, nom_carte, nom_rarete in lignes])
+        
+        return stats
+    
+    def get_point_reprise(self, nom_fichier: str) -> Optional[Dict]:
+        """
+        Retourne le point de reprise d'un import interrompu
+        
+        Args:
+            nom_fichier (str): Chemin absolu résolu du fichier (clé du manifeste)
+        
+        Returns:
+            Optional[Dict]: empreinte_sha256, code_serie, position, numero_ligne,
+            nb_lignes et date_maj ; None si aucun import n'est en cours
+        """
+        with self.connexion() as conn:
+            row = conn.execute('''
+                SELECT empreinte_sha256, code_serie, position, numero_ligne, nb_lignes, date_maj
+                FROM imports_reprises WHERE nom_fichier = ?
+            ''', (nom_fichier,)).fetchone()
+        
+        if not row:
+            return None
+        
+        return {
+            'empreinte_sha256': row[0],
+            'code_serie': row[1],
+            'position': row[2],
+            'numero_ligne': row[3],
+            'nb_lignes': row[4],
+            'date_maj': row[5]
+        }
+    
+    def enregistrer_point_reprise(self, nom_fichier: str, empreinte: str, code_serie: str,
+                                  position: int, numero_ligne: int, nb_lignes: int):
+        """
+        Enregistre où reprendre l'import d'un fichier après le dernier lot chargé
+        
+        À appeler dans la transaction du lot : le point de reprise n'est
+        validé qu'avec les lignes qu'il couvre.
+        
+        Args:
+            nom_fichier (str): Chemin absolu résolu du fichier (clé du manifeste)
+            empreinte (str): Empreinte SHA-256 du fichier en cours d'import
+            code_serie (str): Code de la série du fichier
+            position (int): Position qui suit la dernière ligne chargée
+            numero_ligne (int): Numéro de la ligne suivante
+            nb_lignes (int): Nombre de lignes valides chargées jusqu'ici
+        """
+        with self.connexion() as conn:
+            conn.execute('''
+                INSERT INTO imports_reprises
+                    (nom_fichier, empreinte_sha256, code_serie, position, numero_ligne, nb_lignes, date_maj)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (nom_fichier) DO UPDATE SET
+                    empreinte_sha256 = excluded.empreinte_sha256,
+                    code_serie = excluded.code_serie,
+                    position = excluded.position,
+                    numero_ligne = excluded.numero_ligne,
+                    nb_lignes = excluded.nb_lignes,
+                    date_maj = excluded.date_maj
+            ''', (nom_fichier, empreinte, code_serie, position, numero_ligne, nb_lignes))
+    
+    def finaliser_import_fichier(self, nom_fichier: str, empreinte: str, nb_lignes: int,
+                                 code_serie: str) -> Dict[str, int]:
+        """
+        Termine l'import d'un fichier : retire les exemplaires qu'il ne contient plus,
+        enregistre sa nouvelle empreinte dans le manifeste et efface son point de reprise
+        
+        Un exemplaire retiré n'est supprimé que s'il n'est pas possédé et
+        qu'aucun autre fichier importé ne le fournit.
+        
+        Args:
+            nom_fichier (str): Chemin absolu résolu du fichier (clé du manifeste)
+            empreinte (str): Empreinte SHA-256 de la version importée
+            nb_lignes (int): Nombre de lignes valides du fichier
+            code_serie (str): Code de la série du fichier
+        
+        Returns:
+            Dict[str, int]: 'liens_supprimes', 'liens_conserves' (possédés) et 'cartes_supprimees'
+        """
+        stats = {
+            'liens_supprimes': 0,
+            'liens_conserves': 0,
+            'cartes_supprimees': 0
+        }
+        
+        # Suppressions seules : les triggers nb_cartes_total en O(1) suffisent
+        with self.connexion() as conn:
+            retires = conn.execute('''
+                SELECT l.numero_carte, l.nom_rarete FROM imports_lignes l
+                WHERE l.nom_fichier = ? AND l.empreinte_sha256 <> ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM imports_lignes a
+                    WHERE a.numero_carte = l.numero_carte AND a.nom_rarete = l.nom_rarete
+                    AND a.nom_fichier <> l.nom_fichier
+                )
+            ''', (nom_fichier, empreinte)).fetchall()
+            
+            if retires:
+                cursor = conn.executemany('''
+                    DELETE FROM carte_raretes
+                    WHERE possedee = 0
+                    AND carte_id = (SELECT id FROM cartes WHERE numero_carte = ?)
+                    AND rarete_id = (SELECT id FROM raretes WHERE nom_rarete = ?)
+                ''', retires)
+                stats['liens_supprimes'] = max(cursor.rowcount, 0)
+                stats['liens_conserves'] = len(retires) - stats['liens_supprimes']
+                
+                # Cartes qui n'ont plus aucun exemplaire
+                cursor = conn.executemany('''
+                    DELETE FROM cartes
+                    WHERE numero_carte = ?
+                    AND NOT EXISTS (SELECT 1 FROM carte_raretes WHERE carte_id = cartes.id)
+                ''', [(numero_carte,) for numero_carte in {numero for numero, _ in retires}])
+                stats['cartes_supprimees'] = max(cursor.rowcount, 0)
+            
+            conn.execute(
+                'DELETE FROM imports_lignes WHERE nom_fichier = ? AND empreinte_sha256 <> ?',
+                (nom_fichier, empreinte)
+            )
+            conn.execute('''
+                INSERT INTO imports_fichiers (nom_fichier, empreinte_sha256, nb_lignes, code_serie, date_import)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (nom_fichier) DO UPDATE SET
+                    empreinte_sha256 = excluded.empreinte_sha256,
+                    nb_lignes = excluded.nb_lignes,
+                    code_serie = excluded.code_serie,
+                    date_import = excluded.date_import
+            ''', (nom_fichier, empreinte, nb_lignes, code_serie))
+            conn.execute('DELETE FROM imports_reprises WHERE nom_fichier = ?', (nom_fichier,))
+        
+        return stats
+    
+    def preparer_staging(self):
+        """Crée (ou vide) les tables temporaires de transit de la connexion courante"""
+        with self.connexion() as conn:
+            executer_script(conn, STAGING_SQL)
+    
+    def charger_staging(self, lignes: List[Tuple[str, int, str, str, str, str]]):
+        """
+        Ajoute des lignes brutes à la table de transit, sans aucune validation
+        
+        Args:
+            lignes: Lignes (fichier, numero_ligne, code_serie, nom_carte, nom_rarete, numero_carte)
+        """
+        with self.connexion() as conn:
+            conn.executemany('''
+                INSERT INTO import_staging (fichier, ligne, code_serie, nom_carte, nom_rarete, numero_carte)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', lignes)
+    
+    def retirer_staging(self, fichier: str):
+        """Retire de la table de transit les lignes d'un fichier (lecture interrompue)"""
+        with self.connexion() as conn:
+            conn.execute('DELETE FROM import_staging WHERE fichier = ?', (fichier,))
+    
+    def valider_staging(self) -> List[str]:
+        """
+        Nettoie et valide la table de transit en quelques requêtes ensemblistes
+        
+        Returns:
+            List[str]: Codes des séries présentes dans les lignes valides
+        """
+        with self.connexion() as conn:
+            conn.execute('''
+                UPDATE import_staging SET
+                    code_serie = TRIM(COALESCE(code_serie, '')),
+                    nom_carte = TRIM(COALESCE(nom_carte, '')),
+                    nom_rarete = TRIM(COALESCE(nom_rarete, '')),
+                    numero_carte = TRIM(COALESCE(numero_carte, ''))
+            ''')
+            conn.execute('''
+                UPDATE import_staging SET erreur = 'données manquantes'
+                WHERE code_serie = '' OR nom_carte = '' OR nom_rarete = '' OR numero_carte = ''
+            ''')
+            # La première ligne valide d'un numéro fait foi pour le nom de la carte
+            conn.execute('''
+                UPDATE import_staging SET erreur = 'numéro en double avec un autre nom de carte'
+                WHERE erreur IS NULL
+                AND nom_carte <> (
+                    SELECT p.nom_carte FROM import_staging p
+                    WHERE p.numero_carte = import_staging.numero_carte AND p.erreur IS NULL
+                    ORDER BY p.id LIMIT 1
+                )
+            ''')
+            return [row[0] for row in conn.execute(
+                'SELECT DISTINCT code_serie FROM import_staging WHERE erreur IS NULL ORDER BY code_serie'
+            )]
+    
+    def fusionner_staging(self, infos_series: Dict[str, Tuple[str, Optional[str]]],
+                          empreintes: Dict[str, str] = None) -> Dict:
+        """
+        Fusionne les lignes valides de la table de transit dans la base
+        
+        Séries, raretés, cartes et liens carte-rareté sont créés par des
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING ; les compteurs par fichier
+        sont ensuite déduits des IDs créés. À appeler après valider_staging().
+        
+        Args:
+            infos_series: {code_serie: (nom_serie, url_source)} des séries à créer
+            empreintes (Dict[str, str], optional): {clé du manifeste: empreinte SHA-256}
+                des fichiers à enregistrer dans le manifeste des imports
+        
+        Returns:
+            Dict: 'par_fichier' (statistiques d'import par fichier), 'series_ajoutees'
+            et 'lignes_en_erreur' (fichier, ligne, erreur)
+        """
+        with self.chargement_en_masse() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO import_staging_series (code_serie, nom_serie, url_source) VALUES (?, ?, ?)',
+                [(code, nom, url) for code, (nom, url) in infos_series.items()]
+            )
+            
+            dernier_carte_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM cartes').fetchone()[0]
+            dernier_lien_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM carte_raretes').fetchone()[0]
+            
+            # Séries (WHERE true : lève l'ambiguïté de syntaxe SELECT / ON CONFLICT)
+            series_ajoutees = conn.execute('''
+                INSERT INTO series (code_serie, nom_serie, url_source)
+                SELECT code_serie, nom_serie, url_source FROM import_staging_series WHERE true
+                ON CONFLICT (code_serie) DO NOTHING
+            ''').rowcount
+            conn.execute('''
+                UPDATE series SET url_source = (
+                    SELECT i.url_source FROM import_staging_series i WHERE i.code_serie = series.code_serie
+                )
+                WHERE url_source IS NULL
+                AND code_serie IN (SELECT code_serie FROM import_staging_series WHERE url_source IS NOT NULL)
+            ''')
+            
+            # Raretés inconnues, ajoutées en fin d'ordre de tri
+            for (nom_rarete,) in conn.execute('''
+                INSERT INTO raretes (nom_rarete, ordre_tri)
+                SELECT st.nom_rarete,
+                       (SELECT COALESCE(MAX(ordre_tri), 0) FROM raretes) + ROW_NUMBER() OVER (ORDER BY MIN(st.id))
+                FROM import_staging st
+                WHERE st.erreur IS NULL
+                AND NOT EXISTS (SELECT 1 FROM raretes r WHERE r.nom_rarete = st.nom_rarete)
+                GROUP BY st.nom_rarete
+                ON CONFLICT (nom_rarete) DO NOTHING
+                RETURNING nom_rarete
+            ''').fetchall():
+                print(f"➕ Nouvelle rareté créée : {nom_rarete}")
+            
+            # Cartes : la première ligne valide de chaque numéro
+            conn.execute('''
+                INSERT INTO cartes (numero_carte, nom_carte, serie_id)
+                SELECT st.numero_carte, st.nom_carte, s.id
+                FROM import_staging st
+                JOIN series s ON s.code_serie = st.code_serie
+                WHERE st.id IN (
+                    SELECT MIN(id) FROM import_staging WHERE erreur IS NULL GROUP BY numero_carte
+                )
+                ORDER BY st.id
+                ON CONFLICT (numero_carte) DO NOTHING
+            ''')
+            
+            # Liens carte-rareté
+            conn.execute('''
+                INSERT INTO carte_raretes (carte_id, rarete_id, possedee)
+                SELECT DISTINCT c.id, r.id, FALSE
+                FROM import_staging st
+                JOIN cartes c ON c.numero_carte = st.numero_carte
+                JOIN raretes r ON r.nom_rarete = st.nom_rarete
+                WHERE st.erreur IS NULL
+                ON CONFLICT (carte_id, rarete_id) DO NOTHING
+            ''')
+            
+            # Compteurs par fichier : chaque création est attribuée à la première ligne qui l'a demandée
+            par_fichier = {}
+            for fichier, lignes, erreurs, cartes in conn.execute('''
+                SELECT fichier, COUNT(*), SUM(erreur IS NOT NULL),
+                       COUNT(DISTINCT CASE WHEN erreur IS NULL THEN numero_carte END)
+                FROM import_staging GROUP BY fichier
+            '''):
+                par_fichier[fichier] = {
+                    'cartes_ajoutees': 0,
+                    'liens_crees': 0,
+                    'cartes_existantes': cartes,
+                    'erreurs': erreurs,
+                    'lignes': lignes
+                }
+            
+            for fichier, nb in conn.execute('''
+                SELECT st.fichier, COUNT(*)
+                FROM cartes c
+                JOIN import_staging st ON st.id = (
+                    SELECT MIN(p.id) FROM import_staging p
+                    WHERE p.numero_carte = c.numero_carte AND p.erreur IS NULL
+                )
+                WHERE c.id > ?
+                GROUP BY st.fichier
+            ''', (dernier_carte_id,)):
+                par_fichier[fichier]['cartes_ajoutees'] = nb
+                par_fichier[fichier]['cartes_existantes'] -= nb
+            
+            for fichier, nb in conn.execute('''
+                SELECT st.fichier, COUNT(*)
+                FROM carte_raretes cr
+                JOIN cartes c ON c.id = cr.carte_id
+                JOIN raretes r ON r.id = cr.rarete_id
+                JOIN import_staging st ON st.id = (
+                    SELECT MIN(p.id) FROM import_staging p
+                    WHERE p.numero_carte = c.numero_carte AND p.nom_rarete = r.nom_rarete
+                    AND p.erreur IS NULL
+                )
+                WHERE cr.id > ?
+                GROUP BY st.fichier
+            ''', (dernier_lien_id,)):
+                par_fichier[fichier]['liens_crees'] = nb
+            
+            lignes_en_erreur = [
+                {'fichier': fichier, 'ligne': ligne, 'erreur': erreur}
+                for fichier, ligne, erreur in conn.execute(
+                    'SELECT fichier, ligne, erreur FROM import_staging WHERE erreur IS NOT NULL ORDER BY id'
+                )
+            ]
+            
+            if empreintes:
+                self._enregistrer_manifeste_staging(conn, empreintes)
+        
+        return {
+            'par_fichier': par_fichier,
+            'series_ajoutees': max(series_ajoutees, 0),
+            'lignes_en_erreur': lignes_en_erreur
+        }
+    
+    def _enregistrer_manifeste_staging(self, conn: sqlite3.Connection, empreintes: Dict[str, str]):
+        """Enregistre dans le manifeste les fichiers de la table de transit chargés sans erreur"""
+        conn.executemany(
+            'INSERT OR REPLACE INTO import_staging_fichiers (fichier, empreinte_sha256) VALUES (?, ?)',
+            empreintes.items()
+        )
+        conn.execute('''
+            DELETE FROM import_staging_fichiers
+            WHERE fichier IN (SELECT fichier FROM import_staging WHERE erreur IS NOT NULL)
+        ''')
+        conn.execute('''
+            DELETE FROM imports_lignes
+            WHERE nom_fichier IN (SELECT fichier FROM import_staging_fichiers)
+        ''')
+        conn.execute('''
+            INSERT INTO imports_lignes (nom_fichier, numero_carte, nom_rarete, nom_carte, empreinte_sha256)
+            SELECT st.fichier, st.numero_carte, st.nom_rarete, MIN(st.nom_carte), f.empreinte_sha256
+            FROM import_staging st
+            JOIN import_staging_fichiers f ON f.fichier = st.fichier
+            GROUP BY st.fichier, st.numero_carte, st.nom_rarete
+        ''')
+        conn.execute('''
+            INSERT INTO imports_fichiers (nom_fichier, empreinte_sha256, nb_lignes, code_serie, date_import)
+            SELECT f.fichier, f.empreinte_sha256, COUNT(st.id),
+                   (SELECT p.code_serie FROM import_staging p WHERE p.fichier = f.fichier ORDER BY p.id LIMIT 1),
+                   CURRENT_TIMESTAMP
+            FROM import_staging_fichiers f
+            JOIN import_staging st ON st.fichier = f.fichier
+            GROUP BY f.fichier
+            ON CONFLICT (nom_fichier) DO UPDATE SET
+                empreinte_sha256 = excluded.empreinte_sha256,
+                nb_lignes = excluded.nb_lignes,
+                code_serie = excluded.code_serie,
+                date_import = excluded.date_import
+        ''')
+        conn.execute('''
+            DELETE FROM imports_reprises
+            WHERE nom_fichier IN (SELECT fichier FROM import_staging_fichiers)
+        ''')
     
     def marquer_carte_possedee(self, numero_carte: str, nom_rarete: str, possedee: bool = True,
                               date_acquisition: str = None, condition: str = 'NM', 
                               prix_achat: float = None, notes: str = None) -> bool:
         """Marque une carte comme possédée ou non"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
+        nom_rarete = self.normaliser_rarete(nom_rarete) or nom_rarete
+        with self.connexion() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 UPDATE carte_raretes 
                 SET possedee = ?, date_acquisition = ?, condition = ?, 
@@ -303,41 +1565,28 @@ class DatabaseManager:
                   numero_carte, nom_rarete))
             
             if cursor.rowcount > 0:
-                conn.commit()
                 status = "possédée" if possedee else "non possédée"
                 print(f"✅ {numero_carte} ({nom_rarete}) marquée comme {status}")
                 return True
             else:
                 print(f"❌ Carte/rareté non trouvée : {numero_carte} - {nom_rarete}")
                 return False
-                
-        finally:
-            conn.close()
     
     def get_stats_collection(self) -> List[Dict]:
         """Retourne les statistiques de collection par série"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                s.code_serie,
-                s.nom_serie,
-                COUNT(cr.id) as total_exemplaires,
-                SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END) as possedes,
-                ROUND(
-                    (SUM(CASE WHEN cr.possedee THEN 1 ELSE 0 END) * 100.0) / COUNT(cr.id), 
-                    2
-                ) as pourcentage_collection
-            FROM series s
-            LEFT JOIN cartes c ON s.id = c.serie_id
-            LEFT JOIN carte_raretes cr ON c.id = cr.carte_id
-            GROUP BY s.id, s.code_serie, s.nom_serie
-            ORDER BY s.code_serie
-        ''')
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self.lecture_analytique() as conn:
+            results = conn.execute('''
+                SELECT 
+                    s.code_serie,
+                    s.nom_serie,
+                    SUM(st.total) as total_exemplaires,
+                    SUM(st.possedes) as possedes,
+                    ROUND((SUM(st.possedes) * 100.0) / SUM(st.total), 2) as pourcentage_collection
+                FROM series s
+                LEFT JOIN stats_series_raretes st ON st.serie_id = s.id
+                GROUP BY s.id, s.code_serie, s.nom_serie
+                ORDER BY s.code_serie
+            ''').fetchall()
         
         stats = []
         for row in results:
@@ -351,11 +1600,56 @@ class DatabaseManager:
         
         return stats
     
+    def construire_requete_cartes_serie(self, code_serie: str, filtre: str = "all",
+                                        recherche: str = None, rarete: str = None) -> Tuple[str, List]:
+        """
+        Construit la requête d'affichage des cartes d'une série (vue principale)
+        
+        Args:
+            code_serie (str): Code de la série affichée
+            filtre (str): "all", "owned" (possédées) ou "missing" (manquantes)
+            recherche (str, optional): Terme recherché dans le nom ou le numéro
+            rarete (str, optional): Nom de la rareté à afficher uniquement
+        
+        Returns:
+            Tuple[str, List]: Requête SQL et ses paramètres
+        """
+        requete = """
+            SELECT c.numero_carte, c.nom_carte, r.nom_rarete, 
+                   cr.possedee, cr.id as carte_rarete_id
+            FROM series s
+            JOIN cartes c ON s.id = c.serie_id
+            JOIN carte_raretes cr ON c.id = cr.carte_id
+            JOIN raretes r ON cr.rarete_id = r.id
+            WHERE s.code_serie = ?
+        """
+        parametres = [code_serie]
+        
+        if filtre == "owned":
+            requete += " AND cr.possedee = 1"
+        elif filtre == "missing":
+            requete += " AND cr.possedee = 0"
+        
+        if recherche:
+            if recherche.isdigit():
+                # Recherche par numéro de carte
+                requete += " AND c.numero_carte LIKE ?"
+                parametres.append(f"%{recherche}%")
+            else:
+                # Recherche par nom de carte ou combinaison nom/numéro
+                requete += " AND (LOWER(c.nom_carte) LIKE ? OR c.numero_carte LIKE ?)"
+                parametres.append(f"%{recherche}%")
+                parametres.append(f"%{recherche}%")
+        
+        if rarete:
+            requete += " AND r.nom_rarete = ?"
+            parametres.append(rarete)
+        
+        requete += " ORDER BY c.numero_carte, r.nom_rarete"
+        return requete, parametres
+    
     def get_cartes_manquantes(self, code_serie: str = None) -> List[Dict]:
         """Retourne les cartes manquantes (optionnellement filtrées par série)"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         query = '''
             SELECT 
                 s.code_serie,
@@ -366,7 +1660,7 @@ class DatabaseManager:
             JOIN cartes c ON cr.carte_id = c.id
             JOIN series s ON c.serie_id = s.id  
             JOIN raretes r ON cr.rarete_id = r.id
-            WHERE cr.possedee = FALSE
+            WHERE cr.possedee = 0
         '''
         
         params = []
@@ -376,9 +1670,8 @@ class DatabaseManager:
         
         query += ' ORDER BY s.code_serie, c.numero_carte, r.ordre_tri'
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        with self.connexion() as conn:
+            results = conn.execute(query, params).fetchall()
         
         manquantes = []
         for row in results:
@@ -402,8 +1695,13 @@ if __name__ == "__main__":
     serie_id = db.ajouter_serie("TEST", "Test Serie", "http://example.com")
     print(f"ID série créée : {serie_id}")
     
+    # Réparer les compteurs si demandé
+    if "--reconstruire-stats" in sys.argv:
+        db.reconstruire_stats()
+    
     # Afficher les stats (vides pour l'instant)
     stats = db.get_stats_collection()
     print("📊 Statistiques :", stats)
     
+    db.afficher_statistiques_requetes()
     print("✅ Test terminé !")
\ No newline at end of file
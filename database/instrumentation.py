@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentation des requêtes SQL : latence, lignes et nombre d'appels par
+requête, journal tournant des requêtes lentes avec leur plan d'exécution.
+
+Désactivée par défaut (elle ajoute un coût à chaque ligne lue) : la variable
+d'environnement YGO_INSTRUMENTATION_SQL=1 ou configurer(actif=True) l'active.
+Les connexions ouvertes ensuite par le gestionnaire de base de données
+utilisent ConnexionInstrumentee : chaque instruction passe par ici, que ce
+soit depuis l'interface ou depuis un import en ligne de commande.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# Variable d'environnement qui active l'instrumentation au démarrage
+VARIABLE_ACTIVATION = "YGO_INSTRUMENTATION_SQL"
+
+# Configuration par défaut (modifiable avec configurer())
+CONFIG_INSTRUMENTATION = {
+    "actif": os.environ.get(VARIABLE_ACTIVATION, "").strip().lower() in ("1", "true", "oui"),
+    "seuil_lent_ms": 50.0,
+    "journal": Path(__file__).parent / "logs" / "requetes_lentes.log",
+    "taille_max_journal": 1024 * 1024,  # 1 Mo par fichier
+    "nb_journaux": 3
+}
+
+# Instructions pour lesquelles EXPLAIN QUERY PLAN a un sens
+_PREFIXES_EXPLICABLES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+def normaliser_requete(sql: str) -> str:
+    """Réduit les espaces d'une requête pour l'utiliser comme clé de statistiques"""
+    return re.sub(r'\s+', ' ', sql).strip()
+
+class StatistiquesRequetes:
+    """Agrégats par requête normalisée, partagés entre tous les threads"""
+    
+    def __init__(self):
+        self._verrou = threading.Lock()
+        self._requetes = {}
+    
+    def enregistrer(self, sql: str, duree_ms: float, lignes: int):
+        """Ajoute une exécution aux statistiques de la requête"""
+        with self._verrou:
+            stats = self._requetes.get(sql)
+            if stats is None:
+                stats = self._requetes[sql] = {
+                    'appels': 0,
+                    'duree_totale_ms': 0.0,
+                    'duree_max_ms': 0.0,
+                    'lignes': 0,
+                    'lentes': 0
+                }
+            stats['appels'] += 1
+            stats['duree_totale_ms'] += duree_ms
+            stats['duree_max_ms'] = max(stats['duree_max_ms'], duree_ms)
+            stats['lignes'] += max(lignes, 0)
+            if duree_ms >= CONFIG_INSTRUMENTATION['seuil_lent_ms']:
+                stats['lentes'] += 1
+    
+    def resume(self, tri: str = 'duree_totale_ms', limite: Optional[int] = None) -> List[Dict]:
+        """
+        Retourne les statistiques par requête, triées par ordre décroissant
+        
+        Args:
+            tri (str): Clé de tri (duree_totale_ms, duree_max_ms, appels, lignes, lentes)
+            limite (int, optional): Nombre maximal de requêtes retournées
+        
+        Returns:
+            List[Dict]: Une entrée par requête avec sa durée moyenne
+        """
+        with self._verrou:
+            resultats = [
+                dict(stats, requete=sql, duree_moyenne_ms=stats['duree_totale_ms'] / stats['appels'])
+                for sql, stats in self._requetes.items()
+            ]
+        
+        resultats.sort(key=lambda r: r[tri], reverse=True)
+        return resultats[:limite] if limite else resultats
+    
+    def reinitialiser(self):
+        """Efface toutes les statistiques"""
+        with self._verrou:
+            self._requetes.clear()
+
+# Statistiques globales du processus
+statistiques = StatistiquesRequetes()
+
+_journal = None
+_verrou_journal = threading.Lock()
+
+def obtenir_journal() -> logging.Logger:
+    """Retourne le journal des requêtes lentes (fichier tournant créé au besoin)"""
+    global _journal
+    with _verrou_journal:
+        if _journal is None:
+            journal = logging.getLogger("collection.requetes_lentes")
+            journal.setLevel(logging.WARNING)
+            journal.propagate = False
+            
+            chemin = Path(CONFIG_INSTRUMENTATION['journal'])
+            try:
+                chemin.parent.mkdir(parents=True, exist_ok=True)
+                handler = RotatingFileHandler(
+                    chemin,
+                    maxBytes=CONFIG_INSTRUMENTATION['taille_max_journal'],
+                    backupCount=CONFIG_INSTRUMENTATION['nb_journaux'],
+                    encoding='utf-8'
+                )
+            except OSError as e:
+                print(f"⚠️ Journal des requêtes lentes indisponible : {e}")
+                handler = logging.NullHandler()
+            
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            journal.addHandler(handler)
+            _journal = journal
+        return _journal
+
+def configurer(actif: bool = None, seuil_lent_ms: float = None, journal: str = None):
+    """
+    Modifie la configuration de l'instrumentation
+    
+    Args:
+        actif (bool, optional): Active ou désactive l'instrumentation des nouvelles connexions
+        seuil_lent_ms (float, optional): Durée à partir de laquelle une requête est journalisée
+        journal (str, optional): Chemin du fichier de journal des requêtes lentes
+    """
+    global _journal
+    if actif is not None:
+        CONFIG_INSTRUMENTATION['actif'] = actif
+    if seuil_lent_ms is not None:
+        CONFIG_INSTRUMENTATION['seuil_lent_ms'] = float(seuil_lent_ms)
+    if journal is not None:
+        CONFIG_INSTRUMENTATION['journal'] = Path(journal)
+        with _verrou_journal:
+            if _journal is not None:
+                for handler in list(_journal.handlers):
+                    _journal.removeHandler(handler)
+                    handler.close()
+                _journal = None
+
+def plan_execution(conn: sqlite3.Connection, sql: str, parametres=()) -> str:
+    """Retourne le plan EXPLAIN QUERY PLAN d'une requête (vide si non applicable)"""
+    if not sql.lstrip().upper().startswith(_PREFIXES_EXPLICABLES):
+        return ""
+    try:
+        # Curseur de base : le plan lui-même n'est pas instrumenté
+        lignes = sqlite3.Cursor(conn).execute(f"EXPLAIN QUERY PLAN {sql}", parametres).fetchall()
+    except sqlite3.Error as e:
+        return f"(plan indisponible : {e})"
+    return "\n".join(f"    {ligne[-1]}" for ligne in lignes)
+
+class CurseurInstrumente(sqlite3.Cursor):
+    """
+    Curseur mesurant chaque instruction, de l'exécution à la dernière ligne lue.
+    
+    La mesure d'une requête SELECT inclut le temps de lecture des lignes :
+    elle est enregistrée quand le résultat est épuisé, à l'exécution suivante
+    ou à la fermeture du curseur.
+    """
+    
+    def _demarrer(self, sql: str, parametres):
+        self._terminer()
+        self._sql = sql
+        self._parametres = parametres
+        self._duree = 0.0
+        self._lignes = 0
+        self._en_cours = True
+    
+    def _terminer(self):
+        if not getattr(self, '_en_cours', False):
+            return
+        self._en_cours = False
+        
+        duree_ms = self._duree * 1000
+        # Lignes lues pour un SELECT, lignes modifiées sinon
+        lignes = self._lignes if self._lignes else max(self.rowcount, 0)
+        sql = normaliser_requete(self._sql)
+        statistiques.enregistrer(sql, duree_ms, lignes)
+        
+        if duree_ms >= CONFIG_INSTRUMENTATION['seuil_lent_ms']:
+            plan = plan_execution(self.connection, self._sql, self._parametres)
+            obtenir_journal().warning(
+                f"{duree_ms:.1f} ms, {lignes} ligne(s) : {sql}" + (f"\n{plan}" if plan else "")
+            )
+    
+    def _mesurer(self, methode, *args):
+        debut = time.perf_counter()
+        try:
+            return methode(*args)
+        finally:
+            self._duree += time.perf_counter() - debut
+    
+    def execute(self, sql, parametres=()):
+        self._demarrer(sql, parametres)
+        try:
+            self._mesurer(super().execute, sql, parametres)
+        except BaseException:
+            self._terminer()
+            raise
+        if self.description is None:
+            self._terminer()
+        return self
+    
+    def executemany(self, sql, sequence_parametres):
+        sequence_parametres = list(sequence_parametres)
+        self._demarrer(sql, sequence_parametres[0] if sequence_parametres else ())
+        try:
+            self._mesurer(super().executemany, sql, sequence_parametres)
+        finally:
+            self._terminer()
+        return self
+    
+    def fetchone(self):
+        ligne = self._mesurer(super().fetchone)
+        if ligne is None:
+            self._terminer()
+        else:
+            self._lignes += 1
+        return ligne
+    
+    def fetchmany(self, size=None):
+        lignes = self._mesurer(super().fetchmany, size if size is not None else self.arraysize)
+        self._lignes += len(lignes)
+        if not lignes:
+            self._terminer()
+        return lignes
+    
+    def fetchall(self):
+        lignes = self._mesurer(super().fetchall)
+        self._lignes += len(lignes)
+        self._terminer()
+        return lignes
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        ligne = self.fetchone()
+        if ligne is None:
+            raise StopIteration
+        return ligne
+    
+    def close(self):
+        self._terminer()
+        super().close()
+    
+    def __del__(self):
+        # Curseur abandonné avant la fin du résultat (ex. fetchone() unique)
+        try:
+            self._terminer()
+        except Exception:
+            pass
+
+class ConnexionInstrumentee(sqlite3.Connection):
+    """Connexion dont tous les curseurs (y compris ceux de execute()) sont instrumentés"""
+    
+    def cursor(self, factory=CurseurInstrumente):
+        return super().cursor(factory)
+    
+    def execute(self, sql, parametres=()):
+        return self.cursor().execute(sql, parametres)
+    
+    def executemany(self, sql, sequence_parametres):
+        return self.cursor().executemany(sql, sequence_parametres)
+    
+    def executescript(self, script):
+        # Script mesuré d'un bloc (création du schéma) : pas de plan par instruction
+        debut = time.perf_counter()
+        try:
+            return super().executescript(script)
+        finally:
+            duree_ms = (time.perf_counter() - debut) * 1000
+            sql = normaliser_requete(script)
+            statistiques.enregistrer(sql, duree_ms, 0)
+            if duree_ms >= CONFIG_INSTRUMENTATION['seuil_lent_ms']:
+                obtenir_journal().warning(f"{duree_ms:.1f} ms, script : {sql[:500]}")
+
+def fabrique_connexion():
+    """Classe de connexion à passer à sqlite3.connect(factory=...)"""
+    return ConnexionInstrumentee if CONFIG_INSTRUMENTATION['actif'] else sqlite3.Connection
+
+def afficher_resume(limite: int = 15, tri: str = 'duree_totale_ms'):
+    """Affiche les requêtes les plus coûteuses du processus"""
+    resume = statistiques.resume(tri=tri, limite=limite)
+    if not resume:
+        if not CONFIG_INSTRUMENTATION['actif']:
+            print(f"📊 Instrumentation SQL désactivée ({VARIABLE_ACTIVATION}=1 pour l'activer)")
+        else:
+            print("📊 Aucune requête instrumentée")
+        return
+    
+    print(f"\n📊 Requêtes SQL (top {len(resume)} par {tri}) :")
+    for r in resume:
+        requete = r['requete'] if len(r['requete']) <= 90 else r['requete'][:87] + "..."
+        print(f"  ⏱️ {r['duree_totale_ms']:9.1f} ms | {r['appels']:6d} appels | "
+              f"moy {r['duree_moyenne_ms']:7.2f} ms | max {r['duree_max_ms']:7.1f} ms | "
+              f"{r['lignes']:7d} lignes | {requete}")
+
+def exporter_resume(chemin: str) -> str:
+    """
+    Exporte les statistiques de toutes les requêtes en JSON
+    
+    Returns:
+        str: Chemin du fichier écrit
+    """
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump({
+            'seuil_lent_ms': CONFIG_INSTRUMENTATION['seuil_lent_ms'],
+            'requetes': statistiques.resume()
+        }, f, ensure_ascii=False, indent=2)
+    return chemin
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lecteurs des formats d'import du catalogue : CSV, JSON Lines et Parquet/Arrow
+
+Chaque lecteur produit des lots en colonnes (une liste par colonne requise)
+plutôt qu'un dictionnaire par ligne : les tables Arrow passent directement de
+leurs colonnes aux insertions par lots de l'importateur.
+
+Chaque ligne lue a une position de reprise : l'octet qui la suit pour les
+formats texte, son rang pour Arrow. Un import interrompu reprend la lecture
+directement à cette position, sans relire le début du fichier.
+"""
+
+import csv
+import json
+import itertools
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.ipc as ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Colonnes obligatoires du format du convertisseur (dans cet ordre dans les lots)
+COLONNES_REQUISES = ['Code_Serie', 'Nom_Carte', 'Rareté', 'Numéro_Carte']
+
+# Lot en colonnes : (numéros de ligne, code_serie, nom_carte, rarete, numero_carte)
+LotColonnes = Tuple[Sequence[int], List, List, List, List]
+
+# Point de reprise : (position, numéro de la ligne suivante)
+PointReprise = Tuple[int, int]
+
+def compter_fins_de_ligne(chemin: str, taille_bloc: int = 1024 * 1024) -> int:
+    """Compte les fins de ligne d'un fichier texte, lu par blocs binaires"""
+    nb = 0
+    dernier = b'\n'
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(taille_bloc), b''):
+            nb += bloc.count(b'\n')
+            dernier = bloc[-1:]
+    # Dernière ligne sans fin de ligne
+    return nb + (dernier != b'\n')
+
+class LecteurCatalogue:
+    """Lecteur de base : un format de fichier, identifié par ses extensions"""
+    
+    nom = ""
+    extensions = ()
+    
+    def colonnes(self, chemin: str) -> Optional[List[str]]:
+        """Retourne les noms de colonnes du fichier (None si vide ou sans en-têtes)"""
+        raise NotImplementedError
+    
+    def estimer_nb_lignes(self, chemin: str) -> Optional[int]:
+        """Nombre approximatif de lignes de données, sans lire le contenu (None si inconnu)"""
+        return None
+    
+    def lire_colonnes(self, chemin: str, taille_lot: int) -> Iterator[LotColonnes]:
+        """
+        Lit le fichier en flux, par lots d'au plus `taille_lot` lignes
+        
+        Les colonnes requises doivent avoir été vérifiées avec colonnes().
+        Les valeurs sont brutes (non nettoyées) ; None pour une valeur absente.
+        
+        Yields:
+            LotColonnes: Numéros de ligne puis une liste par colonne requise
+        """
+        for lot, _ in self.lire_depuis(chemin, taille_lot):
+            yield lot
+    
+    def lire_depuis(self, chemin: str, taille_lot: int,
+                    reprise: PointReprise = None) -> Iterator[Tuple[LotColonnes, Sequence[int]]]:
+        """
+        Comme lire_colonnes, avec la position de reprise de chaque ligne
+        
+        Args:
+            chemin (str): Chemin du fichier
+            taille_lot (int): Nombre maximal de lignes par lot
+            reprise (PointReprise, optional): Position qui suit la dernière ligne
+                déjà traitée et numéro de la ligne suivante : la lecture commence là
+        
+        Yields:
+            Tuple[LotColonnes, Sequence[int]]: Lot et, pour chaque ligne, la position
+            qui la suit (son point de reprise est cette position et son numéro + 1)
+        """
+        raise NotImplementedError
+
+class LecteurCSV(LecteurCatalogue):
+    """Fichiers CSV du convertisseur (ligne 1 : en-têtes)"""
+    
+    nom = "CSV"
+    extensions = ('.csv',)
+    
+    def colonnes(self, chemin: str) -> Optional[List[str]]:
+        with open(chemin, 'r', encoding='utf-8', newline='') as f:
+            return next(csv.reader(f), None)
+    
+    def estimer_nb_lignes(self, chemin: str) -> Optional[int]:
+        # Fins de ligne, en-têtes exclus (les champs multilignes sont rares)
+        return max(compter_fins_de_ligne(chemin) - 1, 0)
+    
+    def lire_colonnes(self, chemin: str, taille_lot: int) -> Iterator[LotColonnes]:
+        with open(chemin, 'r', encoding='utf-8', newline='') as f:
+            lecteur = csv.reader(f)
+            entetes = next(lecteur)
+            indices = [entetes.index(colonne) for colonne in COLONNES_REQUISES]
+            nb_colonnes = max(indices) + 1
+            
+            numero_ligne = 1
+            while True:
+                lignes = list(itertools.islice(lecteur, taille_lot))
+                if not lignes:
+                    return
+                
+                # Lignes trop courtes : valeurs absentes
+                lignes = [ligne if len(ligne) >= nb_colonnes else ligne + [None] * (nb_colonnes - len(ligne))
+                          for ligne in lignes]
+                yield (range(numero_ligne + 1, numero_ligne + 1 + len(lignes)),
+                       *([ligne[i] for ligne in lignes] for i in indices))
+                numero_ligne += len(lignes)
+    
+    def lire_depuis(self, chemin: str, taille_lot: int,
+                    reprise: PointReprise = None) -> Iterator[Tuple[LotColonnes, Sequence[int]]]:
+        # Lecture binaire ligne à ligne pour connaître la position de chaque
+        # enregistrement (tell() est indisponible pendant l'itération d'un
+        # fichier texte) ; csv.reader ne demande que les lignes nécessaires
+        with open(chemin, 'rb') as f:
+            entetes = next(csv.reader([f.readline().decode('utf-8')]))
+            indices = [entetes.index(colonne) for colonne in COLONNES_REQUISES]
+            nb_colonnes = max(indices) + 1
+            
+            if reprise:
+                position, numero_ligne = reprise
+                f.seek(position)
+            else:
+                position, numero_ligne = f.tell(), 2
+            
+            lues = [position]
+            
+            def lignes_texte():
+                for ligne in iter(f.readline, b''):
+                    lues[0] += len(ligne)
+                    yield ligne.decode('utf-8')
+            
+            lecteur = csv.reader(lignes_texte())
+            while True:
+                lignes, positions = [], []
+                for ligne in lecteur:
+                    if len(ligne) < nb_colonnes:
+                        ligne = ligne + [None] * (nb_colonnes - len(ligne))
+                    lignes.append(ligne)
+                    positions.append(lues[0])
+                    if len(lignes) >= taille_lot:
+                        break
+                if not lignes:
+                    return
+                
+                yield ((range(numero_ligne, numero_ligne + len(lignes)),
+                        *([ligne[i] for ligne in lignes] for i in indices)), positions)
+                numero_ligne += len(lignes)
+
+class LecteurJSONL(LecteurCatalogue):
+    """Fichiers JSON Lines : un objet par ligne, clés = colonnes requises"""
+    
+    nom = "JSONL"
+    extensions = ('.jsonl', '.ndjson')
+    
+    def colonnes(self, chemin: str) -> Optional[List[str]]:
+        with open(chemin, 'r', encoding='utf-8') as f:
+            for ligne in f:
+                if ligne.strip():
+                    objet = json.loads(ligne)
+                    return list(objet) if isinstance(objet, dict) else None
+        return None
+    
+    def estimer_nb_lignes(self, chemin: str) -> Optional[int]:
+        return compter_fins_de_ligne(chemin)
+    
+    def lire_depuis(self, chemin: str, taille_lot: int,
+                    reprise: PointReprise = None) -> Iterator[Tuple[LotColonnes, Sequence[int]]]:
+        with open(chemin, 'rb') as f:
+            position, debut = reprise if reprise else (0, 1)
+            f.seek(position)
+            numeros, positions, colonnes = [], [], [[] for _ in COLONNES_REQUISES]
+            
+            for numero_ligne, ligne in enumerate(iter(f.readline, b''), debut):
+                position += len(ligne)
+                if not ligne.strip():
+                    continue
+                try:
+                    objet = json.loads(ligne)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Ligne {numero_ligne} : JSON invalide ({e.msg})")
+                if not isinstance(objet, dict):
+                    raise ValueError(f"Ligne {numero_ligne} : objet JSON attendu")
+                
+                numeros.append(numero_ligne)
+                positions.append(position)
+                for valeurs, colonne in zip(colonnes, COLONNES_REQUISES):
+                    valeur = objet.get(colonne)
+                    valeurs.append(None if valeur is None else str(valeur))
+                
+                if len(numeros) >= taille_lot:
+                    yield (numeros, *colonnes), positions
+                    numeros, positions, colonnes = [], [], [[] for _ in COLONNES_REQUISES]
+            
+            if numeros:
+                yield (numeros, *colonnes), positions
+
+class LecteurArrow(LecteurCatalogue):
+    """Fichiers Parquet et Arrow IPC / Feather (nécessite pyarrow)"""
+    
+    nom = "Arrow"
+    extensions = ('.parquet', '.arrow', '.feather', '.ipc')
+    
+    def _verifier_pyarrow(self):
+        if not PYARROW_AVAILABLE:
+            raise ValueError("pyarrow n'est pas installé. Utilisez: pip install pyarrow")
+    
+    def _lots_arrow(self, chemin: str, taille_lot: int, colonnes: List[str] = None, debut: int = 0):
+        """RecordBatch successifs du fichier à partir de la ligne `debut`, limités aux colonnes demandées"""
+        if Path(chemin).suffix.lower() == '.parquet':
+            fichier = pq.ParquetFile(chemin)
+            # Groupes de lignes entièrement avant le début : ni lus ni décodés
+            groupes = []
+            for i in range(fichier.num_row_groups):
+                nb_lignes = fichier.metadata.row_group(i).num_rows
+                if not groupes and debut >= nb_lignes:
+                    debut -= nb_lignes
+                else:
+                    groupes.append(i)
+            lots = fichier.iter_batches(batch_size=taille_lot, columns=colonnes, row_groups=groupes)
+            yield from self._decouper(lots, taille_lot, colonnes, debut)
+            return
+        
+        with pa.memory_map(chemin) as source:
+            try:
+                lecteur = ipc.open_file(source)
+                lots = (lecteur.get_batch(i) for i in range(lecteur.num_record_batches))
+            except Exception:
+                # Format flux (stream) plutôt que fichier
+                source.seek(0)
+                lots = ipc.open_stream(source)
+            yield from self._decouper(lots, taille_lot, colonnes, debut)
+    
+    def _decouper(self, lots, taille_lot: int, colonnes: List[str], debut: int):
+        """Saute les `debut` premières lignes et redécoupe les lots à la taille voulue"""
+        for lot in lots:
+            if debut >= lot.num_rows:
+                debut -= lot.num_rows
+                continue
+            lot = lot.select(colonnes) if colonnes else lot
+            lot, debut = lot.slice(debut), 0
+            # Les lots écrits par l'amont peuvent dépasser la taille voulue
+            for i in range(0, lot.num_rows, taille_lot):
+                yield lot.slice(i, taille_lot)
+    
+    def colonnes(self, chemin: str) -> Optional[List[str]]:
+        self._verifier_pyarrow()
+        if Path(chemin).suffix.lower() == '.parquet':
+            return pq.read_schema(chemin).names
+        for lot in self._lots_arrow(chemin, 1):
+            return lot.schema.names
+        return None
+    
+    def estimer_nb_lignes(self, chemin: str) -> Optional[int]:
+        if not PYARROW_AVAILABLE:
+            return None
+        try:
+            if Path(chemin).suffix.lower() == '.parquet':
+                return pq.ParquetFile(chemin).metadata.num_rows
+            # Projection mémoire : seules les métadonnées des lots sont lues
+            lecteur = ipc.open_file(pa.memory_map(chemin))
+            return sum(lecteur.get_batch(i).num_rows for i in range(lecteur.num_record_batches))
+        except Exception:
+            # Flux Arrow : pas d'index des lots
+            return None
+    
+    def lire_depuis(self, chemin: str, taille_lot: int,
+                    reprise: PointReprise = None) -> Iterator[Tuple[LotColonnes, Sequence[int]]]:
+        self._verifier_pyarrow()
+        # Position = rang de la ligne (numéro de ligne = rang + 1)
+        rang = reprise[0] if reprise else 0
+        for lot in self._lots_arrow(chemin, taille_lot, COLONNES_REQUISES, rang):
+            if lot.num_rows == 0:
+                continue
+            # Conversion colonne par colonne, sans passer par un dictionnaire par ligne
+            colonnes = [lot.column(colonne).cast('string').to_pylist() for colonne in COLONNES_REQUISES]
+            yield ((range(rang + 1, rang + 1 + lot.num_rows), *colonnes),
+                   range(rang + 1, rang + 1 + lot.num_rows))
+            rang += lot.num_rows
+
+LECTEURS = [LecteurCSV(), LecteurJSONL(), LecteurArrow()]
+
+# Extension -> lecteur
+_LECTEURS_PAR_EXTENSION: Dict[str, LecteurCatalogue] = {
+    extension: lecteur for lecteur in LECTEURS for extension in lecteur.extensions
+}
+
+def enregistrer_lecteur(lecteur: LecteurCatalogue):
+    """Ajoute (ou remplace) un lecteur pour ses extensions"""
+    for extension in lecteur.extensions:
+        _LECTEURS_PAR_EXTENSION[extension] = lecteur
+
+def obtenir_lecteur(chemin: str) -> Optional[LecteurCatalogue]:
+    """Retourne le lecteur adapté à l'extension du fichier (None si non supporté)"""
+    return _LECTEURS_PAR_EXTENSION.get(Path(chemin).suffix.lower())
+
+def est_supporte(chemin: str) -> bool:
+    """Indique si un fichier peut être importé"""
+    return obtenir_lecteur(chemin) is not None
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache disque des pages de listes de sets, revalidé par GET conditionnel
+
+Chaque page est rangée sous l'empreinte SHA-256 de son URL : le HTML
+compressé (gzip) et ses métadonnées JSON (URL, ETag, Last-Modified, date).
+Un nouveau scraping d'une liste inchangée ne coûte qu'un aller-retour 304,
+et les pages déjà téléchargées peuvent être ré-analysées hors ligne.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+# Dossier par défaut, à côté du convertisseur
+DOSSIER_CACHE_DEFAUT = Path(__file__).parent.parent / "convertisseur" / "cache_pages"
+
+class CachePages:
+    """Pages HTML compressées sur disque, avec leurs validateurs HTTP"""
+    
+    def __init__(self, dossier: Path = None):
+        """
+        Args:
+            dossier (Path, optional): Dossier du cache (créé au premier enregistrement)
+        """
+        self.dossier = Path(dossier or DOSSIER_CACHE_DEFAUT)
+        self._verrou = threading.Lock()
+    
+    def _chemins(self, url: str) -> Tuple[Path, Path]:
+        cle = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.dossier / f"{cle}.html.gz", self.dossier / f"{cle}.json"
+    
+    def _ecrire(self, chemin: Path, donnees: bytes):
+        """Écriture atomique : un lecteur ne voit jamais un fichier à moitié écrit"""
+        descripteur, temporaire = tempfile.mkstemp(dir=self.dossier, suffix=".tmp")
+        try:
+            with os.fdopen(descripteur, 'wb') as f:
+                f.write(donnees)
+            os.replace(temporaire, chemin)
+        except BaseException:
+            os.unlink(temporaire)
+            raise
+    
+    def metadonnees(self, url: str) -> Optional[Dict]:
+        """
+        Métadonnées d'une page en cache
+        
+        Returns:
+            Optional[Dict]: url, etag, last_modified, date_maj ; None si absente
+        """
+        chemin_page, chemin_meta = self._chemins(url)
+        try:
+            with open(chemin_meta, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if chemin_page.exists() else None
+    
+    def lire(self, url: str) -> Optional[str]:
+        """
+        HTML d'une page en cache
+        
+        Returns:
+            Optional[str]: Le HTML, None si la page n'est pas en cache
+        """
+        chemin_page, _ = self._chemins(url)
+        try:
+            with gzip.open(chemin_page, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+    
+    def entetes_conditionnels(self, url: str) -> Dict[str, str]:
+        """
+        En-têtes de revalidation d'une page en cache
+        
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since (vide sans validateur)
+        """
+        meta = self.metadonnees(url) or {}
+        entetes = {}
+        if meta.get('etag'):
+            entetes['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            entetes['If-Modified-Since'] = meta['last_modified']
+        return entetes
+    
+    def enregistrer(self, url: str, contenu: str, etag: str = None, last_modified: str = None):
+        """
+        Enregistre une page et ses validateurs (remplace la version précédente)
+        
+        Args:
+            url (str): URL de la page
+            contenu (str): HTML complet
+            etag (str, optional): En-tête ETag de la réponse
+            last_modified (str, optional): En-tête Last-Modified de la réponse
+        """
+        chemin_page, chemin_meta = self._chemins(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'date_maj': datetime.now().isoformat(timespec='seconds')
+        }
+        with self._verrou:
+            self.dossier.mkdir(parents=True, exist_ok=True)
+            # La page d'abord : des métadonnées ne désignent jamais une page absente
+            self._ecrire(chemin_page, gzip.compress(contenu.encode('utf-8')))
+            self._ecrire(chemin_meta, json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'))
+    
+    def rafraichir(self, url: str):
+        """Note une revalidation (304) : la page en cache reste à jour"""
+        meta = self.metadonnees(url)
+        if meta is None:
+            return
+        meta['date_maj'] = datetime.now().isoformat(timespec='seconds')
+        _, chemin_meta = self._chemins(url)
+        with self._verrou:
+            self._ecrire(chemin_meta, json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'))
+    
+    def urls(self) -> Iterator[str]:
+        """URLs des pages en cache (pour une ré-analyse hors ligne)"""
+        if not self.dossier.exists():
+            return
+        for chemin_meta in sorted(self.dossier.glob("*.json")):
+            try:
+                with open(chemin_meta, 'r', encoding='utf-8') as f:
+                    yield json.load(f)['url']
+            except (OSError, ValueError, KeyError):
+                continue
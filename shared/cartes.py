@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Enregistrement d'une carte extraite d'une page de liste de set
+
+Le convertisseur produisait un dictionnaire dont les raretés étaient jointes
+en une chaîne " / " (tronquée à 8 raretés et 200 caractères), que l'écriture
+CSV redécoupait ensuite. CarteExtraite garde la liste complète des raretés
+jusqu'aux lignes CSV lues par l'importeur.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Valeur écrite quand aucune rareté n'a été trouvée (l'importeur écarte la ligne)
+RARETE_NON_TROUVEE = "Rareté non trouvée"
+
+# En-têtes du CSV du convertisseur (colonnes attendues par l'importeur)
+COLONNES_CSV = ('Code_Serie', 'Nom_Carte', 'Rareté', 'Numéro_Carte')
+
+MOTIF_CODE_SERIE = re.compile(r'([A-Z0-9]+)-FR\d+')
+
+def extraire_code_serie(numero_carte: str) -> str:
+    """
+    Extrait le code de série d'un numéro de carte
+    Ex: BLMM-FR001 -> BLMM, RA02-FR001 -> RA02
+    """
+    match = MOTIF_CODE_SERIE.match(numero_carte)
+    if match:
+        return match.group(1)
+    return "UNKNOWN"
+
+class CarteExtraite:
+    """Carte d'une liste de set : numéro, nom français, raretés et série"""
+    
+    __slots__ = ('numero', 'nom', 'raretes', 'code_serie')
+    
+    def __init__(self, numero: str, nom: str, raretes: Iterable[str] = (),
+                 code_serie: Optional[str] = None):
+        """
+        Args:
+            numero (str): Numéro de la carte (ex. BLMM-FR001)
+            nom (str): Nom français
+            raretes (Iterable[str]): Raretés dans l'ordre de la page (doublons retirés)
+            code_serie (str, optional): Code de la série (déduit du numéro par défaut)
+        """
+        self.numero = numero
+        self.nom = nom
+        self.raretes: List[str] = list(dict.fromkeys(raretes))
+        self.code_serie = code_serie or extraire_code_serie(numero)
+    
+    @property
+    def rarete(self) -> str:
+        """Raretés jointes pour l'affichage ("Super Rare / Ultra Rare")"""
+        return " / ".join(self.raretes) if self.raretes else RARETE_NON_TROUVEE
+    
+    def lignes_csv(self) -> Iterator[Tuple[str, str, str, str]]:
+        """
+        Une ligne par rareté, dans l'ordre de COLONNES_CSV
+        
+        Returns:
+            Iterator[Tuple[str, str, str, str]]: (code_serie, nom, rarete, numero)
+        """
+        for rarete in self.raretes or (RARETE_NON_TROUVEE,):
+            yield self.code_serie, self.nom, rarete, self.numero
+    
+    def __eq__(self, autre):
+        if not isinstance(autre, CarteExtraite):
+            return NotImplemented
+        return (self.numero, self.nom, self.raretes, self.code_serie) == \
+               (autre.numero, autre.nom, autre.raretes, autre.code_serie)
+    
+    def __repr__(self):
+        return f"CarteExtraite({self.numero!r}, {self.nom!r}, {self.raretes!r}, {self.code_serie!r})"
@@ -132,6 +132,18 @@ def formater_nombre_cartes(nombre):
     else:
         return f"{nombre:,} cartes".replace(',', ' ')
 
+def formater_duree(secondes):
+    """Formate une durée (estimation de temps restant) pour l'affichage"""
+    if secondes is None:
+        return "--"
+    secondes = int(round(secondes))
+    if secondes < 60:
+        return f"{secondes} s"
+    elif secondes < 3600:
+        return f"{secondes // 60} min {secondes % 60:02d} s"
+    else:
+        return f"{secondes // 3600} h {(secondes % 3600) // 60:02d} min"
+
 def formater_pourcentage(pourcentage):
     """Formate un pourcentage pour l'affichage"""
     if pourcentage == 0:
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Normalisation des noms de raretés lus dans les fichiers importés
+
+Les pages scrapées donnent la même rareté sous plusieurs formes ("Secret Rare",
+"Secret rare", "Rare Secrète", "ScR", "Secret R...") : chaque variante créait
+sa propre ligne dans la table raretes. Le normaliseur ramène un nom brut à son
+nom canonique (celui de RARETES_CONFIG) en une seule recherche dans un
+dictionnaire ; le résultat est mémorisé par chaîne brute.
+"""
+
+import re
+import sys
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from shared.config import RARETES_CONFIG
+except ImportError:
+    from config import RARETES_CONFIG
+
+# Variantes connues -> nom canonique (les abréviations de RARETES_CONFIG sont ajoutées d'office)
+ALIAS_RARETES = {
+    # Noms français
+    'Commune': 'Common',
+    'Rare Secrète': 'Secret Rare',
+    'Rare Ultime': 'Ultimate Rare',
+    'Rare Fantôme': 'Ghost Rare',
+    'Rare Starlight': 'Starlight Rare',
+    'Rare Collector': 'Collector\'s Rare',
+    'Rare Secrète Platine': 'Platinum Secret Rare',
+    'Rare Secrète Quart de Siècle': 'Quarter Century Secret Rare',
+    # Formes abrégées des pages de listes
+    'Quarter Century Rare': 'Quarter Century Secret Rare',
+    'QCSR': 'Quarter Century Secret Rare',
+    'PSR': 'Platinum Secret Rare',
+    'SE': 'Secret Rare',
+    'UL': 'Ultimate Rare',
+}
+
+# Valeurs de remplissage du convertisseur (rareté non lue sur la page) :
+# les exemplaires sont conservés sous RARETE_INCONNUE
+VALEURS_SANS_RARETE = ('Rareté non trouvée', '...', '…')
+RARETE_INCONNUE = 'Rareté inconnue'
+
+def cle_rarete(nom: str) -> str:
+    """
+    Clé de comparaison d'un nom de rareté : sans accents, casse, apostrophes
+    ni différences d'espaces ou de tirets
+    
+    Example:
+        cle_rarete("  Collector’s  rare ") -> "collectors rare"
+    """
+    nom = unicodedata.normalize('NFKD', nom)
+    nom = ''.join(c for c in nom if not unicodedata.combining(c))
+    nom = re.sub(r"['’`]", '', nom.casefold())
+    return ' '.join(re.sub(r'[-_]', ' ', nom).split())
+
+class NormaliseurRaretes:
+    """Table d'internement {clé: nom canonique} construite depuis RARETES_CONFIG"""
+    
+    def __init__(self, raretes: Iterable[str] = None, alias: Dict[str, str] = None):
+        """
+        Args:
+            raretes (Iterable[str], optional): Noms canoniques (RARETES_CONFIG par défaut)
+            alias (Dict[str, str], optional): Variantes -> nom canonique (ALIAS_RARETES par défaut)
+        """
+        self._verrou = threading.Lock()
+        self._par_cle: Dict[str, str] = {}
+        # Nom brut -> nom canonique (None si illisible) : une recherche par ligne
+        self._memo: Dict[str, Optional[str]] = {}
+        
+        if raretes is None:
+            for nom, config in RARETES_CONFIG.items():
+                canonique = self.ajouter(nom)
+                self._par_cle.setdefault(cle_rarete(config['abbrev']), canonique)
+        else:
+            for nom in raretes:
+                self.ajouter(nom)
+        
+        for variante, nom in (ALIAS_RARETES if alias is None else alias).items():
+            self._par_cle.setdefault(cle_rarete(variante), self.ajouter(nom))
+        
+        for valeur in VALEURS_SANS_RARETE:
+            self._par_cle.setdefault(cle_rarete(valeur), self.ajouter(RARETE_INCONNUE))
+    
+    @property
+    def connues(self) -> List[str]:
+        """Noms canoniques enregistrés"""
+        with self._verrou:
+            return sorted(set(self._par_cle.values()))
+    
+    def ajouter(self, nom: str) -> str:
+        """
+        Enregistre un nom de rareté, sauf si une variante est déjà connue
+        
+        Args:
+            nom (str): Nom de rareté (ex. rareté personnalisée lue en base)
+        
+        Returns:
+            str: Nom canonique de cette rareté
+        """
+        nom = ' '.join(nom.split())
+        with self._verrou:
+            return self._par_cle.setdefault(cle_rarete(nom), sys.intern(nom))
+    
+    def canonique(self, nom: Optional[str]) -> Optional[str]:
+        """
+        Ramène un nom brut à son nom canonique
+        
+        Une rareté réellement nouvelle est enregistrée telle quelle (espaces
+        normalisés) : ses variantes suivantes lui seront ramenées. Un nom
+        tronqué ("Secret R...") est complété s'il ne correspond qu'à une
+        seule rareté connue. Les valeurs de remplissage du convertisseur
+        sont ramenées à RARETE_INCONNUE.
+        
+        Args:
+            nom (str): Nom lu dans le fichier
+        
+        Returns:
+            Optional[str]: Nom canonique, None si vide ou tronqué de façon
+            ambiguë
+        """
+        try:
+            return self._memo[nom]
+        except KeyError:
+            pass
+        
+        canonique = self._resoudre(nom) if nom else None
+        self._memo[nom] = canonique
+        return canonique
+    
+    def _resoudre(self, nom: str) -> Optional[str]:
+        cle = cle_rarete(nom)
+        if not cle:
+            return None
+        
+        with self._verrou:
+            canonique = self._par_cle.get(cle)
+            if canonique is not None:
+                return canonique
+            
+            tronque = re.sub(r'\s*(\.\.\.|…)$', '', cle)
+            if tronque != cle:
+                candidats = {c for k, c in self._par_cle.items() if tronque and k.startswith(tronque)}
+                return candidats.pop() if len(candidats) == 1 else None
+        
+        return self.ajouter(nom)
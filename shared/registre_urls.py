@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registre partagé des URLs de séries (urls_sauvees.json)
+
+Le fichier JSON n'est relu que si sa date de modification ou sa taille a
+changé depuis le dernier chargement : un import de dossier de plusieurs
+centaines de fichiers ne fait plus qu'une seule lecture.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Emplacements cherchés par défaut, par ordre de priorité
+PROJECT_ROOT = Path(__file__).parent.parent
+CHEMINS_URLS_DEFAUT = (
+    # Fichier global dans la racine du projet
+    PROJECT_ROOT / "urls_sauvees.json",
+    # Fichier dans le convertisseur
+    PROJECT_ROOT / "convertisseur" / "urls_sauvees.json",
+    # Fichier local dans le répertoire courant
+    Path("urls_sauvees.json")
+)
+
+class RegistreUrls:
+    """Dictionnaire {série: url} chargé depuis le premier fichier JSON existant"""
+    
+    def __init__(self, chemins: List[Path]):
+        """
+        Args:
+            chemins (List[Path]): Fichiers JSON candidats, par ordre de priorité
+        """
+        self.chemins = [Path(chemin) for chemin in chemins]
+        self._verrou = threading.Lock()
+        self._urls = {}
+        self._signature = None
+        self.nb_chargements = 0
+    
+    def _fichier_courant(self) -> Tuple[Optional[Path], Optional[Tuple]]:
+        """Premier fichier existant et sa signature (chemin, mtime, taille)"""
+        for chemin in self.chemins:
+            try:
+                infos = os.stat(chemin)
+            except OSError:
+                continue
+            return chemin, (str(chemin.resolve()), infos.st_mtime_ns, infos.st_size)
+        return None, None
+    
+    def obtenir(self) -> Dict[str, str]:
+        """
+        Retourne les URLs, en relisant le fichier seulement s'il a changé
+        
+        Returns:
+            Dict[str, str]: Copie du dictionnaire {série: url}
+        """
+        with self._verrou:
+            chemin, signature = self._fichier_courant()
+            
+            if signature != self._signature:
+                self._urls = {}
+                if chemin is not None:
+                    try:
+                        with open(chemin, 'r', encoding='utf-8') as f:
+                            self._urls = json.load(f)
+                        print(f"📂 URLs chargées depuis : {chemin}")
+                        print(f"🔗 {len(self._urls)} URLs de séries chargées")
+                    except Exception as e:
+                        print(f"⚠️ Erreur lors du chargement de {chemin} : {e}")
+                else:
+                    print("⚠️ Aucune URL de série trouvée")
+                
+                self._signature = signature
+                self.nb_chargements += 1
+            
+            return dict(self._urls)
+    
+    def get(self, serie: str) -> Optional[str]:
+        """Retourne l'URL d'une série (None si inconnue)"""
+        return self.obtenir().get(serie)
+    
+    def enregistrer(self, urls: Dict[str, str], chemin: Path = None):
+        """
+        Écrit les URLs dans le fichier JSON et met à jour le cache
+        
+        L'écriture passe par un fichier temporaire remplacé atomiquement : un
+        lecteur ne voit jamais un JSON à moitié écrit.
+        
+        Args:
+            urls (Dict[str, str]): Dictionnaire {série: url} complet
+            chemin (Path, optional): Fichier cible (premier fichier existant par défaut)
+        """
+        with self._verrou:
+            if chemin is None:
+                chemin, _ = self._fichier_courant()
+                chemin = chemin or self.chemins[0]
+            chemin = Path(chemin)
+            
+            temporaire = chemin.with_name(chemin.name + ".tmp")
+            with open(temporaire, 'w', encoding='utf-8') as f:
+                json.dump(urls, f, indent=2, ensure_ascii=False)
+            os.replace(temporaire, chemin)
+            
+            self._urls = dict(urls)
+            _, self._signature = self._fichier_courant()
+
+_registres = {}
+_verrou_registres = threading.Lock()
+
+def obtenir_registre(chemins: List[Path] = None) -> RegistreUrls:
+    """
+    Retourne le registre partagé pour une liste de fichiers candidats
+    
+    Args:
+        chemins (List[Path], optional): Fichiers candidats (CHEMINS_URLS_DEFAUT par défaut)
+    
+    Returns:
+        RegistreUrls: Instance unique par liste de chemins dans le processus
+    """
+    chemins = tuple(Path(chemin) for chemin in (chemins or CHEMINS_URLS_DEFAUT))
+    with _verrou_registres:
+        registre = _registres.get(chemins)
+        if registre is None:
+            registre = _registres[chemins] = RegistreUrls(list(chemins))
+        return registre